@@ -0,0 +1,94 @@
+import math
+import numpy as np
+from ..models.toy_store import ToyStore
+
+class UKPBounds:
+    """
+    Limites superiores do UKP para uma instância. A ordem por ROI é
+    calculada uma única vez (instance_bounds guarda o objeto no store) e
+    cada limite custa O(1) por orçamento. Com w1, w2, w3 os custos e
+    r1 >= r2 >= r3 os ROIs dos três brinquedos de maior ROI, c o orçamento,
+    k1 = floor(c / w1), c1 = c - k1 * w1, k2 = floor(c1 / w2) e c2 = c1 - k2 * w2:
+
+    - continuous: relaxação linear, c * r1 (o mesmo valor de upper_bound_greedy)
+    - rounded: arredondamento inteiro do brinquedo de maior ROI (U1 de
+      Martello-Toth): k1 unidades dele e a sobra c1 ao ROI r2
+    - martello_toth: no estilo do U3 de Martello-Toth, o maior entre
+      x1 = k1 (k1 * p1 + k2 * p2 + c2 * r3) e x1 <= k1 - 1
+      ((k1 - 1) * p1 + (c1 + w1) * r2)
+    - best: o menor deles (martello_toth <= rounded <= continuous)
+
+    Só brinquedos com lucro positivo entram nos limites.
+    """
+
+    def __init__(self, costs: np.ndarray, profits: np.ndarray):
+        costs = np.asarray(costs, dtype=np.float64)
+        profits = np.asarray(profits, dtype=np.float64)
+        rois = np.divide(profits, costs, out=np.zeros(len(costs)), where=costs > 0)
+        self.order = np.argsort(-rois, kind='stable')     # todos os brinquedos, maior ROI primeiro
+
+        top = [int(i) for i in self.order[:3] if rois[i] > 0]
+        self.weights = [float(costs[i]) for i in top]
+        self.profits = [float(profits[i]) for i in top]
+
+    def continuous(self, budget: float) -> float:
+        """Relaxação linear: todo o orçamento no brinquedo de maior ROI"""
+        if not self.weights or budget <= 0:
+            return 0.0
+        return budget / self.weights[0] * self.profits[0]
+
+    def rounded(self, budget: float) -> float:
+        """U1: unidades inteiras do brinquedo de maior ROI e a sobra ao ROI do segundo"""
+        if not self.weights or budget <= 0:
+            return 0.0
+        units, rest = max_units(budget, self.weights[0])
+        return units * self.profits[0] + rest * self._ratio(1)
+
+    def martello_toth(self, budget: float) -> float:
+        """Limite com os três brinquedos de maior ROI (dicotomia em x1 = k1 ou x1 <= k1 - 1)"""
+        if not self.weights or budget <= 0:
+            return 0.0
+        if len(self.weights) == 1:
+            return max_units(budget, self.weights[0])[0] * self.profits[0]     # um único brinquedo com lucro: ótimo exato
+        return martello_toth_bound(budget, self.weights[0], self.profits[0],
+                                   self.weights[1], self.profits[1], self._ratio(2))
+
+    def best(self, budget: float) -> float:
+        """O menor (mais justo) dos limites"""
+        return min(self.continuous(budget), self.rounded(budget), self.martello_toth(budget))
+
+    def _ratio(self, k: int) -> float:
+        """ROI do k-ésimo brinquedo (0 se não houver)"""
+        return self.profits[k] / self.weights[k] if k < len(self.weights) else 0.0
+
+
+def max_units(budget: float, weight: float) -> tuple:
+    """Unidades inteiras de custo weight que cabem no orçamento e a sobra"""
+    units = math.floor(budget / weight)
+    if units * weight > budget:
+        units -= 1      # corrige arredondamento para cima
+    return units, budget - units * weight
+
+def martello_toth_bound(budget: float, w1: float, p1: float, w2: float, p2: float, r3: float) -> float:
+    """
+    Limite no estilo do U3 de Martello-Toth para brinquedos em ordem de ROI
+    (w1, p1), (w2, p2) e ROI r3 do terceiro (0 se não houver): o maior entre
+    o caso x1 = floor(budget / w1) e o caso com uma unidade a menos do primeiro
+    """
+    units, rest = max_units(budget, w1)
+    second_units, second_rest = max_units(rest, w2)
+    bound = units * p1 + second_units * p2 + second_rest * r3
+    if units:
+        bound = max(bound, (units - 1) * p1 + (rest + w1) * p2 / w2)
+    return bound
+
+def instance_bounds(toys) -> UKPBounds:
+    """Limites da instância, calculados uma vez e guardados no próprio ToyStore"""
+    store = ToyStore.coerce(toys)
+    if store._bounds is None:
+        store._bounds = UKPBounds(store.costs, store.profits)
+    return store._bounds
+
+def upper_bound(toys, budget: float) -> float:
+    """Limite superior mais justo disponível para o orçamento"""
+    return instance_bounds(toys).best(budget)
@@ -0,0 +1,111 @@
+import math
+import numpy as np
+from typing import List
+from ..models.solution import Solution
+from ..models.toy_store import ToyStore
+from .bounds import instance_bounds
+from .reduction import DominanceReduction
+
+class BranchAndBoundSolver:
+    """
+    Solver exato do UKP por branch-and-bound (estilo Martello-Toth).
+
+    Os brinquedos dominados são descartados (DominanceReduction) e os
+    restantes são percorridos na ordem de ROI. Como no
+    DynamicProgrammingSolver, os custos são escalados para inteiros
+    (scale=100 -> centavos, arredondados para cima): o orçamento restante é
+    exato, um ramo que gasta todo o orçamento não é perdido por erro de
+    arredondamento e a solução nunca passa do orçamento real. Cada nível
+    fixa a quantidade de um brinquedo, da maior para a menor, e o ramo é
+    podado quando o limite contínuo dos brinquedos seguintes não supera a
+    melhor solução encontrada. A busca termina assim que a melhor solução
+    atinge o limite superior da instância (bounds), que prova a
+    otimalidade; com o limite de nós, upper_bound dá a distância máxima
+    até o ótimo.
+    """
+
+    EPS = 1e-9
+
+    def __init__(self, max_nodes=None, scale=100, reduce_checks=64):
+        self.max_nodes = max_nodes  # limite de nós explorados (None = sem limite)
+        self.scale = scale
+        self.reduce_checks = reduce_checks  # dominantes testados na dominância múltipla (0 = todos)
+        self.nodes = 0
+        self.optimal = False        # False se a busca parou pelo limite de nós
+        self.budget = None
+        self.toys = None
+        self.reduction = None
+        self.upper_bound = None     # limite superior da instância (bounds.UKPBounds.best)
+
+    def solve(self, toy_ids: List[int], budget: float) -> Solution:
+        """Resolve o UKP de forma exata (toy_ids: lista de ids ou ToyStore)"""
+        self.budget = budget
+        self.toys = ToyStore.coerce(toy_ids)
+
+        self.reduction = DominanceReduction(self.toys, self.reduce_checks)
+        bounds = instance_bounds(self.reduction.store)
+        kept = self.reduction.kept.tolist()
+        order = [kept[i] for i in bounds.order.tolist()]
+        # Para cima: custos fora da escala (ex. 1.004) nunca deixam a solução passar do orçamento
+        weights = np.ceil(self.toys.costs[order] * self.scale - 1e-9).astype(np.int64).tolist()
+        profits = self.toys.profits[order].tolist()
+        if any(weight <= 0 for weight in weights):
+            raise ValueError("Todos os custos devem ser positivos na escala escolhida")
+
+        self.upper_bound = bounds.best(budget)
+        capacity = max(int(math.floor(budget * self.scale + 1e-9)), 0)
+        best_x = self._search(weights, profits, capacity, self.upper_bound)
+
+        quantities = [0] * len(self.toys)
+        for i, qty in zip(order, best_x):
+            quantities[i] = qty
+        return Solution(self.toys, quantities)
+
+    def _search(self, weights: List[int], profits: List[float], budget: int,
+                upper_bound: float = math.inf) -> List[int]:
+        """Busca em profundidade com pilha explícita sobre custos inteiros; retorna as quantidades ótimas"""
+        n = len(weights)
+        self.nodes = 0
+        self.optimal = True
+        if n == 0:
+            return []
+
+        # ROI do próximo brinquedo (0 depois do último) para o limite contínuo
+        next_ratio = [profits[k + 1] / weights[k + 1] for k in range(n - 1)] + [0.0]
+
+        best_profit = 0.0
+        best_x = [0] * n
+        x = [0] * n
+
+        # Cada quadro: [brinquedo, orçamento restante, lucro acumulado, próxima quantidade]
+        stack = [[0, budget, 0.0, budget // weights[0]]]
+        while stack:
+            frame = stack[-1]
+            k, remaining, profit, qty = frame
+
+            # Quantidades menores só diminuem o limite: poda o nível inteiro
+            bound = profit + qty * profits[k] + (remaining - qty * weights[k]) * next_ratio[k]
+            if qty < 0 or bound <= best_profit + self.EPS:
+                stack.pop()
+                continue
+
+            if self.max_nodes is not None and self.nodes >= self.max_nodes:
+                self.optimal = False
+                break
+            self.nodes += 1
+
+            frame[3] = qty - 1
+            x[k] = qty
+            new_remaining = remaining - qty * weights[k]
+            new_profit = profit + qty * profits[k]
+
+            if new_profit > best_profit + self.EPS:
+                best_profit = new_profit
+                best_x = x[:k + 1] + [0] * (n - k - 1)
+                if best_profit >= upper_bound - self.EPS:
+                    break   # atingiu o limite superior: é ótima
+
+            if k + 1 < n:
+                stack.append([k + 1, new_remaining, new_profit, new_remaining // weights[k + 1]])
+
+        return best_x
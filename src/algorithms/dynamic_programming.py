@@ -0,0 +1,146 @@
+import logging
+import math
+import numpy as np
+from typing import List
+from ..models.solution import Solution
+from ..models.toy_store import ToyStore
+from .reduction import DominanceReduction
+from .bounds import UKPBounds
+
+logger = logging.getLogger(__name__)
+
+class DynamicProgrammingSolver:
+    """
+    Solver exato do UKP por programação dinâmica 1-D sobre o orçamento.
+
+    Custos e lucros são escalados para inteiros (scale=100 -> centavos,
+    a precisão dos arquivos de instância; custos com mais casas são
+    arredondados para cima, então a solução sempre cabe no orçamento). A tabela guarda, para cada
+    orçamento c, o maior lucro com custo <= c e o último brinquedo usado,
+    ocupando O(orçamento) de memória.
+
+    Os brinquedos entram na tabela em ordem de ROI e o preenchimento para
+    assim que o lucro de cada orçamento pedido atinge o limite superior
+    inteiro (bounds): os brinquedos restantes não teriam como melhorá-lo.
+    """
+
+    def __init__(self, scale=100, max_capacity=200_000_000, reduce=False, reduce_checks=64):
+        self.scale = scale
+        self.max_capacity = max_capacity    # limite de células da tabela (memória)
+        self.reduce = reduce                # remove os brinquedos dominados antes de montar a tabela
+        self.reduce_checks = reduce_checks  # dominantes testados na dominância múltipla (0 = todos)
+        self.reduction = None
+        self.budget = None
+        self.toys = None
+        self.items_used = 0                 # brinquedos processados antes de a tabela parar
+
+    def solve(self, toy_ids: List[int], budget: float) -> Solution:
+        """Resolve o UKP de forma exata (toy_ids: lista de ids ou ToyStore)"""
+        return self.solve_budgets(toy_ids, [budget])[0]
+
+    def solve_budgets(self, toy_ids: List[int], budgets: List[float]) -> List[Solution]:
+        """
+        Resolve o UKP para vários orçamentos com uma única tabela, montada
+        até o maior deles: dp[c] já é o ótimo para todo orçamento c menor,
+        então cada orçamento custa só a reconstrução
+        """
+        self.budget = max(budgets)
+        self.toys = ToyStore.coerce(toy_ids)
+        self.reduction = None
+        if self.reduce:
+            self.reduction = DominanceReduction(self.toys, self.reduce_checks)
+            logger.info(self.reduction)
+            self.toys = self.reduction.store
+
+        weights, profits = self._scaled_items()
+        capacities = [self._scaled_budget(budget) for budget in budgets]
+
+        # Lucros inteiros: o ótimo de cada orçamento não passa de floor(limite)
+        # (a folga relativa cobre o erro de ponto flutuante do limite)
+        bounds = UKPBounds(weights, profits)
+        targets = [math.floor(bounds.best(capacity) * (1 + 1e-9) + 1e-9) for capacity in capacities]
+
+        dp, last = self._build_table(weights, profits, max(capacities), bounds.order, capacities, targets)
+        solutions = []
+        for capacity in capacities:
+            solution = Solution(self.toys, self._reconstruct(dp, last, weights, profits, capacity))
+            solutions.append(self.reduction.expand(solution) if self.reduction is not None else solution)
+        return solutions
+
+    def _scaled_items(self) -> tuple:
+        """Custos e lucros inteiros (na escala do solver)"""
+        # Custos para cima: fora da escala (ex. 1.004) a solução nunca passa do orçamento;
+        # lucros arredondados, só afetam a escolha entre soluções quase empatadas
+        weights = np.ceil(self.toys.costs * self.scale - 1e-9).astype(np.int64)
+        profits = np.round(self.toys.profits * self.scale).astype(np.int64)
+
+        if np.any(weights <= 0):
+            raise ValueError("Todos os custos devem ser positivos na escala escolhida")
+        return weights, profits
+
+    def _scaled_budget(self, budget: float) -> int:
+        """Orçamento inteiro (arredondado para baixo na escala do solver)"""
+        capacity = int(np.floor(budget * self.scale + 1e-9))
+        if capacity > self.max_capacity:
+            raise ValueError(
+                f"Orçamento escalado ({capacity}) excede o limite da tabela ({self.max_capacity}). "
+                "Use uma escala menor ou o método bnb."
+            )
+        return max(capacity, 0)
+
+    def _build_table(self, weights: np.ndarray, profits: np.ndarray, capacity: int,
+                     order=None, capacities=(), targets=()) -> tuple:
+        """
+        Preenche dp[c] = max(dp[c], dp[c - w] + p) para cada brinquedo, na
+        ordem order. Em ordem crescente de c o bloco [c - w, c) já está
+        final, então a atualização é feita em blocos de tamanho w. Para
+        quando dp[c] >= target para cada par de capacities e targets.
+        """
+        dp = np.zeros(capacity + 1, dtype=np.int64)
+        last = np.full(capacity + 1, -1, dtype=np.int32)
+        order = range(len(weights)) if order is None else order.tolist()
+
+        self.items_used = 0
+        for i in order:
+            if targets and all(dp[c] >= target for c, target in zip(capacities, targets)):
+                logger.info("Tabela encerrada apos %d de %d brinquedos (limite superior atingido)",
+                            self.items_used, len(weights))
+                break
+            self.items_used += 1
+            weight, profit = weights[i], profits[i]
+            if profit <= 0 or weight > capacity:
+                continue    # nunca melhora a solução
+            for start in range(weight, capacity + 1, weight):
+                end = min(start + weight, capacity + 1)
+                candidate = dp[start - weight:end - weight] + profit
+                better = candidate > dp[start:end]
+                dp[start:end][better] = candidate[better]
+                last[start:end][better] = i
+
+        return dp, last
+
+    def _reconstruct(self, dp: np.ndarray, last: np.ndarray,
+                     weights: np.ndarray, profits: np.ndarray, capacity: int) -> List[int]:
+        """Recupera as quantidades a partir da tabela"""
+        quantities = [0] * len(weights)
+        c = capacity
+
+        while dp[c] > 0:
+            # dp é não decrescente: o menor c com o mesmo lucro é gasto exatamente
+            c = int(np.searchsorted(dp, dp[c], side='left'))
+            item = self._item_at(dp, last, weights, profits, c)
+            quantities[item] += 1
+            c -= int(weights[item])
+
+        return quantities
+
+    @staticmethod
+    def _item_at(dp, last, weights, profits, c) -> int:
+        """Brinquedo i tal que dp[c] == dp[c - w_i] + p_i"""
+        hint = int(last[c])
+        if hint >= 0 and weights[hint] <= c and dp[c] == dp[c - weights[hint]] + profits[hint]:
+            return hint
+
+        fits = (weights <= c) & (profits > 0)
+        matches = np.nonzero(fits & (dp[c - np.where(fits, weights, 0)] + profits == dp[c]))[0]
+        return int(matches[0])
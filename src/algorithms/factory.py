@@ -0,0 +1,79 @@
+def create_solver(options: dict):
+    """
+    Cria o solver descrito pelas opções do comando solve
+    (mesmos nomes dos argumentos de linha de comando)
+    """
+    method = options.get('method', 'ga')
+
+    if method == 'dp':
+        from .dynamic_programming import DynamicProgrammingSolver
+        return DynamicProgrammingSolver(scale=options['scale'], reduce=options.get('reduce', False),
+                                        reduce_checks=options.get('reduce_checks', 64))
+
+    if method == 'bnb':
+        from .branch_and_bound import BranchAndBoundSolver
+        return BranchAndBoundSolver(max_nodes=options['max_nodes'], scale=options['scale'],
+                                    reduce_checks=options.get('reduce_checks', 64))
+
+    if options['engine'] == 'numpy':
+        from .numpy_genetic_algorithm import NumpyGeneticAlgorithm as GeneticAlgorithm
+    else:
+        from .genetic_algorithm import GeneticAlgorithm
+
+    ga_params = dict(
+        population_size=options['population'],
+        generations=options['generations'],
+        crossover_rate=options['crossover_rate'],
+        mutation_rate=options['mutation_rate'],
+        selection_type=options['selection_type'],
+        tournament_size=options.get('tournament_size', 3),
+        crossover_type=options['crossover_type'],
+        mutation_type=options['mutation_type'],
+        penality=options['penality'],
+        diversity_mode=options['diversity'],
+        diversity_interval=options['diversity_interval'],
+        diversity_sample=options['diversity_sample'],
+        fitness_cache_size=options['fitness_cache_size'],
+        fitness_cache_mb=options.get('fitness_cache_mb', 256),
+        delta_evaluation=options['delta_evaluation'],
+        plot=options.get('plot', False),
+        history_every=options.get('history_every', 1),
+        history_aggregate=options.get('history_aggregate'),
+        stagnation_window=options.get('stagnation_window', 0),
+        min_improvement=options.get('min_improvement'),
+        target_gap=options.get('target_gap'),
+        time_limit=options.get('time_limit'),
+        min_diversity=options.get('min_diversity'),
+        repair=options.get('repair', False),
+        init_type=options.get('init_type', 'random'),
+        reduce=options.get('reduce', False),
+        reduce_checks=options.get('reduce_checks', 64),
+        instrument=options.get('instrument', options.get('report') is not None),
+        profile=options.get('profile'),
+        checkpoint=options.get('checkpoint'),
+        checkpoint_interval=options.get('checkpoint_interval', 300.0),
+        checkpoint_metadata=options if options.get('checkpoint') else None,
+        warm_start_fraction=options.get('warm_start_fraction', 0.25),
+        replacement=options.get('replacement', 'comma'),
+        elites=options.get('elites', 0),
+        steady_state_size=options.get('steady_state_size', 2),
+        local_search=options.get('local_search', False),
+        local_search_top=options.get('local_search_top', 5),
+        local_search_interval=options.get('local_search_interval', 10),
+        local_search_moves=options.get('local_search_moves', 50)
+    )
+
+    if options['islands'] > 1:
+        from .island_model import IslandModel
+        return IslandModel(
+            num_islands=options['islands'],
+            migration_interval=options['migration_interval'],
+            migration_size=options['migration_size'],
+            topology=options['topology'],
+            workers=options['workers'],
+            engine=GeneticAlgorithm,
+            seed=options['seed'],
+            **ga_params
+        )
+
+    return GeneticAlgorithm(seed=options['seed'], **ga_params)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import numpy as np
+
+class FitnessCache:
+    """
+    Cache LRU de (custo total, lucro total) indexado pelo genoma
+    (bytes do array de quantidades). Quando passa de max_size entradas ou de
+    max_bytes bytes de chaves, descarta as entradas usadas há mais tempo: com
+    catálogos grandes cada chave ocupa 8 bytes por brinquedo, então é o limite
+    de memória que decide quantos genomas cabem.
+    """
+
+    def __init__(self, max_size=100_000, max_bytes=256 * 2**20):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.bytes = 0              # soma do tamanho das chaves armazenadas
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Retorna (custo, lucro) do genoma ou None"""
+        totals = self._entries.get(key)
+        if totals is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return totals
+
+    def put(self, key, totals):
+        """Armazena (custo, lucro) do genoma, removendo os menos recentes se cheio"""
+        if key not in self._entries:
+            self.bytes += len(key)
+        self._entries[key] = totals
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size or self.bytes > self.max_bytes:
+            removed, _ = self._entries.popitem(last=False)
+            self.bytes -= len(removed)
+            self.evictions += 1
+
+    def clear(self):
+        """Esvazia o cache e zera os contadores"""
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def state(self, num_genes: int) -> dict:
+        """Entradas (em ordem de uso) e contadores em arrays (para checkpoint)"""
+        genomes = np.frombuffer(b''.join(self._entries), dtype=np.int64).reshape(-1, num_genes)
+        return {
+            'genomes': genomes,
+            'totals': np.array(list(self._entries.values()), dtype=np.float64).reshape(-1, 2),
+            'counters': [self.hits, self.misses, self.evictions],
+        }
+
+    def restore(self, state: dict):
+        """Restaura o estado salvo por state()"""
+        self.clear()
+        for genome, (cost, profit) in zip(state['genomes'], state['totals'].tolist()):
+            self.put(genome.tobytes(), (cost, profit))
+        self.hits, self.misses, self.evictions = state['counters']
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0.0
+        return (f"FitnessCache(tamanho={len(self)}/{self.max_size}, memoria={self.bytes / 2**20:.1f}/"
+                f"{self.max_bytes / 2**20:.0f} MB, acertos={self.hits}, "
+                f"falhas={self.misses}, remocoes={self.evictions}, taxa de acerto={hit_rate:.1f}%)")
@@ -1,201 +1,772 @@
+import heapq
+import logging
+import math
 import random
+import time
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
 import numpy as np
 from typing import List
 from ..models.solution import Solution
-from ..models.toy import global_toys, get_toy_by_id
-from src.utils.plotter import plot_evolution
+from ..models.toy_store import ToyStore
+from src.utils.diversity import DiversityMetrics
+from src.utils.history import HistoryRecorder, plot_in_background
+from src.utils.instrumentation import Instrumentation
+from src.utils.checkpoint import instance_digest, save_checkpoint
+from .fitness_cache import FitnessCache
+from .termination import TerminationController
+from .reduction import DominanceReduction
+from .local_search import LocalSearch
+from .bounds import instance_bounds
+
+logger = logging.getLogger(__name__)
+
+def roi_order(toys) -> List[int]:
+    """Índices dos brinquedos ordenados por ROI (lucro / custo), maior primeiro (ordenação feita uma vez por instância)"""
+    return instance_bounds(toys).order.tolist()
 
 def upper_bound_greedy(toys, budget):
     """
     Limite superior: assume que pode produzir frações de brinquedos
     (relaxamento contínuo do problema)
     """
-    # Calcula ROI de cada brinquedo
-    toys_with_roi = []
-    for toy in toys:
-        roi = toy.profit() / toy.production_cost if toy.production_cost > 0 else 0
-        toys_with_roi.append((toy, roi))
-    
-    # Ordena por ROI (maior primeiro)
-    toys_with_roi.sort(key=lambda x: x[1], reverse=True)
-    
+    store = ToyStore.coerce(toys)
     remaining_budget = budget
     max_profit = 0
     
-    for toy, roi in toys_with_roi:
+    # Percorre por ROI (maior primeiro; ordem guardada na instância)
+    for i in instance_bounds(store).order:
+        cost = float(store.costs[i])
         if remaining_budget <= 0:
             break
         
         # Quantidade máxima que caberia no orçamento restante
-        max_units = remaining_budget / toy.production_cost
+        max_units = remaining_budget / cost
         
         # Adiciona TODO o lucro possível deste brinquedo
-        max_profit += max_units * toy.profit()
-        remaining_budget -= max_units * toy.production_cost
+        max_profit += max_units * float(store.profits[i])
+        remaining_budget -= max_units * cost
     
     return max_profit
 
 class GeneticAlgorithm:
     """Algoritmo genético para resolver o UKP"""
+
+    INIT_TYPES = ('random', 'greedy', 'randomized_greedy')
+    REPLACEMENTS = ('comma', 'plus', 'steady_state')
+    # Folga relativa ao orçamento usada pelo reparo, para que erros de
+    # arredondamento nas somas não deixem a solução reparada inválida
+    REPAIR_SLACK = 1e-9
     
     def __init__(self, population_size=100, generations=1000, 
                  crossover_rate=0.8, mutation_rate=0.1,
                  selection_type='tournament', crossover_type='single_point', 
-                 mutation_type='uniform', seed=None, penality=10):
+                 mutation_type='uniform', seed=None, penality=10, tournament_size=3,
+                 diversity_mode='full', diversity_interval=1, diversity_sample=None,
+                 fitness_cache_size=0, fitness_cache_mb=256, delta_evaluation=True, plot=False,
+                 history_every=1, history_aggregate=None,
+                 stagnation_window=0, min_improvement=None, target_gap=None,
+                 time_limit=None, min_diversity=None, repair=False, init_type='random',
+                 reduce=False, reduce_checks=64, instrument=False, profile=None,
+                 checkpoint=None, checkpoint_interval=300.0, checkpoint_metadata=None,
+                 warm_start_fraction=0.25, replacement='comma', elites=0, steady_state_size=2,
+                 local_search=False, local_search_top=5, local_search_interval=10, local_search_moves=50):
         
         self.population_size = population_size
         self.generations = generations
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
         self.selection_type = selection_type
+        self.tournament_size = tournament_size
         self.crossover_type = crossover_type
         self.mutation_type = mutation_type
         self.budget = None
         self.toys = None
         self.penality = penality
+        self.seed = seed
+        self.diversity_metrics = DiversityMetrics(diversity_mode, diversity_interval, diversity_sample, seed)
+        # Cache de custo/lucro por genoma (0 = desligado), limitado também em MB de chaves.
+        # Com avaliação incremental os filhos já chegam com custo e lucro: o cache não seria consultado
+        self.fitness_cache = (FitnessCache(fitness_cache_size, int(fitness_cache_mb * 2**20))
+                              if fitness_cache_size > 0 and not delta_evaluation else None)
+        # Filhos herdam custo/lucro do pai e atualizam só os genes alterados
+        self.delta_evaluation = delta_evaluation
+        if init_type not in self.INIT_TYPES:
+            raise ValueError(f"Tipo de inicializacao invalido: {init_type}")
+        # Reparo por ROI dos descendentes e forma de criar a população inicial
+        self.repair = repair
+        self.init_type = init_type
+        # Remove os brinquedos dominados antes de evoluir (genoma menor)
+        self.reduce = reduce
+        self.reduce_checks = reduce_checks      # dominantes testados na dominância múltipla (0 = todos)
+        self.reduction = None
+        if not 0 <= warm_start_fraction <= 1:
+            raise ValueError("A fracao semeada da populacao deve estar entre 0 e 1")
+        # Fração da população inicial derivada das soluções semente (warm start)
+        self.warm_start_fraction = warm_start_fraction
+        if replacement not in self.REPLACEMENTS:
+            raise ValueError(f"Estrategia de substituicao invalida: {replacement}")
+        if not 0 <= elites < population_size:
+            raise ValueError("O numero de elites deve estar entre 0 e population_size - 1")
+        if steady_state_size < 1:
+            raise ValueError("O steady-state deve gerar ao menos 1 descendente por passo")
+        # Substituição da população a cada geração (ver _replacement)
+        self.replacement = replacement
+        self.elites = elites
+        self.steady_state_size = steady_state_size
+        # Busca local (algoritmo memético) nos melhores indivíduos
+        self.local_search = LocalSearch(local_search_top, local_search_interval, local_search_moves) if local_search else None
+        self.plot = plot        # gera os gráficos de evolução (em outro processo) ao final de solve
+        self.costs = None
+        self.profits = None
 
-        # Listas para armazenar histórico
-        self.best_fitness_history = []
-        self.avg_fitness_history = []
-        self.generation_history = []
-        self.validity_rate_history = []
-        self.hamming_distance = []
-        self.total_difference = []
-        self.efficiency = []
+        # Histórico por geração em arrays tipados (amostrado a cada history_every
+        # gerações ou agregado por janela com history_aggregate)
+        self.recorder = HistoryRecorder(history_every, history_aggregate)
+        # Critérios de parada antecipada (todos desligados por padrão)
+        self.termination = TerminationController(stagnation_window, min_improvement, target_gap,
+                                                 time_limit, min_diversity)
+        # Tempos por fase, contadores e perfil opcional (cprofile, tracemalloc)
+        self.instrumentation = Instrumentation(instrument, profile)
+        # Checkpoint periódico (arquivo, segundos entre gravações e opções da
+        # execução guardadas junto, usadas para retomá-la pela linha de comando)
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_metadata = checkpoint_metadata
+        self._instance_digest = None
+        self._last_checkpoint = None
+        self._final = None          # população e fitness finais da última execução
         
         if seed is not None:
             random.seed(seed)
 
 
     
-    def solve(self, toy_ids: List[int], budget: float) -> Solution:
-        """Resolve o UKP usando algoritmo genético"""
-        self.budget = budget
-        self.toys = [get_toy_by_id(toy_id) for toy_id in toy_ids]
+    def solve(self, toy_ids: List[int], budget: float, seeds=None) -> Solution:
+        """
+        Resolve o UKP usando algoritmo genético (toy_ids: lista de ids ou ToyStore).
+        seeds: soluções anteriores sobre a mesma instância (Solution ou
+        quantidades) usadas para semear a população inicial (warm start)
+        """
+        self._start(toy_ids, budget)
         
         # Inicializar população
-        population = self._initialize_population()
+        with self.instrumentation.phase('initialization'):
+            population = self._initial_population(self._seed_quantities(seeds) if seeds else None)
 
         # Evoluir por gerações
-        for generation in range(self.generations):
-            print(f"gen {generation}")
+        population = self._evolve(population, 0, self.generations)
+        return self._finish(population)
+
+    def resume(self, toy_ids: List[int], checkpoint: dict) -> Solution:
+        """
+        Continua a execução salva em checkpoint (load_checkpoint), na mesma
+        instância e com os mesmos parâmetros: o resultado é idêntico ao da
+        execução sem interrupção
+        """
+        self._start(toy_ids, checkpoint['budget'], fingerprint=True)
+        population, fitness_values = self._restore_checkpoint(checkpoint)
+        population = self._evolve(population, checkpoint['generation'], self.generations, fitness_values)
+        return self._finish(population)
+
+    def _start(self, toy_ids, budget: float, fingerprint: bool = False):
+        """Prepara a instância, o cache, o histórico e os critérios de parada"""
+        self.instrumentation.start()
+        self.budget = budget
+        store = ToyStore.coerce(toy_ids)
+        self._instance_digest = None
+        if fingerprint or self.checkpoint is not None:
+            self._instance_digest = instance_digest(store)
+        self.toys = self._reduce(store)
+        self._prepare()
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()   # genomas só valem para esta instância e orçamento
+        self.recorder.reset(self.generations)
+        self._reset_termination()
+        if self.local_search is not None:
+            self.local_search.reset()
+        self._last_checkpoint = time.perf_counter()
+
+    def _finish(self, population) -> Solution:
+        """Fecha o histórico e a instrumentação e retorna a melhor solução"""
+        self.recorder.flush()
+
+        # Retornar melhor solução
+        fitness_values = self._timed_evaluate(population)
+        if self.local_search is not None:
+            with self.instrumentation.phase('local_search'):
+                population, fitness_values = self._final_local_search(population, fitness_values)
+        best_solution = self._select_best(population, fitness_values)
+        self._final = (population, fitness_values)
+
+        if self.fitness_cache is not None and self.fitness_cache.hits + self.fitness_cache.misses:
+            logger.info(self.fitness_cache)
+        if self.local_search is not None:
+            self.local_search.final_profit = best_solution.total_profit()
+            logger.info(self.local_search)
+        if self.termination.enabled:
+            logger.info(self.termination)
+        
+        # Gerar gráfico
+        if self.plot:
+            with self.instrumentation.phase('plot'):
+                self._plot()
+
+        self.instrumentation.stop()
+        if self.instrumentation.enabled:
+            logger.info(self.instrumentation)
+        return self._expand(best_solution)
+
+    def final_population(self, count: int = None) -> List[np.ndarray]:
+        """
+        Os count melhores indivíduos da última execução (todos com None), do
+        melhor para o pior, como quantidades sobre a instância original:
+        podem ser passados como seeds para a execução seguinte
+        """
+        population, fitness_values = self._final
+        count = len(fitness_values) if count is None else min(count, len(fitness_values))
+        rows = self._population_matrix(self._take(population, self._top_indices(fitness_values, count)))
+        if self.reduction is not None:
+            expanded = np.zeros((len(rows), len(self.reduction.original)), dtype=np.int64)
+            expanded[:, self.reduction.kept] = rows
+            rows = expanded
+        return list(rows)
+
+    def history(self) -> dict:
+        """Histórico da última execução (métricas por geração e limite superior)"""
+        history = self.recorder.to_dict()
+        history['max_profit'] = upper_bound_greedy(self.toys, self.budget)
+        return history
+
+    def report(self) -> dict:
+        """Relatório de instrumentação da última execução (tempos por fase, contadores, perfil)"""
+        report = self.instrumentation.report()
+        if self.local_search is not None:
+            report['local_search'] = self.local_search.state()
+        return report
+
+    def _reduce(self, toys: ToyStore) -> ToyStore:
+        """Instância usada na evolução: sem os brinquedos dominados se reduce estiver ligado"""
+        self.reduction = None
+        if not self.reduce:
+            return toys
+        self.reduction = DominanceReduction(toys, self.reduce_checks)
+        logger.info(self.reduction)
+        return self.reduction.store
+
+    def _expand(self, solution: Solution) -> Solution:
+        """Leva a solução da instância reduzida de volta aos brinquedos originais"""
+        return self.reduction.expand(solution) if self.reduction is not None else solution
 
-            # Avaliar população
-            fitness_values = [self._fitness(solution) for solution in population]
+    def _reset_termination(self):
+        """Reinicia os critérios de parada (o gap usa o limite superior mais justo de bounds)"""
+        upper_bound = instance_bounds(self.toys).best(self.budget) if self.termination.needs_bound else None
+        self.termination.reset(upper_bound)
+
+    def _plot(self):
+        """Gera os gráficos de evolução em segundo plano, fora do caminho crítico"""
+        return plot_in_background(self.history())
+
+    def _evolve(self, population, start_generation: int, end_generation: int, fitness_values=None):
+        """
+        Evolui a população da geração start_generation até end_generation
+        (exclusive); fitness_values, se dado, é o fitness já calculado da população
+        """
+        instrumentation = self.instrumentation
+        for generation in range(start_generation, end_generation):
+            # Checkpoint no início da geração, a cada checkpoint_interval segundos
+            if (self.checkpoint is not None and generation > start_generation
+                    and time.perf_counter() - self._last_checkpoint >= self.checkpoint_interval):
+                with instrumentation.phase('checkpoint'):
+                    self._save_checkpoint(population, fitness_values, generation)
+
+            # Avaliar população (depois da primeira geração, o fitness vem da substituição)
+            if fitness_values is None:
+                fitness_values = self._timed_evaluate(population)
+
+            # Busca local (memética) nos melhores a cada local_search.interval gerações
+            if (self.local_search is not None and self.local_search.interval
+                    and generation % self.local_search.interval == 0):
+                with instrumentation.phase('local_search'):
+                    population, fitness_values = self._local_search(population, fitness_values)
             
             # Armazenar métricas
-            best_fitness = max(fitness_values)
-            avg_fitness = sum(fitness_values) / len(fitness_values)
-            valid_solutions = 0
-            for solution in population:
-                if solution.is_valid(self.budget):
-                    valid_solutions += 1
-            validity_rate = (valid_solutions / len(population)) * 100
+            best_fitness, diversity, best_valid = self._record_metrics(population, fitness_values, generation)
+            instrumentation.count('generations')
+            logger.debug("gen %d: melhor fitness %.2f", generation, best_fitness)
 
+            # Parada antecipada (estagnação, gap, tempo, diversidade)
+            if self.termination.update(generation, best_fitness, diversity, best_valid):
+                break
 
-            n_toys = len(population[0].quantities)
-            num_pairs = 0
-            differences = 0
-            total_diff = 0
-            for i in range(len(population)):
-                for j in range(i+1, len(population)):
-                    sol1 = population[i]
-                    sol2 = population[j]
+            # Selecionar pais (no steady-state, só os pais dos poucos descendentes do passo)
+            with instrumentation.phase('selection'):
+                count = self.steady_state_size if self.replacement == 'steady_state' else len(population)
+                parents = self._selection(population, fitness_values, count)
+            
+            # Criar nova população via crossover e mutação (fases medidas em _reproduce)
+            offspring = self._reproduce(parents, generation)
+            
+            # Substituição: sobreviventes e seus fitness (reaproveitados na próxima geração)
+            population, fitness_values = self._replacement(population, fitness_values, offspring)
+
+        return population
+
+    def _checkpoint_params(self) -> dict:
+        """Parâmetros que precisam ser iguais para retomar uma execução"""
+        return {
+            'engine': type(self).__name__,
+            'population_size': self.population_size,
+            'generations': self.generations,
+            'crossover_rate': self.crossover_rate,
+            'mutation_rate': self.mutation_rate,
+            'selection_type': self.selection_type,
+            'tournament_size': self.tournament_size,
+            'crossover_type': self.crossover_type,
+            'mutation_type': self.mutation_type,
+            'penality': self.penality,
+            'seed': self.seed,
+            'diversity': [self.diversity_metrics.mode, self.diversity_metrics.interval,
+                          self.diversity_metrics.sample_size],
+            'fitness_cache_size': self.fitness_cache.max_size if self.fitness_cache is not None else 0,
+            'fitness_cache_mb': self.fitness_cache.max_bytes / 2**20 if self.fitness_cache is not None else 0,
+            'delta_evaluation': self.delta_evaluation,
+            'history': [self.recorder.every, self.recorder.aggregate],
+            'termination': [self.termination.stagnation_window, self.termination.min_improvement,
+                            self.termination.target_gap, self.termination.time_limit,
+                            self.termination.min_diversity],
+            'repair': self.repair,
+            'init_type': self.init_type,
+            'replacement': [self.replacement, self.elites, self.steady_state_size],
+            'reduce': self.reduce,
+            'reduce_checks': self.reduce_checks,
+            'local_search': [self.local_search.top, self.local_search.interval, self.local_search.max_moves]
+                            if self.local_search is not None else None,
+        }
+
+    def _save_checkpoint(self, population, fitness_values, generation: int):
+        """Grava o estado completo no início da geração generation"""
+        save_checkpoint({
+            'generation': generation,
+            'budget': self.budget,
+            'instance': self._instance_digest,
+            'params': self._checkpoint_params(),
+            'metadata': self.checkpoint_metadata,
+            'rng': self._get_rng_state(),
+            'population': self._population_state(population),
+            'fitness': np.asarray(fitness_values, dtype=np.float64),
+            'history': self.recorder.state(),
+            'termination': self.termination.state(),
+            'fitness_cache': self.fitness_cache.state(len(self.toys)) if self.fitness_cache is not None else None,
+            'local_search': self.local_search.state() if self.local_search is not None else None,
+        }, self.checkpoint)
+        self._last_checkpoint = time.perf_counter()
+        self.instrumentation.count('checkpoints')
+        logger.info("Checkpoint salvo em %s (geracao %d)", self.checkpoint, generation)
+
+    def _restore_checkpoint(self, checkpoint: dict):
+        """Confere instância e parâmetros e restaura o estado salvo por _save_checkpoint"""
+        if checkpoint['instance'] is not None and self._instance_digest is not None \
+                and checkpoint['instance'] != self._instance_digest:
+            raise ValueError("O checkpoint foi gerado para outra instancia")
+        params = self._checkpoint_params()
+        different = [key for key, value in checkpoint['params'].items() if params.get(key) != value]
+        if different:
+            raise ValueError(f"Parametros diferentes dos do checkpoint: {', '.join(different)}")
+
+        self._set_rng_state(checkpoint['rng'])
+        self.recorder.restore(checkpoint['history'], self.generations)
+        self.termination.restore(checkpoint['termination'])
+        if self.fitness_cache is not None:
+            self.fitness_cache.restore(checkpoint['fitness_cache'])
+        if self.local_search is not None and checkpoint.get('local_search'):
+            self.local_search.restore(checkpoint['local_search'])
+        logger.info("Execucao retomada na geracao %d", checkpoint['generation'])
+        return self._restore_population(checkpoint['population']), self._restore_fitness(checkpoint['fitness'])
+
+    def _population_state(self, population: List[Solution]) -> dict:
+        """Quantidades e custo/lucro de cada indivíduo (a avaliação incremental
+        acumula arredondamentos, então os totais são guardados como estão)"""
+        totals = [
+            (math.nan if solution._total_cost is None else solution._total_cost,
+             math.nan if solution._total_profit is None else solution._total_profit)
+            for solution in population
+        ]
+        return {'matrix': self._population_matrix(population), 'totals': np.array(totals, dtype=np.float64)}
+
+    def _restore_population(self, state: dict) -> List[Solution]:
+        """Inverso de _population_state"""
+        population = []
+        for row, (cost, profit) in zip(state['matrix'], state['totals'].tolist()):
+            solution = Solution(self.toys, row)
+            if not math.isnan(cost):
+                solution._total_cost = cost
+            if not math.isnan(profit):
+                solution._total_profit = profit
+            population.append(solution)
+        return population
+
+    def _restore_fitness(self, fitness_values: np.ndarray) -> List[float]:
+        """Fitness salvo no checkpoint (reaproveitado na geração retomada)"""
+        return fitness_values.tolist()
+
+    def _seed(self, seed):
+        """Reinicia os geradores aleatórios com a seed dada"""
+        random.seed(seed)
+        self.diversity_metrics.rng = np.random.default_rng(seed)
 
-                    differences += sum(1 for a, b in zip(sol1.quantities, sol2.quantities) if a != b)
-                    num_pairs += 1 
+    def _get_rng_state(self):
+        """Estado dos geradores aleatórios (para continuar a execução em outro processo)"""
+        return random.getstate(), self.diversity_metrics.rng.bit_generator.state
 
-                    total_diff += sum(abs(a - b) for a, b in zip(sol1.quantities, sol2.quantities))
+    def _set_rng_state(self, state):
+        """Restaura o estado salvo por _get_rng_state"""
+        random.setstate(state[0])
+        self.diversity_metrics.rng.bit_generator.state = state[1]
 
+    def _export_population(self, population: List[Solution]) -> List[array]:
+        """Quantidades de cada indivíduo (formato transportável entre processos)"""
+        return [solution.quantities for solution in population]
 
-                    # normalized = differences / n_toys
-                    # total_normalized_distance += normalized
+    def _import_population(self, rows) -> List[Solution]:
+        """Reconstrói a população a partir das quantidades"""
+        return [Solution(self.toys, array('q', quantities)) for quantities in rows]
 
-            total_normalized_distance = differences / (n_toys * num_pairs)
-            total_diff_normalized = total_diff / (n_toys * num_pairs)
+    def _prepare(self):
+        """Pré-calcula estruturas dependentes da instância (chamado no início de solve)"""
+        self.costs = self.toys.costs.tolist()
+        self.profits = self.toys.profits.tolist()
+        self._prepare_roi()
 
+    def _prepare_roi(self):
+        """Ordem por ROI e menor custo a partir de cada posição dessa ordem (reparo e inicialização gulosa)"""
+        self.roi_indices = roi_order(self.toys)
+        ordered_costs = self.toys.costs[self.roi_indices]
+        self.min_cost_from = np.append(np.minimum.accumulate(ordered_costs[::-1])[::-1], np.inf).tolist()
+        self.repair_slack = abs(self.budget) * self.REPAIR_SLACK
+        if self.local_search is not None:
+            self.local_search.prepare(self.toys, self.budget, self.repair_slack, self.roi_indices)
 
-            best_idx = fitness_values.index(best_fitness)
-            best_solution = population[best_idx]
-            best_efficiency = best_solution.total_profit() / best_solution.total_cost()
+    def _timed_evaluate(self, population):
+        """_evaluate com medição de tempo e contagem de avaliações"""
+        with self.instrumentation.phase('evaluation'):
+            fitness_values = self._evaluate(population)
+        self.instrumentation.count('evaluations', len(population))
+        return fitness_values
+
+    def _evaluate(self, population: List[Solution]) -> List[float]:
+        """Calcula o fitness de toda a população"""
+        return [self._fitness(solution) for solution in population]
+
+    def _record_metrics(self, population, fitness_values, generation: int):
+        """
+        Armazena as métricas da geração no histórico e retorna o melhor
+        fitness, a diversidade Hamming (None se não medida nesta geração) e
+        o maior lucro entre os indivíduos válidos
+        """
+        diversity = None
+        if self.diversity_metrics.should_compute(generation):
+            with self.instrumentation.phase('diversity'):
+                diversity = self.diversity_metrics.compute(self._population_matrix(population), generation)
+
+        with self.instrumentation.phase('metrics'):
+            best_fitness = max(fitness_values)
+            avg_fitness = sum(fitness_values) / len(fitness_values)
+            validity_rate = self._validity_rate(population)
+            best_valid = self._best_valid_profit(population)
+
+            best_idx = list(fitness_values).index(best_fitness)
+            best_efficiency = self._efficiency(population, best_idx)
             
-            self.efficiency.append(best_efficiency)    
-            self.best_fitness_history.append(best_fitness)
-            self.avg_fitness_history.append(avg_fitness)
-            self.generation_history.append(generation)
-            self.validity_rate_history.append(validity_rate)
-            self.hamming_distance.append(total_normalized_distance)
-            self.total_difference.append(total_diff_normalized)
-
-            # Selecionar pais
-            parents = self._selection(population, fitness_values)
+            self.recorder.record(generation, best_fitness, avg_fitness, validity_rate, best_efficiency, best_valid,
+                                 self.termination.elapsed())
+        if diversity is not None:
+            total_normalized_distance, total_diff_normalized = diversity
+            self.recorder.record_diversity(generation, total_normalized_distance, total_diff_normalized)
+            return best_fitness, total_normalized_distance, best_valid
+        return best_fitness, None, best_valid
+
+    def _validity_rate(self, population: List[Solution]) -> float:
+        """Percentual de soluções que respeitam o orçamento"""
+        valid_solutions = 0
+        for solution in population:
+            if solution.is_valid(self.budget):
+                valid_solutions += 1
+        return (valid_solutions / len(population)) * 100
+
+    def _best_valid_profit(self, population: List[Solution]) -> float:
+        """Maior lucro entre as soluções que respeitam o orçamento (0 se nenhuma)"""
+        return max((solution.total_profit() for solution in population if solution.is_valid(self.budget)),
+                   default=0.0)
+
+    def _population_matrix(self, population: List[Solution]) -> np.ndarray:
+        """População como matriz inteira (indivíduos x brinquedos)"""
+        return np.vstack([solution.quantities_array() for solution in population])
+
+    def _efficiency(self, population: List[Solution], idx: int) -> float:
+        """ROI (lucro / custo) de um indivíduo"""
+        solution = population[idx]
+        return solution.total_profit() / solution.total_cost()
+
+    def _reproduce(self, parents: List[Solution], generation: int) -> List[Solution]:
+        """Gera os descendentes via crossover e mutação"""
+        phase = self.instrumentation.phase
+        offspring = []
+        for i in range(0, len(parents), 2):
+            parent1 = parents[i]
+            parent2 = parents[i + 1] if i + 1 < len(parents) else parents[0]
             
-            # Criar nova população via crossover e mutação
-            offspring = []
-            for i in range(0, len(parents), 2):
-                parent1 = parents[i]
-                parent2 = parents[i + 1] if i + 1 < len(parents) else parents[0]
-                
-                # Crossover
+            # Crossover
+            with phase('crossover'):
                 if random.random() < self.crossover_rate:
                     child1, child2 = self._crossover(parent1, parent2)
                 else:
                     child1, child2 = parent1, parent2
-                
-                # Mutação
+            
+            # Mutação
+            with phase('mutation'):
                 child1 = self._mutation(child1, generation)
                 child2 = self._mutation(child2, generation)
-                
-                offspring.extend([child1, child2])
+
+            # Reparo: descendentes voltam ao orçamento e completam a sobra
+            if self.repair:
+                with phase('repair'):
+                    child1 = self._repair(child1)
+                    child2 = self._repair(child2)
             
-            # Mantém os melhores (elitismo)
-            fitness_values = [self._fitness(child) for child in offspring]
-            indices_ordenados = sorted(range(len(offspring)), key=lambda i: fitness_values[i], reverse=True)
-            population = [offspring[i] for i in indices_ordenados[:self.population_size]]
+            offspring.extend([child1, child2])
+        return offspring
 
-        # Retornar melhor solução
-        fitness_values = [self._fitness(solution) for solution in population]
-        best_idx = fitness_values.index(max(fitness_values))
-        
-        max_profit = upper_bound_greedy(self.toys,self.budget)
+    def _replacement(self, population, fitness_values, offspring) -> tuple:
+        """
+        Nova população e seus fitness. Só os descendentes são avaliados; o
+        fitness dos pais é o já calculado. Estratégias:
+        - 'comma' (μ,λ): os population_size melhores descendentes, mais as
+          elites (os melhores pais) se elites > 0
+        - 'plus' (μ+λ): os population_size melhores entre pais e descendentes
+        - 'steady_state': os poucos descendentes do passo entram no lugar dos
+          piores entre pais e descendentes (sem reordenar a população)
+        A seleção dos melhores é parcial (heap/partição) e não ordena a
+        população: a ordem só importa na migração e em final_population,
+        que ordenam por conta própria. Quando todos os candidatos ficam
+        (comma com λ = μ), a população passa adiante sem nenhuma seleção.
+        """
+        offspring_fitness = self._timed_evaluate(offspring)
+        with self.instrumentation.phase('replacement'):
+            if self.replacement == 'steady_state':
+                candidates = self._concatenate(population, offspring)
+                fitness = self._concatenate(fitness_values, offspring_fitness)
+                keep = self._without_worst(fitness, len(offspring))
+            elif self.replacement == 'plus':
+                candidates = self._concatenate(population, offspring)
+                fitness = self._concatenate(fitness_values, offspring_fitness)
+                keep = self._best_indices(fitness, self.population_size)
+            elif self.elites:
+                elites = self._best_indices(fitness_values, self.elites)
+                children = self._best_indices(offspring_fitness, self.population_size - self.elites)
+                if elites is not None:
+                    population, fitness_values = self._take(population, elites), self._take(fitness_values, elites)
+                if children is not None:
+                    offspring, offspring_fitness = self._take(offspring, children), self._take(offspring_fitness, children)
+                candidates = self._concatenate(population, offspring)
+                fitness = self._concatenate(fitness_values, offspring_fitness)
+                keep = self._best_indices(fitness, self.population_size)
+            else:
+                candidates, fitness = offspring, offspring_fitness
+                keep = self._best_indices(fitness, self.population_size)
+            if keep is None:
+                return candidates, fitness
+            return self._take(candidates, keep), self._take(fitness, keep)
 
-        # Gerar gráfico
-        plot_path = None
-        plot_path = plot_evolution(
-            self.best_fitness_history,
-            self.avg_fitness_history,
-            self.validity_rate_history,
-            self.generation_history,
-            self.hamming_distance,
-            self.total_difference,
-            max_profit,
-            self.efficiency
-        )
+    def _top_indices(self, fitness_values: List[float], count: int) -> List[int]:
+        """Índices dos count maiores fitness, melhor primeiro (empates na ordem original)"""
+        return heapq.nlargest(count, range(len(fitness_values)), key=fitness_values.__getitem__)
+
+    def _best_indices(self, fitness_values: List[float], count: int) -> List[int]:
+        """Índices dos count maiores fitness, em qualquer ordem; None se todos ficam (nada a selecionar)"""
+        if count >= len(fitness_values):
+            return None
+        return heapq.nlargest(count, range(len(fitness_values)), key=fitness_values.__getitem__)
+
+    def _without_worst(self, fitness_values: List[float], count: int) -> List[int]:
+        """Índices, em ordem, de todos menos os count piores"""
+        worst = set(heapq.nsmallest(count, range(len(fitness_values)), key=fitness_values.__getitem__))
+        return [i for i in range(len(fitness_values)) if i not in worst]
+
+    def _take(self, items: list, indices: List[int]) -> list:
+        return [items[i] for i in indices]
+
+    def _local_search(self, population, fitness_values) -> tuple:
+        """Polimento dos local_search.top melhores; os indivíduos melhorados substituem os originais"""
+        for idx in self._top_indices(fitness_values, min(self.local_search.top, len(fitness_values))):
+            before = fitness_values[idx]
+            fitness_values[idx] = self._polish(population, fitness_values, idx)
+            self.local_search.record(before, fitness_values[idx])
+        return population, fitness_values
+
+    def _final_local_search(self, population, fitness_values) -> tuple:
+        """Busca local ao final da execução, registrando a melhora do melhor indivíduo"""
+        best_before = max(fitness_values)
+        population, fitness_values = self._local_search(population, fitness_values)
+        self.local_search.final_gain = float(max(fitness_values) - best_before)
+        return population, fitness_values
+
+    def _polish(self, population: List[Solution], fitness_values: List[float], idx: int) -> float:
+        """Aplica a busca local ao indivíduo idx (custo e lucro do filho por avaliação incremental)"""
+        solution = population[idx]
+        quantities = solution.quantities[:]
+        changed = self.local_search.improve(quantities, solution.total_cost())
+        population[idx] = self._offspring(solution, quantities, changed)
+        if population[idx] is solution:
+            return fitness_values[idx]
+        return self._fitness(population[idx])
 
+    def _best_solution(self, population: List[Solution], fitness_values) -> Solution:
+        """Retorna o indivíduo de maior fitness"""
+        best_idx = fitness_values.index(max(fitness_values))
         return population[best_idx]
+
+    def _select_best(self, population, fitness_values) -> Solution:
+        """
+        Solução retornada: o indivíduo de maior fitness ou, na parada por
+        gap (disparada por um indivíduo válido), o melhor entre os válidos
+        """
+        if self.termination.reason == 'gap':
+            fitness_values = self._valid_fitness(population, fitness_values)
+        return self._best_solution(population, fitness_values)
+
+    def _valid_fitness(self, population: List[Solution], fitness_values) -> List[float]:
+        """Fitness com -inf nos indivíduos que passam do orçamento"""
+        return [fitness if solution.is_valid(self.budget) else -math.inf
+                for solution, fitness in zip(population, fitness_values)]
     
 
 
-    def _initialize_population(self) -> List[Solution]:
-        """Cria população inicial com soluções aleatórias"""
+    def _seed_quantities(self, seeds) -> List[np.ndarray]:
+        """Quantidades das soluções semente na instância em uso (sem os brinquedos removidos pela redução)"""
+        size = len(self.reduction.original) if self.reduction is not None else len(self.toys)
+        rows = []
+        for seed in seeds:
+            quantities = seed.quantities_array() if isinstance(seed, Solution) else np.asarray(seed, dtype=np.int64)
+            if len(quantities) != size:
+                raise ValueError(f"A solucao semente tem {len(quantities)} brinquedos; a instancia tem {size}")
+            if self.reduction is not None:
+                quantities = quantities[self.reduction.kept]
+            rows.append(np.maximum(quantities, 0))
+        return rows
+
+    def _initial_population(self, seeds: List[np.ndarray] = None):
+        """
+        População inicial. Com soluções semente, warm_start_fraction da
+        população (no mínimo as próprias sementes) vem delas: as sementes
+        reparadas para o orçamento e os custos atuais e, completando a cota,
+        cópias mutadas e reparadas; o restante segue init_type.
+        """
+        if not seeds:
+            return self._initialize_population()
+
+        count = min(self.population_size, max(len(seeds), round(self.warm_start_fraction * self.population_size)))
+        logger.info("Populacao inicial: %d de %d individuos semeados com %d solucoes",
+                    count, self.population_size, len(seeds))
+        seeded = self._seeded_population(seeds[:count], count)
+        if count == self.population_size:
+            return seeded
+        return self._concatenate(seeded, self._initialize_population(self.population_size - count))
+
+    def _seeded_population(self, seeds: List[np.ndarray], count: int) -> List[Solution]:
+        """count indivíduos derivados das sementes (as sementes reparadas e cópias mutadas)"""
+        base = [self._repair(Solution(self.toys, quantities)) for quantities in seeds]
+        population = list(base)
+        while len(population) < count:
+            parent = base[len(population) % len(base)]
+            population.append(self._repair(self._mutation(parent, 0)))
+        return population
+
+    def _concatenate(self, first: list, second: list) -> list:
+        """Junta duas populações (ou seus fitness)"""
+        return first + second
+
+    def _initialize_population(self, size: int = None) -> List[Solution]:
+        """
+        Cria a população inicial (size indivíduos, padrão population_size) conforme init_type:
+        - 'random': quantidades aleatórias na ordem dos brinquedos
+        - 'greedy': o primeiro indivíduo é a solução gulosa por ROI, os demais aleatórios
+        - 'randomized_greedy': o primeiro é o guloso; os demais sorteiam as quantidades
+          na ordem de ROI e completam a sobra do orçamento gulosamente
+        """
+        size = self.population_size if size is None else size
         population = []
-        for _ in range(self.population_size):
-            quantities = []
-            remaining_budget = self.budget
-            
-            for toy in self.toys:
-                max_qty = int(remaining_budget / toy.production_cost)
-                qty = random.randint(0, max_qty)
-                quantities.append(qty)
-                remaining_budget -= qty * toy.production_cost
-            
-            solution = Solution(self.toys, quantities)
+        if self.init_type != 'random':
+            population.append(self._repair(Solution(self.toys)))
+
+        order = self.roi_indices if self.init_type == 'randomized_greedy' else range(len(self.costs))
+        while len(population) < size:
+            solution = Solution(self.toys, self._random_quantities(order))
+            if self.init_type == 'randomized_greedy':
+                solution = self._repair(solution)
             population.append(solution)
         
         return population
+
+    def _random_quantities(self, order) -> array:
+        """Quantidades aleatórias que cabem no orçamento, sorteadas na ordem dada"""
+        quantities = array('q', bytes(8 * len(self.costs)))
+        remaining_budget = self.budget
+        
+        for i in order:
+            cost = self.costs[i]
+            max_qty = int(remaining_budget / cost)
+            qty = random.randint(0, max_qty)
+            quantities[i] = qty
+            remaining_budget -= qty * cost
+        
+        return quantities
+
+    def _repair(self, solution: Solution) -> Solution:
+        """
+        Reparo guiado pelo ROI: remove unidades dos brinquedos de menor ROI
+        até a solução caber no orçamento e depois completa a sobra com os
+        de maior ROI. Com avaliação incremental, só os genes alterados são somados.
+        """
+        remaining = self.budget - self.repair_slack - solution.total_cost()
+        if 0 <= remaining < self.min_cost_from[0]:
+            return solution
+
+        quantities = solution.quantities[:]
+        changed = []
+
+        # Excesso: retira dos brinquedos de menor ROI
+        if remaining < 0:
+            for i in reversed(self.roi_indices):
+                if quantities[i]:
+                    cost = self.costs[i]
+                    removed = min(quantities[i], math.ceil(-remaining / cost))
+                    quantities[i] -= removed
+                    remaining += removed * cost
+                    changed.append(i)
+                    if remaining >= 0:
+                        break
+
+        # Sobra: completa com os brinquedos de maior ROI
+        for position, i in enumerate(self.roi_indices):
+            if remaining < self.min_cost_from[position]:
+                break
+            cost = self.costs[i]
+            added = int(remaining / cost)
+            if added:
+                quantities[i] += added
+                remaining -= added * cost
+                changed.append(i)
+
+        # Um gene cortado e depois completado aparece uma única vez no delta
+        return self._offspring(solution, quantities, list(dict.fromkeys(changed)))
     
     def _fitness(self, solution: Solution) -> float:
         """Calcula fitness com penalização para soluções inválidas"""
+        if self.fitness_cache is not None and solution._total_cost is None:
+            self._load_totals(solution)
+
         if solution.is_valid(self.budget):
             return solution.total_profit()
         else:
@@ -204,48 +775,141 @@ class GeneticAlgorithm:
             penalty = excess * self.penality  # Penalidade arbitrária
             return solution.total_profit() - penalty
     
-    def _selection(self, population: List[Solution], fitness_values: List[float]) -> List[Solution]:
-        """Seleciona pais baseado no tipo de seleção"""
+    def _load_totals(self, solution: Solution):
+        """Preenche custo e lucro da solução a partir do cache (ou calcula e armazena)"""
+        key = solution.quantities.tobytes()
+        totals = self.fitness_cache.get(key)
+        if totals is None:
+            totals = (solution.total_cost(), solution.total_profit())
+            self.fitness_cache.put(key, totals)
+        else:
+            solution._total_cost, solution._total_profit = totals
+
+    def _offspring(self, parent: Solution, quantities: array, changed: List[int]) -> Solution:
+        """
+        Filho que difere do pai apenas nos genes changed. Reutiliza o pai se
+        o genoma não mudou; com avaliação incremental, custo e lucro são os
+        do pai mais a diferença dos genes alterados.
+        """
+        changed = [i for i in changed if quantities[i] != parent.quantities[i]]
+        if not changed:
+            return parent
+
+        child = Solution(self.toys, quantities)
+        if self.delta_evaluation and parent._total_cost is not None and parent._total_profit is not None:
+            cost_delta = 0
+            profit_delta = 0
+            for i in changed:
+                diff = quantities[i] - parent.quantities[i]
+                cost_delta += diff * self.costs[i]
+                profit_delta += diff * self.profits[i]
+            child._total_cost = parent._total_cost + cost_delta
+            child._total_profit = parent._total_profit + profit_delta
+        return child
+
+    def _crossover_child(self, segments: List[tuple]) -> Solution:
+        """
+        Filho formado pelos trechos (pai, início, fim). Reutiliza o primeiro
+        pai se o genoma for igual ao dele; com avaliação incremental, custo e
+        lucro vêm das somas prefixadas dos pais.
+        """
+        quantities = array('q')
+        for parent, start, end in segments:
+            quantities += parent.quantities[start:end]
+
+        main_parent = segments[0][0]
+        if quantities == main_parent.quantities:
+            return main_parent
+
+        child = Solution(self.toys, quantities)
+        if self.delta_evaluation:
+            total_cost = 0
+            total_profit = 0
+            for parent, start, end in segments:
+                prefix_cost = parent.prefix_cost()
+                prefix_profit = parent.prefix_profit()
+                total_cost += prefix_cost[end] - prefix_cost[start]
+                total_profit += prefix_profit[end] - prefix_profit[start]
+            child._total_cost = total_cost
+            child._total_profit = total_profit
+        return child
+
+    def _selection(self, population: List[Solution], fitness_values: List[float], count: int = None) -> List[Solution]:
+        """Seleciona count pais (padrão: tamanho da população) baseado no tipo de seleção"""
+        count = len(population) if count is None else count
         if self.selection_type == 'tournament':
-            return self._tournament_selection(population, fitness_values)
+            return self._tournament_selection(population, fitness_values, count)
         elif self.selection_type == 'roulette':
-            return self._roulette_selection(population, fitness_values)
+            return self._roulette_selection(population, fitness_values, count)
+        elif self.selection_type == 'sus':
+            return self._sus_selection(population, fitness_values, count)
+        elif self.selection_type == 'rank':
+            return self._rank_selection(population, fitness_values, count)
         else:
-            return self._tournament_selection(population, fitness_values)
+            return self._tournament_selection(population, fitness_values, count)
     
-    def _tournament_selection(self, population: List[Solution], fitness_values: List[float]) -> List[Solution]:
-        """Seleção por torneio (tamanho 3)"""
-        selected = []
-        tournament_size = 3
-        
-        for _ in range(len(population)):
-            tournament_idx = random.sample(range(len(population)), tournament_size)
-            best_idx = max(tournament_idx, key=lambda i: fitness_values[i])
-            selected.append(population[best_idx])
+    def _tournament_selection(self, population: List[Solution], fitness_values: List[float], count: int) -> List[Solution]:
+        """Seleção por torneio (tamanho tournament_size, sem reposição dentro do torneio)"""
+        size = len(population)
+        tournament_size = min(self.tournament_size, size)
+        indices = range(size)
+        fitness_of = fitness_values.__getitem__
         
-        return selected
+        return [
+            population[max(random.sample(indices, tournament_size), key=fitness_of)]
+            for _ in range(count)
+        ]
     
-    def _roulette_selection(self, population: List[Solution], fitness_values: List[float]) -> List[Solution]:
-        """Seleção por roleta (fitness proporcional)"""
+    def _roulette_selection(self, population: List[Solution], fitness_values: List[float], count: int) -> List[Solution]:
+        """Seleção por roleta (fitness proporcional): soma acumulada uma vez e busca binária por sorteio"""
         min_fitness = min(fitness_values)
-        adjusted_fitness = [f - min_fitness + 1 for f in fitness_values]
-        total_fitness = sum(adjusted_fitness)
-        
+        cumulative = list(accumulate(f - min_fitness + 1 for f in fitness_values))
+        return self._spin(population, cumulative, count)
+
+    def _rank_selection(self, population: List[Solution], fitness_values: List[float], count: int) -> List[Solution]:
+        """Seleção por ranking linear: o pior tem peso 1 e o melhor, peso P"""
+        order = sorted(range(len(population)), key=fitness_values.__getitem__)
+        # Após ordenar, o peso acumulado até a posição r é (r + 1)(r + 2) / 2
+        cumulative = [(rank + 1) * (rank + 2) / 2 for rank in range(len(order))]
+        return self._spin(population, cumulative, count, order)
+
+    def _spin(self, population: List[Solution], cumulative: List[float], count: int,
+              order: List[int] = None) -> List[Solution]:
+        """Sorteia count indivíduos com probabilidade proporcional aos pesos acumulados"""
+        total = cumulative[-1]
+        last = len(cumulative) - 1
         selected = []
-        for _ in range(len(population)):
-            pick = random.uniform(0, total_fitness)
-            current = 0
-            for i, fitness in enumerate(adjusted_fitness):
-                current += fitness
-                if current >= pick:
-                    selected.append(population[i])
-                    break
-        
+        for _ in range(count):
+            position = min(bisect_left(cumulative, random.uniform(0, total)), last)
+            selected.append(population[position if order is None else order[position]])
+        return selected
+
+    def _sus_selection(self, population: List[Solution], fitness_values: List[float], count: int) -> List[Solution]:
+        """
+        Amostragem universal estocástica: count ponteiros igualmente espaçados
+        sobre a roleta, com um único sorteio (menor variância que a roleta)
+        """
+        min_fitness = min(fitness_values)
+        cumulative = list(accumulate(f - min_fitness + 1 for f in fitness_values))
+        size = len(population)
+        step = cumulative[-1] / count
+        pointer = random.uniform(0, step)
+
+        selected = []
+        i = 0
+        for _ in range(count):
+            while i < size - 1 and cumulative[i] < pointer:
+                i += 1
+            selected.append(population[i])
+            pointer += step
         return selected
     
     def _crossover(self, parent1: Solution, parent2: Solution) -> tuple:
-        """Crossover entre dois pais"""
-        if self.crossover_type == 'single_point':
+        """Crossover entre dois pais (genomas curtos demais para o corte passam inalterados)"""
+        n_toys = len(self.costs)
+        if n_toys < 2:
+            return parent1, parent2
+        if self.crossover_type == 'single_point' or n_toys < 3:
             return self._single_point_crossover(parent1, parent2)
         elif self.crossover_type == 'two_point':
             return self._two_point_crossover(parent1, parent2)
@@ -254,30 +918,22 @@ class GeneticAlgorithm:
     
     def _single_point_crossover(self, parent1: Solution, parent2: Solution) -> tuple:
         """Crossover de um ponto"""
-        crossover_point = random.randint(1, len(parent1.quantities) - 1)
-        
-        child1_qty = parent1.quantities[:crossover_point] + parent2.quantities[crossover_point:]
-        child2_qty = parent2.quantities[:crossover_point] + parent1.quantities[crossover_point:]
+        n_toys = len(parent1.quantities)
+        crossover_point = random.randint(1, n_toys - 1)
         
-        child1 = Solution(self.toys, child1_qty)
-        child2 = Solution(self.toys, child2_qty)
-        child1.invalidate_cache()
-        child2.invalidate_cache()
+        child1 = self._crossover_child([(parent1, 0, crossover_point), (parent2, crossover_point, n_toys)])
+        child2 = self._crossover_child([(parent2, 0, crossover_point), (parent1, crossover_point, n_toys)])
         
         return child1, child2
     
     def _two_point_crossover(self, parent1: Solution, parent2: Solution) -> tuple:
         """Crossover de dois pontos"""
-        point1 = random.randint(1, len(parent1.quantities) - 2)
-        point2 = random.randint(point1 + 1, len(parent1.quantities) - 1)
+        n_toys = len(parent1.quantities)
+        point1 = random.randint(1, n_toys - 2)
+        point2 = random.randint(point1 + 1, n_toys - 1)
         
-        child1_qty = parent1.quantities[:point1] + parent2.quantities[point1:point2] + parent1.quantities[point2:]
-        child2_qty = parent2.quantities[:point1] + parent1.quantities[point1:point2] + parent2.quantities[point2:]
-        
-        child1 = Solution(self.toys, child1_qty)
-        child2 = Solution(self.toys, child2_qty)
-        child1.invalidate_cache()
-        child2.invalidate_cache()
+        child1 = self._crossover_child([(parent1, 0, point1), (parent2, point1, point2), (parent1, point2, n_toys)])
+        child2 = self._crossover_child([(parent2, 0, point1), (parent1, point1, point2), (parent2, point2, n_toys)])
         
         return child1, child2
     
@@ -294,31 +950,31 @@ class GeneticAlgorithm:
     
     def _uniform_mutation(self, solution: Solution) -> Solution:
         """Mutação uniforme: altera quantidade aleatória"""
-        new_quantities = solution.quantities.copy()
+        new_quantities = solution.quantities[:]
+        changed = []
         
         for i in range(len(new_quantities)):
             if random.random() < self.mutation_rate:
-                max_qty = int(self.budget / self.toys[i].production_cost)
+                changed.append(i)
+                max_qty = int(self.budget / self.costs[i])
                 new_quantities[i] = random.randint(0, max_qty)
         
-        child = Solution(self.toys, new_quantities)
-        child.invalidate_cache()
-        return child
+        return self._offspring(solution, new_quantities, changed)
     
     def _gaussian_mutation(self, solution: Solution) -> Solution:
         """Mutação gaussiana: altera quantidade com variação pequena"""
-        new_quantities = solution.quantities.copy()
+        new_quantities = solution.quantities[:]
+        changed = []
         
         for i in range(len(new_quantities)):
             if random.random() < self.mutation_rate:
+                changed.append(i)
                 delta = int(random.gauss(0, 2))
                 new_qty = max(0, new_quantities[i] + delta)
-                max_qty = int(self.budget / self.toys[i].production_cost)
+                max_qty = int(self.budget / self.costs[i])
                 new_quantities[i] = min(new_qty, max_qty)
         
-        child = Solution(self.toys, new_quantities)
-        child.invalidate_cache()
-        return child
+        return self._offspring(solution, new_quantities, changed)
 
 
     # def _adaptative_mutation(self, solution: Solution) -> Solution:
@@ -330,12 +986,14 @@ class GeneticAlgorithm:
         - Início: desvio ALTO (muita exploração)
         - Fim: desvio BAIXO (pouca exploração, muito refinamento)
         """
-        new_quantities = solution.quantities.copy()
+        new_quantities = solution.quantities[:]
+        changed = []
         
         for i in range(len(new_quantities)):
             if random.random() < self.mutation_rate:
+                changed.append(i)
                 current_qty = new_quantities[i]
-                max_qty = int(self.budget / self.toys[i].production_cost)
+                max_qty = int(self.budget / self.costs[i])
             
                 if generation is not None and self.generations > 0:
                     progress = generation / self.generations  # 0 a 1
@@ -398,9 +1056,7 @@ class GeneticAlgorithm:
                 
                 new_quantities[i] = new_qty
         
-        child = Solution(self.toys, new_quantities)
-        child.invalidate_cache()
-        return child
+        return self._offspring(solution, new_quantities, changed)
     
 
 
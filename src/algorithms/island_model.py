@@ -0,0 +1,247 @@
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+import numpy as np
+from ..models.solution import Solution
+from ..models.toy_store import ToyStore
+from ..utils.history import HistoryRecorder
+from ..utils.instrumentation import Instrumentation
+from .genetic_algorithm import GeneticAlgorithm
+from .termination import TerminationController
+
+logger = logging.getLogger(__name__)
+
+# Algoritmo genético do processo trabalhador (criado uma vez por processo)
+_worker_ga = None
+
+def _init_worker(engine, params, toys, budget):
+    """Inicializa o processo trabalhador com a instância e os parâmetros do AG"""
+    global _worker_ga
+    _worker_ga = engine(**params)
+    _worker_ga.recorder = HistoryRecorder()   # histórico completo; a amostragem é feita no processo principal
+    _worker_ga.termination = TerminationController()   # a parada é decidida no processo principal
+    # Só tempos e contadores: o perfil (cprofile/tracemalloc) é feito no processo principal
+    _worker_ga.instrumentation = Instrumentation(_worker_ga.instrumentation.enabled)
+    _worker_ga.checkpoint = None    # checkpoint não é suportado no modelo de ilhas
+    _worker_ga.toys = toys
+    _worker_ga.budget = budget
+    _worker_ga._prepare()
+
+def _run_epoch(state: dict) -> dict:
+    """
+    Evolui uma ilha por uma época (migration_interval gerações).
+    Todo o estado da ilha (população e geradores aleatórios) viaja no
+    dicionário, então o resultado não depende de qual processo o executa.
+    """
+    ga = _worker_ga
+    ga.recorder.reset(state['end'] - state['start'])
+    ga.termination.reset()      # tempos do histórico contados a partir do início da época
+    ga.instrumentation.start()
+    if ga.local_search is not None:
+        ga.local_search.reset()
+
+    if state['rng'] is None:
+        ga._seed(state['seed'])
+        with ga.instrumentation.phase('initialization'):
+            population = ga._initial_population(state['seeds'])
+    else:
+        ga._set_rng_state(state['rng'])
+        population = ga._import_population(state['population'])
+
+    population = ga._evolve(population, state['start'], state['end'])
+    # Melhores primeiro: a migração envia o início da população e substitui o fim
+    population = ga._take(population, ga._top_indices(ga._evaluate(population), len(population)))
+    ga.instrumentation.stop()
+
+    return {
+        'seed': state['seed'],
+        'seeds': None,
+        'rng': ga._get_rng_state(),
+        'population': ga._export_population(population),
+        'history': ga.recorder.to_dict(),
+        'instrumentation': ga.instrumentation.snapshot(),
+        'local_search': ga.local_search.state() if ga.local_search is not None else None,
+    }
+
+
+class IslandModel:
+    """
+    Modelo de ilhas: K subpopulações evoluem em paralelo (um processo por
+    ilha) e, a cada migration_interval gerações, os migration_size melhores
+    indivíduos de cada ilha substituem os piores da ilha vizinha.
+
+    Topologias:
+    - 'ring': a ilha k recebe migrantes da ilha k - 1
+    - 'random': cada ilha recebe de outra ilha sorteada a cada migração
+    Com a mesma seed e o mesmo número de ilhas, a execução é determinística.
+    """
+
+    def __init__(self, num_islands=4, migration_interval=50, migration_size=2,
+                 topology='ring', workers=None, engine=GeneticAlgorithm, seed=None, **ga_params):
+        if topology not in ('ring', 'random'):
+            raise ValueError(f"Topologia invalida: {topology}")
+
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.workers = workers or min(num_islands, os.cpu_count() or 1)
+        self.engine = engine
+        self.seed = seed
+        self.ga_params = ga_params
+
+        # AG do processo principal: avalia as populações finais e guarda o histórico agregado
+        self.ga = engine(seed=seed, **ga_params)
+
+    def solve(self, toy_ids: List[int], budget: float, seeds=None) -> Solution:
+        """
+        Resolve o UKP com as ilhas em paralelo e retorna a melhor solução
+        (seeds: soluções semente, usadas na população inicial de cada ilha)
+        """
+        self.ga.instrumentation.start()
+        toys = self.ga._reduce(ToyStore.coerce(toy_ids))
+        self.ga.toys = toys
+        self.ga.budget = budget
+        self.ga._prepare()
+        seed_rows = self.ga._seed_quantities(seeds) if seeds else None
+        self.ga.recorder.reset(self.ga.generations)
+        self.ga._reset_termination()
+        if self.ga.local_search is not None:
+            self.ga.local_search.reset()
+
+        topology_rng = random.Random(self.seed)
+        states = [
+            {'seed': None if self.seed is None else self.seed + k, 'rng': None, 'population': None,
+             'seeds': seed_rows}
+            for k in range(self.num_islands)
+        ]
+
+        generations = self.ga.generations
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.engine, self.ga_params, toys, budget)) as pool:
+            for start in range(0, generations, self.migration_interval):
+                end = min(start + self.migration_interval, generations)
+                for state in states:
+                    state['start'] = start
+                    state['end'] = end
+
+                epoch_start = self.ga.termination.elapsed()
+                states = list(pool.map(_run_epoch, states))
+                for state in states:
+                    self.ga.instrumentation.merge(state['instrumentation'])
+                    if state['local_search'] is not None:
+                        self.ga.local_search.merge(state['local_search'])
+                if self._merge_history([state['history'] for state in states], epoch_start):
+                    break   # parada antecipada: as ilhas terminam ao fim desta época
+
+                if end < generations:
+                    self._migrate(states, topology_rng)
+        self.ga.recorder.flush()
+
+        # Populações finais de todas as ilhas (polidas pela busca local, se ligada)
+        final_population, final_fitness = None, None
+        for state in states:
+            population = self.ga._import_population(state['population'])
+            fitness_values = self.ga._evaluate(population)
+            if final_population is None:
+                final_population, final_fitness = population, fitness_values
+            else:
+                final_population = self.ga._concatenate(final_population, population)
+                final_fitness = self.ga._concatenate(final_fitness, fitness_values)
+        if self.ga.local_search is not None:
+            with self.ga.instrumentation.phase('local_search'):
+                final_population, final_fitness = self.ga._final_local_search(final_population, final_fitness)
+        self.ga._final = (final_population, final_fitness)
+
+        # Melhor indivíduo entre todas as ilhas
+        best_solution = self.ga._select_best(final_population, final_fitness)
+        if self.ga.local_search is not None:
+            self.ga.local_search.final_profit = best_solution.total_profit()
+            logger.info(self.ga.local_search)
+
+        if self.ga.termination.enabled:
+            logger.info(self.ga.termination)
+        if self.ga.plot:
+            with self.ga.instrumentation.phase('plot'):
+                self.ga._plot()
+
+        self.ga.instrumentation.stop()
+        if self.ga.instrumentation.enabled:
+            logger.info(self.ga.instrumentation)
+
+        return self.ga._expand(best_solution)
+
+    def final_population(self, count: int = None) -> List[np.ndarray]:
+        """Os count melhores indivíduos de todas as ilhas ao final da última execução"""
+        return self.ga.final_population(count)
+
+    def history(self) -> dict:
+        """Histórico agregado das ilhas"""
+        return self.ga.history()
+
+    def report(self) -> dict:
+        """Instrumentação agregada (tempos das fases somados entre as ilhas)"""
+        return self.ga.report()
+
+    def _migrate(self, states: List[dict], topology_rng: random.Random):
+        """Os melhores de cada ilha substituem os piores da ilha destino"""
+        if self.num_islands < 2 or self.migration_size <= 0:
+            return
+
+        # Populações terminam cada época ordenadas (melhores primeiro, em _run_epoch)
+        migrants = [list(state['population'][:self.migration_size]) for state in states]
+
+        for k, state in enumerate(states):
+            if self.topology == 'ring':
+                source = (k - 1) % self.num_islands
+            else:
+                source = topology_rng.choice([i for i in range(self.num_islands) if i != k])
+
+            population = list(state['population'])
+            population[len(population) - len(migrants[source]):] = [list(row) for row in migrants[source]]
+            state['population'] = population
+
+    def _merge_history(self, histories: List[dict], epoch_start: float = 0.0):
+        """
+        Agrega o histórico das ilhas (melhor fitness global e médias das demais
+        métricas) e aplica os critérios de parada. Os tempos das ilhas contam a
+        partir do início da época (epoch_start); vale o da ilha mais lenta.
+        Retorna o critério que disparou.
+        """
+        recorder = self.ga.recorder
+        num_islands = len(histories)
+        diversity = {}
+
+        for i, generation in enumerate(histories[0]['generation_history']):
+            bests = [history['best_fitness_history'][i] for history in histories]
+            best_island = bests.index(max(bests))
+
+            recorder.record(
+                int(generation),
+                bests[best_island],
+                sum(history['avg_fitness_history'][i] for history in histories) / num_islands,
+                sum(history['validity_rate_history'][i] for history in histories) / num_islands,
+                histories[best_island]['efficiency'][i],
+                max(history['best_valid_profit_history'][i] for history in histories),
+                epoch_start + max(history['seconds_history'][i] for history in histories),
+            )
+
+        for i, generation in enumerate(histories[0]['diversity_generation_history']):
+            hamming = sum(history['hamming_distance'][i] for history in histories) / num_islands
+            diversity[int(generation)] = hamming
+            recorder.record_diversity(
+                int(generation),
+                hamming,
+                sum(history['total_difference'][i] for history in histories) / num_islands,
+            )
+
+        reason = None
+        for i, generation in enumerate(histories[0]['generation_history']):
+            best = max(history['best_fitness_history'][i] for history in histories)
+            best_valid = max(history['best_valid_profit_history'][i] for history in histories)
+            reason = self.ga.termination.update(int(generation), best, diversity.get(int(generation)), best_valid)
+            if reason:
+                break
+        return reason
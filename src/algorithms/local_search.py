@@ -0,0 +1,160 @@
+import math
+from bisect import bisect_right
+from typing import List
+import numpy as np
+
+class LocalSearch:
+    """
+    Busca local do algoritmo memético: polimento dos top melhores
+    indivíduos a cada interval gerações (0 = só ao final) e ao final de solve.
+
+    Movimentos, na ordem de ROI de upper_bound_greedy:
+    - drop-one: enquanto exceder o orçamento, retira unidades dos brinquedos de menor ROI
+    - add-one: completa a sobra com unidades dos brinquedos de maior ROI
+    - swap: troca uma unidade de um brinquedo (menor ROI primeiro) por uma do
+      brinquedo de maior lucro que cabe no orçamento liberado, se ele lucrar
+      mais (primeira melhora; até max_moves trocas por busca)
+
+    A sobra do orçamento é atualizada a cada movimento (avaliação
+    incremental). O brinquedo de maior lucro até cada custo vem de um
+    máximo prefixado sobre os brinquedos ordenados por custo, então cada
+    tentativa de troca custa O(log n).
+    """
+
+    def __init__(self, top=5, interval=10, max_moves=50):
+        if top < 1:
+            raise ValueError("A busca local deve polir ao menos 1 individuo")
+        if interval < 0 or max_moves < 0:
+            raise ValueError("Intervalo e trocas da busca local devem ser >= 0")
+
+        self.top = top
+        self.interval = interval
+        self.max_moves = max_moves
+        self.reset()
+
+    def reset(self):
+        """Zera as estatísticas no início de uma execução"""
+        self.searches = 0           # indivíduos polidos
+        self.improved = 0           # indivíduos cujo fitness melhorou
+        self.swaps = 0              # trocas aplicadas
+        self.gain = 0.0             # soma das melhoras de fitness de todas as buscas
+        self.final_gain = 0.0       # melhora do melhor indivíduo na busca final
+        self.final_profit = None    # lucro da solução retornada
+
+    def prepare(self, store, budget: float, slack: float, roi_indices):
+        """Pré-calcula as estruturas da instância (chamado no início de solve)"""
+        self.capacity = budget - slack
+        self.costs = store.costs.tolist()
+        self.profits = store.profits.tolist()
+        self.roi_indices = list(roi_indices)
+        ordered_costs = store.costs[self.roi_indices]
+        self.min_cost_from = np.append(np.minimum.accumulate(ordered_costs[::-1])[::-1], np.inf).tolist()
+
+        rank = np.empty(len(store), dtype=np.int64)
+        rank[self.roi_indices] = np.arange(len(store))
+        self.rank = rank.tolist()
+
+        # Brinquedo de maior lucro entre os de custo até cada posição (ordem de custo)
+        by_cost = np.argsort(store.costs, kind='stable')
+        profits = store.profits[by_cost]
+        running = np.maximum.accumulate(profits)
+        previous = np.concatenate(([-np.inf], running[:-1]))
+        positions = np.maximum.accumulate(np.where(profits > previous, np.arange(len(profits)), 0))
+        self.sorted_costs = store.costs[by_cost].tolist()
+        self.best_upto = by_cost[positions].tolist()
+
+    def improve(self, quantities, cost: float) -> List[int]:
+        """Aplica a busca em quantities (alterado no lugar), de custo total cost; retorna os genes alterados"""
+        costs = self.costs
+        remaining = self.capacity - cost
+        changed = []
+
+        # drop-one: corta o excesso pelos brinquedos de menor ROI
+        if remaining < 0:
+            for i in reversed(self.roi_indices):
+                if quantities[i]:
+                    removed = min(quantities[i], math.ceil(-remaining / costs[i]))
+                    quantities[i] -= removed
+                    remaining += removed * costs[i]
+                    changed.append(i)
+                    if remaining >= 0:
+                        break
+
+        remaining = self._fill(quantities, remaining, changed)
+
+        held = sorted((i for i in range(len(quantities)) if quantities[i]), key=self.rank.__getitem__, reverse=True)
+        for _ in range(self.max_moves):
+            move = self._swap(quantities, remaining, held)
+            if move is None:
+                break
+            j, i = move
+            quantities[j] -= 1
+            quantities[i] += 1
+            remaining += costs[j] - costs[i]
+            changed += (j, i)
+            self.swaps += 1
+            remaining = self._fill(quantities, remaining, changed)
+            held = sorted({g for g in held + changed if quantities[g]}, key=self.rank.__getitem__, reverse=True)
+
+        return list(dict.fromkeys(changed))
+
+    def _fill(self, quantities, remaining: float, changed: List[int]) -> float:
+        """add-one: completa a sobra com os brinquedos de maior ROI; retorna a nova sobra"""
+        for position, i in enumerate(self.roi_indices):
+            if remaining < self.min_cost_from[position]:
+                break
+            added = int(remaining / self.costs[i])
+            if added:
+                quantities[i] += added
+                remaining -= added * self.costs[i]
+                changed.append(i)
+        return remaining
+
+    def _swap(self, quantities, remaining: float, held: List[int]) -> tuple:
+        """Primeira troca (sai j, entra i) que aumenta o lucro, ou None"""
+        for j in held:
+            position = bisect_right(self.sorted_costs, remaining + self.costs[j])
+            if position:
+                i = self.best_upto[position - 1]
+                if self.profits[i] > self.profits[j]:
+                    return j, i
+        return None
+
+    def record(self, before: float, after: float):
+        """Registra o fitness de um indivíduo antes e depois da busca"""
+        self.searches += 1
+        if after > before:
+            self.improved += 1
+            self.gain += after - before
+
+    def state(self) -> dict:
+        """Estatísticas (relatório, checkpoint e soma entre ilhas)"""
+        return {
+            'searches': self.searches,
+            'improved': self.improved,
+            'swaps': self.swaps,
+            'gain': self.gain,
+            'final_gain': self.final_gain,
+            'final_profit': self.final_profit,
+        }
+
+    def restore(self, state: dict):
+        """Restaura as estatísticas salvas por state()"""
+        self.reset()
+        self.merge(state)
+        self.final_gain = state['final_gain']
+        self.final_profit = state['final_profit']
+
+    def merge(self, state: dict):
+        """Soma as estatísticas de outro processo (ilhas)"""
+        self.searches += state['searches']
+        self.improved += state['improved']
+        self.swaps += state['swaps']
+        self.gain += state['gain']
+
+    def __repr__(self):
+        share = ""
+        if self.final_profit:
+            share = f" ({100 * self.final_gain / abs(self.final_profit):.2f}% do lucro final)"
+        return (f"BuscaLocal(buscas={self.searches}, melhoradas={self.improved}, trocas={self.swaps}, "
+                f"ganho total={self.gain:.2f}, ganho final={self.final_gain:.2f}{share})")
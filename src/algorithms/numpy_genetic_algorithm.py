@@ -0,0 +1,357 @@
+import numpy as np
+from ..models.solution import Solution
+from .genetic_algorithm import GeneticAlgorithm
+
+class NumpyGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Algoritmo genético vetorizado: a população é uma matriz inteira
+    (indivíduos x brinquedos) e os operadores são operações de array.
+    Objetos Solution só são criados para o resultado final.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fitness_cache = None   # a população é avaliada como matriz, sem consultar o cache
+
+        # Gerador próprio: mesma seed -> mesma execução
+        self.rng = np.random.default_rng(self.seed)
+        self.costs = None
+        self.profits = None
+        self.max_qty = None
+
+    def _seed(self, seed):
+        """Reinicia os geradores aleatórios com a seed dada"""
+        super()._seed(seed)
+        self.rng = np.random.default_rng(seed)
+
+    def _get_rng_state(self):
+        """Estado dos geradores aleatórios (para continuar a execução em outro processo)"""
+        return super()._get_rng_state(), self.rng.bit_generator.state
+
+    def _set_rng_state(self, state):
+        """Restaura o estado salvo por _get_rng_state"""
+        super()._set_rng_state(state[0])
+        self.rng.bit_generator.state = state[1]
+
+    def _export_population(self, population: np.ndarray) -> np.ndarray:
+        """A matriz já é transportável entre processos"""
+        return population
+
+    def _import_population(self, rows) -> np.ndarray:
+        """Reconstrói a matriz da população"""
+        return np.array(rows, dtype=np.int64)
+
+    def _population_state(self, population: np.ndarray) -> dict:
+        """A matriz basta: o fitness é recalculado a cada geração"""
+        return {'matrix': population}
+
+    def _restore_population(self, state: dict) -> np.ndarray:
+        """Inverso de _population_state"""
+        return np.array(state['matrix'], dtype=np.int64)
+
+    def _restore_fitness(self, fitness_values: np.ndarray) -> np.ndarray:
+        """Fitness salvo no checkpoint (reaproveitado na geração retomada)"""
+        return fitness_values
+
+    def _prepare(self):
+        """Usa diretamente as colunas de custo e lucro do ToyStore"""
+        self.costs = self.toys.costs
+        self.profits = self.toys.profits
+        self.max_qty = np.floor(self.budget / self.costs).astype(np.int64)
+        self._prepare_roi()
+        self.roi_indices = np.asarray(self.roi_indices, dtype=np.int64)
+        self._reverse_roi = self.roi_indices[::-1]
+        self._roi_costs = self.costs[self.roi_indices]
+
+    def _seeded_population(self, seeds, count: int) -> np.ndarray:
+        """count indivíduos derivados das sementes (as sementes reparadas e cópias mutadas)"""
+        population = np.array(seeds, dtype=np.int64)[np.arange(count) % len(seeds)]
+        population[len(seeds):] = self._mutation(population[len(seeds):], 0)
+        return self._repair(population)
+
+    def _concatenate(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Junta duas populações (ou seus fitness)"""
+        return np.concatenate([first, second])
+
+    def _initialize_population(self, size: int = None) -> np.ndarray:
+        """Cria a população inicial conforme init_type (gene a gene, vetorizado entre indivíduos)"""
+        size = self.population_size if size is None else size
+        population = np.zeros((size, len(self.toys)), dtype=np.int64)
+        remaining_budget = np.full(size, float(self.budget))
+        order = self.roi_indices if self.init_type == 'randomized_greedy' else range(len(self.toys))
+
+        for i in order:
+            cost = self.costs[i]
+            max_qty = np.floor(remaining_budget / cost).astype(np.int64)
+            qty = self.rng.integers(0, max_qty + 1)
+            population[:, i] = qty
+            remaining_budget -= qty * cost
+
+        if self.init_type == 'randomized_greedy':
+            population = self._repair(population)
+        if self.init_type != 'random':
+            # Primeiro indivíduo: solução gulosa por ROI
+            population[0] = self._repair(np.zeros((1, len(self.toys)), dtype=np.int64))[0]
+        return population
+
+    def _repair(self, population: np.ndarray) -> np.ndarray:
+        """
+        Reparo guiado pelo ROI para todos os indivíduos: remove unidades dos
+        brinquedos de menor ROI até caber no orçamento e completa a sobra com
+        os de maior ROI (altera a matriz recebida)
+        """
+        remaining = self.budget - self.repair_slack - population @ self.costs
+
+        # Excesso: retira dos brinquedos de menor ROI. O custo acumulado na
+        # ordem inversa de ROI indica até onde cortar: genes anteriores ao
+        # ponto de corte são zerados e o do ponto de corte é reduzido
+        rows = np.flatnonzero(remaining < 0)
+        if len(rows):
+            order = self._reverse_roi
+            costs = self.costs[order]
+            genes = population[np.ix_(rows, order)]
+            spent = np.cumsum(genes * costs, axis=1)
+            excess = -remaining[rows]
+
+            cut = np.minimum((spent < excess[:, None]).sum(axis=1), len(order) - 1)
+            at_cut = np.arange(len(rows)), cut
+            before = spent[at_cut] - genes[at_cut] * costs[cut]
+            removed = np.minimum(genes[at_cut], np.ceil((excess - before) / costs[cut]).astype(np.int64))
+
+            trimmed = np.where(np.arange(len(order)) > cut[:, None], genes, 0)
+            trimmed[at_cut] = genes[at_cut] - removed
+            population[np.ix_(rows, order)] = trimmed
+            remaining[rows] = self.budget - self.repair_slack - population[rows] @ self.costs
+
+        # Sobra: completa com os brinquedos de maior ROI, saltando direto para
+        # o próximo brinquedo que ainda cabe em alguma das sobras
+        position = 0
+        while position < len(self._roi_costs):
+            affordable = np.flatnonzero(self._roi_costs[position:] <= remaining.max())
+            if len(affordable) == 0:
+                break
+            position += affordable[0]
+            i = self.roi_indices[position]
+            added = np.floor(np.maximum(remaining, 0) / self.costs[i]).astype(np.int64)
+            population[:, i] += added
+            remaining -= added * self.costs[i]
+            position += 1
+
+        return population
+
+    def _evaluate(self, population: np.ndarray) -> np.ndarray:
+        """Fitness de toda a população como produto matriz-vetor"""
+        total_cost = population @ self.costs
+        total_profit = population @ self.profits
+        excess = np.maximum(total_cost - self.budget, 0.0)
+        return total_profit - excess * self.penality
+
+    def _validity_rate(self, population: np.ndarray) -> float:
+        """Percentual de soluções que respeitam o orçamento"""
+        valid_solutions = np.count_nonzero(population @ self.costs <= self.budget)
+        return (valid_solutions / len(population)) * 100
+
+    def _best_valid_profit(self, population: np.ndarray) -> float:
+        """Maior lucro entre as soluções que respeitam o orçamento (0 se nenhuma)"""
+        valid = population @ self.costs <= self.budget
+        return float((population[valid] @ self.profits).max()) if valid.any() else 0.0
+
+    def _population_matrix(self, population: np.ndarray) -> np.ndarray:
+        """A população já é a matriz"""
+        return population
+
+    def _efficiency(self, population: np.ndarray, idx: int) -> float:
+        """ROI (lucro / custo) de um indivíduo"""
+        individual = population[idx]
+        return float(individual @ self.profits) / float(individual @ self.costs)
+
+    def _tournament_selection(self, population: np.ndarray, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """Seleção por torneio (tamanho tournament_size), todos os torneios de uma vez (com reposição)"""
+        tournament_idx = self.rng.integers(0, len(population), size=(count, self.tournament_size))
+        winners = np.argmax(fitness_values[tournament_idx], axis=1)
+        return population[tournament_idx[np.arange(count), winners]]
+
+    def _roulette_selection(self, population: np.ndarray, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """Seleção por roleta (fitness proporcional) com busca binária na soma acumulada"""
+        cumulative = np.cumsum(fitness_values - fitness_values.min() + 1)
+        picks = self.rng.uniform(0, cumulative[-1], size=count)
+        return population[self._positions(cumulative, picks)]
+
+    def _rank_selection(self, population: np.ndarray, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """Seleção por ranking linear: o pior tem peso 1 e o melhor, peso P"""
+        order = np.argsort(fitness_values, kind='stable')
+        cumulative = np.cumsum(np.arange(1, len(population) + 1, dtype=np.float64))
+        picks = self.rng.uniform(0, cumulative[-1], size=count)
+        return population[order[self._positions(cumulative, picks)]]
+
+    def _sus_selection(self, population: np.ndarray, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """Amostragem universal estocástica: count ponteiros igualmente espaçados, um único sorteio"""
+        cumulative = np.cumsum(fitness_values - fitness_values.min() + 1)
+        step = cumulative[-1] / count
+        pointers = self.rng.uniform(0, step) + step * np.arange(count)
+        return population[self._positions(cumulative, pointers)]
+
+    def _positions(self, cumulative: np.ndarray, picks: np.ndarray) -> np.ndarray:
+        """Índice do primeiro peso acumulado >= cada sorteio (busca binária)"""
+        return np.minimum(np.searchsorted(cumulative, picks, side='left'), len(cumulative) - 1)
+
+    def _reproduce(self, parents: np.ndarray, generation: int) -> np.ndarray:
+        """Gera os descendentes via crossover e mutação"""
+        parent1 = parents[0::2]
+        parent2 = parents[1::2]
+        if len(parent2) < len(parent1):
+            # Número ímpar de pais: o último é pareado com o primeiro
+            parent2 = np.vstack([parent2, parents[:1]])
+
+        # Crossover
+        with self.instrumentation.phase('crossover'):
+            do_crossover = self.rng.random(len(parent1)) < self.crossover_rate
+            child1, child2 = self._crossover(parent1, parent2)
+            child1 = np.where(do_crossover[:, None], child1, parent1)
+            child2 = np.where(do_crossover[:, None], child2, parent2)
+
+        # Mutação (filhos intercalados como na versão escalar)
+        with self.instrumentation.phase('mutation'):
+            offspring = np.empty((2 * len(parent1), parents.shape[1]), dtype=np.int64)
+            offspring[0::2] = child1
+            offspring[1::2] = child2
+            offspring = self._mutation(offspring, generation)
+
+        if self.repair:
+            with self.instrumentation.phase('repair'):
+                offspring = self._repair(offspring)
+        return offspring
+
+    def _single_point_crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> tuple:
+        """Crossover de um ponto para todos os pares"""
+        n_toys = parent1.shape[1]
+        crossover_point = self.rng.integers(1, n_toys, size=len(parent1))
+
+        first_part = np.arange(n_toys) < crossover_point[:, None]
+        child1 = np.where(first_part, parent1, parent2)
+        child2 = np.where(first_part, parent2, parent1)
+        return child1, child2
+
+    def _two_point_crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> tuple:
+        """Crossover de dois pontos para todos os pares"""
+        n_toys = parent1.shape[1]
+        point1 = self.rng.integers(1, n_toys - 1, size=len(parent1))
+        point2 = self.rng.integers(point1 + 1, n_toys)
+
+        genes = np.arange(n_toys)
+        middle = (genes >= point1[:, None]) & (genes < point2[:, None])
+        child1 = np.where(middle, parent2, parent1)
+        child2 = np.where(middle, parent1, parent2)
+        return child1, child2
+
+    def _mutation_mask(self, population: np.ndarray) -> tuple:
+        """Índices (linha, coluna) dos genes sorteados para mutação"""
+        return np.nonzero(self.rng.random(population.shape) < self.mutation_rate)
+
+    def _uniform_mutation(self, population: np.ndarray) -> np.ndarray:
+        """Mutação uniforme: altera quantidade aleatória"""
+        rows, cols = self._mutation_mask(population)
+        population[rows, cols] = self.rng.integers(0, self.max_qty[cols] + 1)
+        return population
+
+    def _gaussian_mutation(self, population: np.ndarray) -> np.ndarray:
+        """Mutação gaussiana: altera quantidade com variação pequena"""
+        rows, cols = self._mutation_mask(population)
+        delta = np.trunc(self.rng.normal(0, 2, size=len(rows))).astype(np.int64)
+        new_qty = np.maximum(0, population[rows, cols] + delta)
+        population[rows, cols] = np.minimum(new_qty, self.max_qty[cols])
+        return population
+
+    def _adaptive_mutation(self, population: np.ndarray, generation: int = None) -> np.ndarray:
+        """
+        Mutação gaussiana adaptativa (mesma regra da versão escalar):
+        desvio alto no início, baixo no fim
+        """
+        rows, cols = self._mutation_mask(population)
+        current_qty = population[rows, cols]
+        max_qty = self.max_qty[cols]
+
+        if generation is not None and self.generations > 0:
+            progress = generation / self.generations
+            initial_std = 0.3
+            final_std = 0.01
+            decay_rate = 5.0
+            std_dev_percent = final_std + (initial_std - final_std) * np.exp(-decay_rate * progress)
+        else:
+            std_dev_percent = 0.1
+
+        # Genes já produzidos: delta gaussiano proporcional à quantidade atual
+        std_dev_units = np.maximum(1, np.floor(current_qty * std_dev_percent))
+        delta = np.trunc(self.rng.normal(0, std_dev_units)).astype(np.int64)
+        new_qty = current_qty + delta
+
+        # Genes zerados: 30% de chance de começar com quantidade pequena
+        zero = current_qty == 0
+        activate = self.rng.random(len(rows)) < 0.3
+        start_units = np.maximum(1, np.floor(max_qty * 0.05))
+        start_qty = np.abs(np.trunc(self.rng.normal(start_units, start_units // 2))).astype(np.int64)
+        new_qty = np.where(zero, np.where(activate, start_qty, 0), new_qty)
+
+        # Garantir limites
+        new_qty = np.clip(new_qty, 0, max_qty)
+
+        # Ocasionalmente (5% chance), reiniciar completamente
+        restart = self.rng.random(len(rows)) < 0.05
+        new_qty = np.where(restart, self.rng.integers(0, max_qty + 1), new_qty)
+
+        population[rows, cols] = new_qty
+        return population
+
+    def _top_indices(self, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """
+        Índices dos count maiores fitness, melhor primeiro (empates na ordem
+        original): partição pelo limiar e ordenação só dos escolhidos
+        """
+        size = len(fitness_values)
+        if count >= size:
+            return np.argsort(-fitness_values, kind='stable')
+        threshold = np.partition(fitness_values, size - count)[size - count]
+        above = np.flatnonzero(fitness_values > threshold)
+        ties = np.flatnonzero(fitness_values == threshold)[:count - len(above)]
+        chosen = np.sort(np.concatenate([above, ties]))
+        return chosen[np.argsort(-fitness_values[chosen], kind='stable')]
+
+    def _best_indices(self, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """
+        Índices dos count maiores fitness na ordem da população (empates na
+        ordem original), por partição em O(P); None se todos ficam
+        """
+        size = len(fitness_values)
+        if count >= size:
+            return None
+        threshold = np.partition(fitness_values, size - count)[size - count]
+        keep = fitness_values > threshold
+        ties = np.flatnonzero(fitness_values == threshold)[:count - np.count_nonzero(keep)]
+        keep[ties] = True
+        return np.flatnonzero(keep)
+
+    def _without_worst(self, fitness_values: np.ndarray, count: int) -> np.ndarray:
+        """Índices, em ordem, de todos menos os count piores"""
+        keep = np.ones(len(fitness_values), dtype=bool)
+        keep[np.argpartition(fitness_values, count - 1)[:count]] = False
+        return np.flatnonzero(keep)
+
+    def _take(self, items: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        return items[indices]
+
+    def _polish(self, population: np.ndarray, fitness_values: np.ndarray, idx: int) -> float:
+        """Aplica a busca local à linha idx da matriz"""
+        row = population[idx].tolist()
+        if not self.local_search.improve(row, float(population[idx] @ self.costs)):
+            return fitness_values[idx]
+        population[idx] = row
+        return self._evaluate(population[idx:idx + 1])[0]
+
+    def _valid_fitness(self, population: np.ndarray, fitness_values: np.ndarray) -> np.ndarray:
+        """Fitness com -inf nos indivíduos que passam do orçamento"""
+        return np.where(population @ self.costs <= self.budget, fitness_values, -np.inf)
+
+    def _best_solution(self, population: np.ndarray, fitness_values: np.ndarray) -> Solution:
+        """Converte o melhor indivíduo em Solution"""
+        best_idx = int(np.argmax(fitness_values))
+        return Solution(self.toys, population[best_idx])
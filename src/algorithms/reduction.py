@@ -0,0 +1,92 @@
+import numpy as np
+from ..models.solution import Solution
+from ..models.toy_store import ToyStore
+
+class DominanceReduction:
+    """
+    Pré-redução da instância por dominância. Remove:
+    - brinquedos sem lucro (nunca entram em uma solução ótima)
+    - dominados simples: outro brinquedo custa no máximo o mesmo e lucra ao menos o mesmo
+    - dominados múltiplos: floor(w_j / w_i) unidades de i custam no máximo w_j
+      e lucram ao menos p_j
+
+    A dominância simples é uma varredura por custo crescente (O(n log n)).
+    A múltipla é heurística: compara cada brinquedo só com os multiple_checks
+    brinquedos de maior ROI (só quem tem ROI maior pode dominar), em
+    O(n · multiple_checks), e pode manter alguns dominados; com
+    multiple_checks=None (ou 0) compara com todos (exata, O(n²)).
+
+    Sempre existe uma solução ótima só com os brinquedos mantidos; expand()
+    leva uma solução da instância reduzida de volta aos ids originais.
+    """
+
+    def __init__(self, store: ToyStore, multiple_checks=64):
+        self.original = store
+        self.multiple_checks = multiple_checks or None
+        self.unprofitable = 0           # removidos por lucro <= 0
+        self.simple = 0                 # removidos por dominância simples
+        self.multiple = 0               # removidos por dominância múltipla
+        self.kept = self._reduce()      # índices (no store original) mantidos, na ordem original
+        self.store = store.take(self.kept)
+
+    def expand(self, solution: Solution) -> Solution:
+        """Solução equivalente sobre a instância original"""
+        quantities = [0] * len(self.original)
+        for i, qty in zip(self.kept.tolist(), solution.quantities):
+            quantities[i] = int(qty)
+        return Solution(self.original, quantities)
+
+    @property
+    def removed(self) -> int:
+        return len(self.original) - len(self.kept)
+
+    def _reduce(self) -> np.ndarray:
+        costs = self.original.costs
+        profits = self.original.profits
+
+        candidates = np.flatnonzero(profits > 0)
+        self.unprofitable = len(self.original) - len(candidates)
+
+        # Custo crescente (lucro decrescente no empate): dominado se algum
+        # brinquedo anterior já lucra pelo menos o mesmo
+        by_cost = candidates[np.lexsort((candidates, -profits[candidates], costs[candidates]))]
+        best_before = np.concatenate(([-np.inf], np.maximum.accumulate(profits[by_cost])[:-1]))
+        undominated = by_cost[profits[by_cost] > best_before]
+        self.simple = len(candidates) - len(undominated)
+
+        # Após a dominância simples, custo e lucro são estritamente crescentes
+        undominated = undominated[~self._multiply_dominated(undominated)]
+        self.multiple = len(candidates) - self.simple - len(undominated)
+
+        return np.sort(undominated)
+
+    def _multiply_dominated(self, items: np.ndarray) -> np.ndarray:
+        """Máscara dos itens dominados por múltiplos de um dos itens de maior ROI"""
+        costs = self.original.costs
+        profits = self.original.profits
+        dominated = np.zeros(len(items), dtype=bool)
+        if len(items) < 2:
+            return dominated
+
+        rois = profits[items] / costs[items]
+        dominators = items[np.argsort(-rois, kind='stable')[:self.multiple_checks]]
+        dominator_costs = costs[dominators]
+        dominator_profits = profits[dominators]
+
+        # Blocos limitam a matriz itens x dominantes em memória
+        block = max(1, 1_000_000 // len(dominators))
+        for start in range(0, len(items), block):
+            item_costs = costs[items[start:start + block], None]
+            item_profits = profits[items[start:start + block], None]
+
+            units = np.floor(item_costs / dominator_costs)
+            units -= units * dominator_costs > item_costs      # corrige arredondamento para cima
+            dominated[start:start + block] = np.any(
+                (dominator_costs < item_costs) & (units * dominator_profits >= item_profits), axis=1
+            )
+        return dominated
+
+    def __repr__(self):
+        return (f"Reducao(brinquedos={len(self.original)} -> {len(self.kept)}, "
+                f"sem lucro={self.unprofitable}, dominados={self.simple}, "
+                f"multiplamente dominados={self.multiple})")
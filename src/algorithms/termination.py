@@ -0,0 +1,116 @@
+import time
+from collections import deque
+
+class TerminationController:
+    """
+    Critérios de parada antecipada do algoritmo genético. A cada geração
+    recebe o melhor fitness (e a diversidade, quando medida) e indica qual
+    critério disparou:
+
+    - 'stagnation': o melhor fitness não melhorou nas últimas stagnation_window gerações
+    - 'improvement': a melhora relativa nas últimas stagnation_window gerações
+      ficou abaixo de min_improvement
+    - 'gap': a distância relativa entre o maior lucro válido e o limite
+      superior ficou abaixo de target_gap
+    - 'time': o tempo de execução passou de time_limit segundos
+    - 'diversity': a diversidade Hamming caiu abaixo de min_diversity
+
+    Critérios com valor None (ou janela 0) ficam desligados.
+    """
+
+    CRITERIA = ('stagnation', 'improvement', 'gap', 'time', 'diversity')
+
+    def __init__(self, stagnation_window=0, min_improvement=None, target_gap=None,
+                 time_limit=None, min_diversity=None):
+        if stagnation_window < 0:
+            raise ValueError("A janela de estagnacao deve ser >= 0")
+        if min_improvement is not None and not stagnation_window:
+            raise ValueError("min_improvement exige uma janela de estagnacao")
+
+        self.stagnation_window = stagnation_window
+        self.min_improvement = min_improvement
+        self.target_gap = target_gap
+        self.time_limit = time_limit
+        self.min_diversity = min_diversity
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se algum critério está ligado"""
+        return bool(self.stagnation_window) or any(
+            value is not None for value in (self.target_gap, self.time_limit, self.min_diversity)
+        )
+
+    @property
+    def needs_bound(self) -> bool:
+        """O critério de gap precisa do limite superior da instância"""
+        return self.target_gap is not None
+
+    def reset(self, upper_bound: float = None):
+        """Reinicia o controlador no início de uma execução"""
+        self.upper_bound = upper_bound
+        self.reason = None          # critério que disparou (None = rodou todas as gerações)
+        self.generation = None      # geração em que a parada ocorreu
+        self._best = deque(maxlen=self.stagnation_window + 1)
+        self._best_valid = None     # maior lucro entre as soluções válidas (critério de gap)
+        self._start = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Tempo desde o início da execução (continua contando após a retomada)"""
+        return time.perf_counter() - self._start
+
+    def state(self) -> dict:
+        """Janela de melhores valores e tempo decorrido (para checkpoint)"""
+        return {'best': list(self._best), 'best_valid': self._best_valid,
+                'elapsed': self.elapsed()}
+
+    def restore(self, state: dict):
+        """Restaura o estado salvo por state(); o tempo decorrido continua contando"""
+        self._best.extend(state['best'])
+        self._best_valid = state['best_valid']
+        self._start = time.perf_counter() - state['elapsed']
+
+    def update(self, generation: int, best_fitness: float, diversity: float = None,
+               best_valid_profit: float = None) -> str:
+        """
+        Registra a geração e retorna o critério que disparou (ou None).
+        best_valid_profit é o maior lucro entre os indivíduos válidos da geração
+        """
+        best_so_far = max(best_fitness, self._best[-1]) if self._best else best_fitness
+        self._best.append(best_so_far)
+        if best_valid_profit is not None:
+            self._best_valid = best_valid_profit if self._best_valid is None else max(self._best_valid, best_valid_profit)
+
+        reason = self._check(best_so_far, diversity)
+        if reason is not None:
+            self.reason = reason
+            self.generation = generation
+        return reason
+
+    def _check(self, best_so_far: float, diversity: float) -> str:
+        if self.stagnation_window and len(self._best) == self._best.maxlen:
+            gain = best_so_far - self._best[0]
+            if gain <= 0:
+                return 'stagnation'
+            if self.min_improvement is not None and gain / max(abs(self._best[0]), 1e-12) < self.min_improvement:
+                return 'improvement'
+
+        # Só soluções válidas contam: o fitness penalizado de uma inválida
+        # pode ficar perto do limite (ou passar dele) com penalidade baixa
+        if self.target_gap is not None and self.upper_bound and self._best_valid is not None:
+            gap = (self.upper_bound - self._best_valid) / abs(self.upper_bound)
+            if gap <= self.target_gap:
+                return 'gap'
+
+        if self.time_limit is not None and self.elapsed() >= self.time_limit:
+            return 'time'
+
+        if self.min_diversity is not None and diversity is not None and diversity < self.min_diversity:
+            return 'diversity'
+
+        return None
+
+    def __repr__(self):
+        if self.reason is None:
+            return "Parada: todas as geracoes executadas"
+        return f"Parada antecipada na geracao {self.generation}: criterio {self.reason}"
@@ -1,11 +1,14 @@
 from src.utils.data_generator import DataGenerator as Dg
 import argparse
+import logging
 import os
+import sys
 
 
 def create_parser():
     """Cria o parser de argumentos de linha de comando"""
     parser = argparse.ArgumentParser(description="Unbounded Knapsack Problem com Algoritmo Genético")
+    parser.add_argument('--log_level', type=str, default='info', choices=['debug', 'info', 'warning'], help='Verbosidade (debug mostra cada geração)')
     subparsers = parser.add_subparsers(dest='command', help='Comandos Disponíveis')
 
     # Comando para gerar instâncias
@@ -15,66 +18,284 @@ def create_parser():
     generate_parser.add_argument('--max_cost', type=float, default=100.0, help='Custo máximo')
     generate_parser.add_argument('--min_margin', type=float, default=0.1, help='Margem de lucro mínima')
     generate_parser.add_argument('--max_margin', type=float, default=2.0, help='Margem de lucro máxima')
+    generate_parser.add_argument('--family', type=str, default='margin', choices=list(Dg.FAMILIES), help='Família de dificuldade (correlação entre custo e lucro)')
     generate_parser.add_argument('--seed', type=int, default=None, help='Seed para reprodutibilidade')
-    generate_parser.add_argument('--output', type=str, default='data/instances/instance.csv', help='Arquivo de saída')
+    generate_parser.add_argument('--chunk_size', type=int, default=65536, help='Linhas formatadas e escritas por vez no CSV')
+    generate_parser.add_argument('--output', type=str, default='data/instances/instance.csv', help='Arquivo de saída (.ukpb gera o formato binário)')
+
+    # Comando para converter instâncias
+    convert_parser = subparsers.add_parser('convert', help='Converter instância CSV para o formato binário')
+    convert_parser.add_argument('--input', type=str, required=True, help='Arquivo CSV da instância')
+    convert_parser.add_argument('--output', type=str, required=True, help='Arquivo binário de saída (.ukpb)')
 
     # Comando para resolver
     solve_parser = subparsers.add_parser('solve', help='Resolver instância do problema')
-    solve_parser.add_argument('--instance', type=str, required=True, help='Arquivo da instância')
-    solve_parser.add_argument('--budget', type=float, required=True, help='Orçamento disponível')
-    solve_parser.add_argument('--population', type=int, default=100, help='Tamanho da população')
-    solve_parser.add_argument('--generations', type=int, default=1000, help='Número de gerações')
-    solve_parser.add_argument('--crossover_rate', type=float, default=0.8, help='Taxa de crossover')
-    solve_parser.add_argument('--mutation_rate', type=float, default=0.1, help='Taxa de mutação')
-    solve_parser.add_argument('--selection_type', type=str, default='tournament', help='Tipo de seleção (tournament, roulette)')
-    solve_parser.add_argument('--crossover_type', type=str, default='single_point', help='Tipo de crossover (single_point, two_point)')
-    solve_parser.add_argument('--mutation_type', type=str, default='uniform', help='Tipo de mutação (uniform, gaussian)')
-    solve_parser.add_argument('--seed', type=int, default=None, help='Seed para reprodutibilidade')
-    solve_parser.add_argument('--penality', type=int, default=10, help='Penalidade para soluções inválidas')
+    add_solve_arguments(solve_parser)
+
+    # Comando para resolver a mesma instância em vários orçamentos (curva lucro x orçamento)
+    sweep_parser = subparsers.add_parser('sweep', help='Resolver uma instância para uma lista ou faixa de orçamentos')
+    add_solve_arguments(sweep_parser)
+    sweep_parser.add_argument('--budgets', type=float, nargs='+', default=None, help='Orçamentos a resolver')
+    sweep_parser.add_argument('--budget_range', type=float, nargs=3, default=None, metavar=('INICIO', 'FIM', 'PASSO'), help='Faixa de orçamentos (fim inclusive)')
+    sweep_parser.add_argument('--output', type=str, default='data/results/sweep.csv', help='Arquivo CSV com a curva lucro x orçamento')
+
+    # Comando para resolver várias instâncias/orçamentos em um processo
+    batch_parser = subparsers.add_parser('solve-batch', help='Resolver um lote de instâncias e orçamentos')
+    batch_parser.add_argument('--manifest', type=str, required=True, help='CSV com uma linha por tarefa (instance, budget e parâmetros do solve)')
+    batch_parser.add_argument('--output', type=str, default='data/results/batch_results.csv', help='Arquivo CSV de resultados')
+    batch_parser.add_argument('--workers', type=int, default=None, help='Processos trabalhadores (padrão: núcleos)')
+
+    # Comando para medir vazão e qualidade do AG em instâncias geradas com seed
+    benchmark_parser = subparsers.add_parser('benchmark', help='Medir desempenho do AG em uma matriz fixa de instâncias')
+    benchmark_parser.add_argument('--sizes', type=int, nargs='+', default=None, help='Números de brinquedos das instâncias (padrão: 10 100 1000 10000 100000)')
+    benchmark_parser.add_argument('--budgets', type=float, nargs='+', default=None, help='Orçamentos de cada instância (padrão: 1000 10000)')
+    benchmark_parser.add_argument('--population', type=int, default=50, help='Tamanho da população')
+    benchmark_parser.add_argument('--generations', type=int, default=50, help='Número de gerações')
+    benchmark_parser.add_argument('--engine', type=str, default='python', choices=['python', 'numpy'], help='Motor do algoritmo genético')
+    benchmark_parser.add_argument('--seed', type=int, default=42, help='Seed das instâncias e do AG')
+    benchmark_parser.add_argument('--repair', action=argparse.BooleanOptionalAction, default=True, help='Reparo por ROI nos descendentes (--no-repair desliga; sem reparo a solução tende a ser inválida e o caso fica sem gap)')
+    benchmark_parser.add_argument('--target', type=float, default=0.95, help='Alvo do tempo até o alvo, como fração do limite superior')
+    benchmark_parser.add_argument('--output', type=str, default='data/results/benchmark.json', help='Arquivo JSON de resultados')
+    benchmark_parser.add_argument('--compare', type=str, default=None, help='Benchmark de referência; aponta regressões e termina com código 1')
+    benchmark_parser.add_argument('--tolerance', type=float, default=0.10, help='Piora relativa tolerada em vazão, memória e tempo até o alvo')
+    benchmark_parser.add_argument('--gap_tolerance', type=float, default=0.01, help='Aumento absoluto tolerado no gap')
+
+    # Comando para gerar gráficos a partir de um histórico salvo
+    plot_parser = subparsers.add_parser('plot', help='Gerar gráficos a partir de um histórico salvo')
+    plot_parser.add_argument('--history', type=str, required=True, help='Arquivo de histórico salvo pelo solve --history')
+    plot_parser.add_argument('--output_dir', type=str, default='data/results', help='Diretório dos gráficos')
 
     return parser
 
 
+def add_solve_arguments(parser):
+    """Argumentos do comando solve (também usados nas linhas do solve-batch)"""
+    parser.add_argument('--instance', type=str, default=None, help='Arquivo da instância (CSV ou binário; obrigatório sem --resume)')
+    parser.add_argument('--budget', type=float, default=None, help='Orçamento disponível (obrigatório sem --resume)')
+    parser.add_argument('--method', type=str, default='ga', choices=['ga', 'dp', 'bnb'], help='Método de solução (ga, dp, bnb)')
+    parser.add_argument('--scale', type=int, default=100, help='Escala inteira dos custos nos métodos dp e bnb (100 = centavos)')
+    parser.add_argument('--max_nodes', type=int, default=None, help='Limite de nós explorados no método bnb')
+    parser.add_argument('--reduce', action='store_true', help='Remove os brinquedos dominados antes de resolver (ga, dp; o bnb sempre remove)')
+    parser.add_argument('--reduce_checks', type=int, default=64, help='Brinquedos de maior ROI testados como dominantes na dominância múltipla (0 = todos, exata e O(n²))')
+    parser.add_argument('--population', type=int, default=100, help='Tamanho da população')
+    parser.add_argument('--generations', type=int, default=1000, help='Número de gerações')
+    parser.add_argument('--crossover_rate', type=float, default=0.8, help='Taxa de crossover')
+    parser.add_argument('--mutation_rate', type=float, default=0.1, help='Taxa de mutação')
+    parser.add_argument('--selection_type', type=str, default='tournament', help='Tipo de seleção (tournament, roulette, sus, rank)')
+    parser.add_argument('--tournament_size', type=int, default=3, help='Número de competidores por torneio')
+    parser.add_argument('--crossover_type', type=str, default='single_point', help='Tipo de crossover (single_point, two_point)')
+    parser.add_argument('--mutation_type', type=str, default='uniform', help='Tipo de mutação (uniform, gaussian)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed para reprodutibilidade')
+    parser.add_argument('--penality', type=int, default=10, help='Penalidade para soluções inválidas')
+    parser.add_argument('--diversity', type=str, default='full', choices=['full', 'sampled', 'off'], help='Cálculo da diversidade (full, sampled, off)')
+    parser.add_argument('--diversity_interval', type=int, default=1, help='Calcula a diversidade a cada N gerações')
+    parser.add_argument('--diversity_sample', type=int, default=None, help='Tamanho da amostra no modo sampled')
+    parser.add_argument('--fitness_cache_size', type=int, default=100000, help='Tamanho máximo do cache de fitness por genoma, motor python com --no-delta_evaluation (0 = desligado)')
+    parser.add_argument('--fitness_cache_mb', type=float, default=256, help='Memória máxima das chaves do cache de fitness em MB (cada genoma ocupa 8 bytes por brinquedo)')
+    parser.add_argument('--delta_evaluation', action=argparse.BooleanOptionalAction, default=True, help='Avaliação incremental dos filhos, motor python (--no-delta_evaluation desliga)')
+    parser.add_argument('--replacement', type=str, default='comma', choices=['comma', 'plus', 'steady_state'], help='Substituição da população: comma (μ,λ), plus (μ+λ) ou steady_state')
+    parser.add_argument('--elites', type=int, default=0, help='Melhores pais mantidos a cada geração na substituição comma')
+    parser.add_argument('--steady_state_size', type=int, default=2, help='Descendentes gerados por passo no steady_state')
+    parser.add_argument('--repair', action='store_true', help='Repara os descendentes por ROI: corta o excesso e completa a sobra do orçamento')
+    parser.add_argument('--local_search', action='store_true', help='Busca local (memética) nos melhores indivíduos: add-one, drop-one e swap na ordem de ROI')
+    parser.add_argument('--local_search_top', type=int, default=5, help='Indivíduos polidos pela busca local')
+    parser.add_argument('--local_search_interval', type=int, default=10, help='Gerações entre buscas locais (0 = só ao final)')
+    parser.add_argument('--local_search_moves', type=int, default=50, help='Máximo de trocas (swap) por indivíduo em cada busca')
+    parser.add_argument('--init_type', type=str, default='random', choices=['random', 'greedy', 'randomized_greedy'], help='População inicial (random, greedy, randomized_greedy)')
+    parser.add_argument('--stagnation_window', type=int, default=0, help='Para após N gerações sem melhora do melhor fitness (0 = desligado)')
+    parser.add_argument('--min_improvement', type=float, default=None, help='Para se a melhora relativa na janela de estagnação ficar abaixo deste valor (ex.: 0.001)')
+    parser.add_argument('--target_gap', type=float, default=None, help='Para quando a distância relativa ao limite superior ficar abaixo deste valor (ex.: 0.01)')
+    parser.add_argument('--time_limit', type=float, default=None, help='Tempo máximo de execução em segundos')
+    parser.add_argument('--min_diversity', type=float, default=None, help='Para quando a diversidade Hamming ficar abaixo deste valor')
+    parser.add_argument('--islands', type=int, default=1, help='Número de ilhas (subpopulações em paralelo)')
+    parser.add_argument('--migration_interval', type=int, default=50, help='Gerações entre migrações no modelo de ilhas')
+    parser.add_argument('--migration_size', type=int, default=2, help='Indivíduos migrados por ilha')
+    parser.add_argument('--topology', type=str, default='ring', choices=['ring', 'random'], help='Topologia de migração (ring, random)')
+    parser.add_argument('--workers', type=int, default=None, help='Processos do modelo de ilhas (padrão: min(ilhas, núcleos))')
+    parser.add_argument('--plot', action='store_true', help='Gera os gráficos de evolução em segundo plano (método ga)')
+    parser.add_argument('--history', type=str, default=None, help='Salva o histórico da execução para gerar os gráficos depois (.npz binário ou JSON, método ga)')
+    parser.add_argument('--history_every', type=int, default=1, help='Registra o histórico a cada N gerações (tamanho da janela com --history_aggregate)')
+    parser.add_argument('--history_aggregate', type=str, default=None, choices=['mean', 'min', 'max'], help='Resume cada janela de N gerações com média, mínimo ou máximo')
+    parser.add_argument('--report', type=str, default=None, help='Salva o relatório de tempos por fase e contadores em JSON (método ga)')
+    parser.add_argument('--profile', type=str, default=None, choices=['cprofile', 'tracemalloc'], help='Inclui no relatório o perfil de funções (cprofile) ou de memória (tracemalloc)')
+    parser.add_argument('--engine', type=str, default='python', choices=['python', 'numpy'], help='Motor do algoritmo genético (python, numpy)')
+    parser.add_argument('--warm_start', type=str, nargs='+', default=None, help='Soluções anteriores (CSV salvo pelo solve) usadas para semear a população inicial (método ga)')
+    parser.add_argument('--warm_start_fraction', type=float, default=0.25, help='Fração da população inicial derivada das soluções semente')
+    parser.add_argument('--checkpoint', type=str, default=None, help='Salva o estado da execução periodicamente neste arquivo (.npz, método ga sem ilhas)')
+    parser.add_argument('--checkpoint_interval', type=float, default=300.0, help='Segundos entre checkpoints')
+    parser.add_argument('--resume', type=str, default=None, help='Retoma a execução salva no checkpoint (instância e parâmetros vêm do arquivo)')
+
+
+
+def parse_solve_options(row: dict) -> dict:
+    """Converte uma linha do manifesto em opções do solve, com os mesmos tipos e padrões"""
+    parser = argparse.ArgumentParser(prog='solve-batch', add_help=False)
+    add_solve_arguments(parser)
+
+    argv = []
+    for key, value in row.items():
+        if value is None or str(value).strip() == '':
+            continue
+        value = str(value).strip()
+        if key in ('plot', 'history', 'report', 'profile', 'checkpoint', 'checkpoint_interval', 'resume'):
+            continue    # o solve-batch não gera gráficos, relatórios nem checkpoints por tarefa
+        if key == 'warm_start':
+            argv.extend(['--warm_start', *value.split()])   # vários arquivos separados por espaço
+        elif key == 'delta_evaluation':
+            argv.append('--delta_evaluation' if value.lower() in ('1', 'true', 'yes', 'sim') else '--no-delta_evaluation')
+        else:
+            argv.extend([f'--{key}', value])
+    options = vars(parser.parse_args(argv))
+    if options['instance'] is None or options['budget'] is None:
+        parser.error("as colunas instance e budget são obrigatórias")
+    return options
+
+
+def resume_options(args) -> tuple:
+    """
+    Opções da execução salva no checkpoint (--resume). Saídas (gráficos,
+    histórico, relatório) e checkpoints seguem a linha de comando atual.
+    """
+    from src.utils.checkpoint import load_checkpoint
+    checkpoint = load_checkpoint(args.resume)
+    if not checkpoint.get('metadata'):
+        raise SystemExit(f"O checkpoint {args.resume} não guarda as opções do solve")
+
+    options = dict(checkpoint['metadata'])
+    for key in ('plot', 'history', 'report', 'profile', 'checkpoint_interval', 'log_level'):
+        options[key] = getattr(args, key)
+    options['checkpoint'] = args.checkpoint or args.resume
+    options['resume'] = args.resume
+    return argparse.Namespace(**options), checkpoint
+
+
 def setup():
     parser = create_parser()
     args = parser.parse_args()
+    if args.command == 'solve':
+        if args.resume is None and (args.instance is None or args.budget is None):
+            parser.error("solve: --instance e --budget são obrigatórios (exceto com --resume)")
+        if (args.checkpoint or args.resume) and (args.method != 'ga' or args.islands > 1):
+            parser.error("solve: checkpoint e --resume só estão disponíveis no método ga sem ilhas")
+        if args.warm_start and args.method != 'ga':
+            parser.error("solve: --warm_start só está disponível no método ga")
+    if args.command == 'sweep':
+        if args.instance is None or (args.budgets is None and args.budget_range is None):
+            parser.error("sweep: --instance e --budgets ou --budget_range são obrigatórios")
+        if args.budget is not None or args.checkpoint or args.resume:
+            parser.error("sweep: --budget, --checkpoint e --resume não se aplicam (use --budgets)")
+        if args.warm_start and args.method != 'ga':
+            parser.error("sweep: --warm_start só está disponível no método ga")
+    logging.basicConfig(level=args.log_level.upper(), format='%(message)s')
 
     if args.command == 'generate':
-        # Gera instância
-        toys_ids = Dg.generate_toys(
+        # Gera instância em colunas (vetorizado, sem objetos Toy)
+        store = Dg.generate_store(
             num_toys=args.num_toys,
             min_cost=args.min_cost,
             max_cost=args.max_cost,
             min_profit_margin=args.min_margin,
             max_profit_margin=args.max_margin,
-            seed = args.seed
+            family=args.family,
+            seed=args.seed
         )
-        Dg.save_instance(toys_ids, args.output)
+        Dg.save_store(store, args.output, chunk_size=args.chunk_size)
         print(f"Instância gerada com {args.num_toys} brinquedos em {args.output}")
 
+    elif args.command == 'convert':
+        # Converte instância para o formato binário
+        store = Dg.convert_instance(args.input, args.output)
+        print(f"Instância com {len(store)} brinquedos convertida para {args.output}")
+
+    elif args.command == 'sweep':
+        # Curva lucro x orçamento: tabela única no dp, warm start entre orçamentos no ga
+        from src.utils.sweep import budget_range, format_row, run_sweep, save_sweep
+        budgets = list(args.budgets or [])
+        if args.budget_range is not None:
+            budgets.extend(budget_range(*args.budget_range))
+        store = Dg.load_store(args.instance)
+        seeds = None
+        if args.warm_start:
+            from src.models.solution import Solution
+            seeds = [Solution.from_csv(filename, store) for filename in args.warm_start]
+        rows = run_sweep(store, budgets, vars(args), seeds, progress=lambda row: print(format_row(row)))
+        save_sweep(rows, args.output)
+        print(f"{len(rows)} orçamentos resolvidos; curva salva em {args.output}")
+
+    elif args.command == 'solve-batch':
+        # Resolve todas as tarefas do manifesto, reaproveitando instâncias carregadas
+        from src.utils.batch import read_manifest, run_batch
+        jobs = [parse_solve_options(row) for row in read_manifest(args.manifest)]
+        done = run_batch(jobs, args.output, workers=args.workers)
+        print(f"{done} tarefas resolvidas; resultados em {args.output}")
+
     elif args.command == 'solve':
-        # Resolve instância
-        toys_ids = Dg.load_instance(args.instance)
-        from src.algorithms.genetic_algorithm import GeneticAlgorithm
-        
-        ga = GeneticAlgorithm(
-            population_size=args.population,
-            generations=args.generations,
-            crossover_rate=args.crossover_rate,
-            mutation_rate=args.mutation_rate,
-            selection_type=args.selection_type,
-            crossover_type=args.crossover_type,
-            mutation_type=args.mutation_type,
-            seed=args.seed,
-            penality=args.penality
-        )
+        # Resolve instância (carregada em colunas, sem objetos Toy por linha)
+        checkpoint = None
+        if args.resume:
+            args, checkpoint = resume_options(args)
+        toys_ids = Dg.load_store(args.instance)
+        from src.algorithms.factory import create_solver
+        solver = create_solver(vars(args))
         
-        best_solution = ga.solve(toys_ids, args.budget)
+        if checkpoint is not None:
+            best_solution = solver.resume(toys_ids, checkpoint)
+        elif args.warm_start:
+            from src.models.solution import Solution
+            seeds = [Solution.from_csv(filename, toys_ids) for filename in args.warm_start]
+            best_solution = solver.solve(toys_ids, args.budget, seeds)
+        else:
+            best_solution = solver.solve(toys_ids, args.budget)
         print(best_solution)
+        if args.method == 'bnb':
+            status = "ótima" if solver.optimal else "limite de nós atingido"
+            print(f"\nNós explorados: {solver.nodes} ({status})")
+            print(solver.reduction)
 
         # salva na pasta data/solution com o mesmo nome do csv de instances
-        base = os.path.basename (args.instance)
+        base = os.path.splitext(os.path.basename(args.instance))[0] + ".csv"
         caminho = os.path.join("data", "solutions", base)
         os.makedirs(os.path.dirname(caminho), exist_ok=True)
 
-        best_solution.save_to_csv(caminho)
\ No newline at end of file
+        best_solution.save_to_csv(caminho)
+
+        if args.history and args.method == 'ga':
+            from src.utils.history import save_history
+            save_history(solver.history(), args.history)
+            print(f"Histórico salvo em {args.history}")
+
+        if (args.report or args.profile) and args.method == 'ga':
+            from src.utils.instrumentation import save_report
+            report_file = args.report or os.path.join("data", "results", "report.json")
+            save_report(solver.report(), report_file)
+            print(f"Relatório salvo em {report_file}")
+
+    elif args.command == 'benchmark':
+        # Matriz fixa de instâncias geradas com seed, cada caso em um processo novo
+        from src.utils import benchmark as bm
+        options = parse_solve_options({
+            'instance': 'benchmark', 'budget': 0, 'population': args.population,
+            'generations': args.generations, 'engine': args.engine, 'seed': args.seed,
+        })
+        options['repair'] = args.repair
+        cases = bm.benchmark_cases(args.sizes or bm.BENCHMARK_SIZES, args.budgets or bm.BENCHMARK_BUDGETS, args.seed)
+        result = bm.run_benchmark(cases, options, args.target, progress=lambda case: print(bm.format_result(case)))
+        bm.save_benchmark(result, args.output)
+        print(f"Resultados salvos em {args.output}")
+
+        if args.compare:
+            regressions = bm.compare_benchmarks(bm.load_benchmark(args.compare), result,
+                                                args.tolerance, args.gap_tolerance)
+            for regression in regressions:
+                print(f"REGRESSAO n={regression['size']} orcamento={regression['budget']}: "
+                      f"{regression['metric']} {regression['baseline']} -> {regression['current']}")
+            if regressions:
+                sys.exit(1)
+            print(f"Sem regressões em relação a {args.compare}")
+
+    elif args.command == 'plot':
+        # Gera os gráficos depois da execução, a partir do histórico salvo
+        from src.utils.history import load_history
+        from src.utils.plotter import plot_history
+        filepaths = plot_history(load_history(args.history), args.output_dir)
+        print("Gráficos gerados: " + ", ".join(filepaths))
\ No newline at end of file
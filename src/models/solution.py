@@ -1,44 +1,104 @@
+from array import array
 from typing import List
+from itertools import accumulate
+import numpy as np
 from .toy import Toy
+from .toy_store import ToyStore
 import csv
 
 class Solution:
-    """Printa a solução para o UKP"""
+    """
+    Printa a solução para o UKP.
+
+    Representação compacta: slots (sem __dict__ por indivíduo) e quantidades
+    em um array tipado array('q') — 8 bytes por gene, sem um objeto int por
+    posição, e lido pelo NumPy sem cópia. Um array recebido é usado
+    diretamente (sem cópia); listas e linhas NumPy são convertidas.
+    """
+
+    __slots__ = ('toys', 'quantities', '_total_cost', '_total_profit', '_prefix_cost', '_prefix_profit')
+
+    allocations = 0     # soluções criadas (lido pela instrumentação)
+    COST_TOLERANCE = 1e-9   # folga relativa de is_valid (erro de ponto flutuante da soma)
     
     def __init__(self, toys: List[Toy], quantities: List[int] = None):
-        self.toys = toys    # todos os tipos de brinquedos
+        Solution.allocations += 1
+        self.toys = toys    # todos os tipos de brinquedos (lista de Toy ou ToyStore)
         self._total_cost = None
         self._total_profit = None
+        self._prefix_cost = None     # somas prefixadas (usadas pelo crossover)
+        self._prefix_profit = None
 
-        if quantities:      # quantidades de cada tipo de brinquedo
+        # quantidades de cada tipo de brinquedo
+        if quantities is None or len(quantities) == 0:
+            self.quantities = array('q', bytes(8 * len(toys)))     # [0, 0, ..., 0] com len(toys) posições
+        elif isinstance(quantities, array):
             self.quantities = quantities
+        elif isinstance(quantities, np.ndarray):
+            self.quantities = array('q', np.ascontiguousarray(quantities, dtype=np.int64).tobytes())
         else:
-            self.quantities = [0] * len(toys)   # [0, 0, ..., 0] com len(toys) posições
+            self.quantities = array('q', quantities)
+
+    def quantities_array(self) -> np.ndarray:
+        """View NumPy (int64, sem cópia) das quantidades"""
+        return np.frombuffer(self.quantities, dtype=np.int64)
     
     def total_cost(self) -> float:
         """Calcula o custo total da solução"""
         if self._total_cost is None:
-            self._total_cost = 0
-            for toy, qty in zip(self.toys, self.quantities):
-                self._total_cost += toy.production_cost * qty
+            if isinstance(self.toys, ToyStore):
+                self._total_cost = float(np.dot(self.toys.costs, self.quantities_array()))
+            else:
+                self._total_cost = 0
+                for toy, qty in zip(self.toys, self.quantities):
+                    self._total_cost += toy.production_cost * qty
         return self._total_cost
     
     def total_profit(self) -> float:
         """Calcula o lucro total da solução"""
         if self._total_profit is None:
-            self._total_profit = 0
-            for toy, qty in zip(self.toys, self.quantities):
-                self._total_profit += toy.profit() * qty
+            if isinstance(self.toys, ToyStore):
+                self._total_profit = float(np.dot(self.toys.profits, self.quantities_array()))
+            else:
+                self._total_profit = 0
+                for toy, qty in zip(self.toys, self.quantities):
+                    self._total_profit += toy.unit_profit * qty
         return self._total_profit
 
+    def prefix_cost(self) -> List[float]:
+        """Custo acumulado: prefix_cost()[k] = custo dos k primeiros brinquedos"""
+        if self._prefix_cost is None:
+            if isinstance(self.toys, ToyStore):
+                self._prefix_cost = np.concatenate(([0.0], np.cumsum(self.toys.costs * self.quantities_array())))
+            else:
+                self._prefix_cost = list(accumulate(
+                    (toy.production_cost * qty for toy, qty in zip(self.toys, self.quantities)), initial=0))
+        return self._prefix_cost
+
+    def prefix_profit(self) -> List[float]:
+        """Lucro acumulado: prefix_profit()[k] = lucro dos k primeiros brinquedos"""
+        if self._prefix_profit is None:
+            if isinstance(self.toys, ToyStore):
+                self._prefix_profit = np.concatenate(([0.0], np.cumsum(self.toys.profits * self.quantities_array())))
+            else:
+                self._prefix_profit = list(accumulate(
+                    (toy.unit_profit * qty for toy, qty in zip(self.toys, self.quantities)), initial=0))
+        return self._prefix_profit
+
     def invalidate_cache(self):
         """Limpa o cache após mutação/crossover"""
         self._total_cost = None
         self._total_profit = None
+        self._prefix_cost = None
+        self._prefix_profit = None
     
     def is_valid(self, budget: float) -> bool:
-        """Verifica se a solução respeita o orçamento"""
-        return self.total_cost() <= budget
+        """
+        Verifica se a solução respeita o orçamento. A folga relativa cobre o
+        erro de arredondamento da soma dos custos: 190 x 1.28 + 5 x 1.36 dá
+        250.00000000000003, e a solução exata do dp/bnb para 250 não é inválida
+        """
+        return self.total_cost() <= budget + abs(budget) * self.COST_TOLERANCE
     
     def __repr__(self):
             lines = []
@@ -53,8 +113,9 @@ class Solution:
 
             gap = " " * 4
             # Linhas por brinquedo
-            for toy, qty in zip(self.toys, self.quantities):
+            for i, qty in enumerate(self.quantities):
                 if qty > 0:
+                    toy = self.toys[i]
                     production_cost = toy.production_cost * qty
                     profit_total = toy.profit() * qty
                     lines.append(
@@ -71,6 +132,24 @@ class Solution:
             return "\n".join(lines)
         #return f"Solution (custo = {self.total_cost():.2f}, lucro = {self.total_profit():.2f}, quantities={self.quantities})"
 
+    @classmethod
+    def from_csv(cls, filename: str, toys) -> 'Solution':
+        """
+        Lê uma solução salva por save_to_csv (colunas id e qty) sobre a
+        instância toys, casando os brinquedos pelo id: os que não existem
+        mais na instância são ignorados e os novos ficam com quantidade 0
+        """
+        ids = toys.ids.tolist() if isinstance(toys, ToyStore) else [toy.id for toy in toys]
+        index = {toy_id: i for i, toy_id in enumerate(ids)}
+        quantities = array('q', bytes(8 * len(toys)))
+
+        with open(filename, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                i = index.get(int(row["id"]))
+                if i is not None:
+                    quantities[i] = int(row["qty"])
+        return cls(toys, quantities)
+
     def save_to_csv(self, filename: str):
         """Salva os brinquedos usados na solução como CSV."""
         with open(filename, "w", newline="", encoding="utf-8") as f:
@@ -89,8 +168,9 @@ class Solution:
             ])
 
             # Linhas de dados
-            for toy, qty in zip(self.toys, self.quantities):
+            for i, qty in enumerate(self.quantities):
                 if qty > 0:
+                    toy = self.toys[i]
                     unit_profit = toy.profit()
                     total_production_cost = toy.production_cost * qty
                     total_profit = unit_profit * qty
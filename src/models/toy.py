@@ -1,15 +1,18 @@
 class Toy:
-    """Classe que representa um tipo de brinquedo"""
+    """Classe que representa um tipo de brinquedo (slots: sem __dict__ por objeto)"""
+
+    __slots__ = ('id', 'name', 'production_cost', 'sale_price', 'unit_profit')
     
     def __init__(self, id: int, name: str, production_cost: float, sale_price: float):
         self.id = id
         self.name = name
         self.production_cost = production_cost  # custo de produção
         self.sale_price = sale_price            # preço do produto na venda
+        self.unit_profit = sale_price - production_cost     # preço - custo, calculado uma vez
     
     def profit(self) -> float:
-        """Calcula o lucro do brinquedo"""
-        return self.sale_price - self.production_cost   # preço - custo
+        """Lucro unitário do brinquedo"""
+        return self.unit_profit
     
     def __repr__(self):
         """Função que define como o objeto será printado como string"""
@@ -0,0 +1,94 @@
+import numpy as np
+from typing import List
+from .toy import Toy, get_toy_by_id
+
+class ToyStore:
+    """
+    Armazenamento colunar de uma instância: ids, custos e preços em arrays
+    NumPy contíguos, sem um objeto Toy por linha e sem passar pelo
+    dicionário global de brinquedos.
+
+    Fatias (store[a:b]) são views que compartilham os arrays; a memória é
+    liberada quando a última referência ao store (ou às suas views) é
+    descartada. Indexar com um inteiro cria um Toy sob demanda.
+    """
+
+    def __init__(self, ids, costs, prices, names=None):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.costs = np.asarray(costs, dtype=np.float64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.names = names      # lista de nomes ou None (nomes padrão "Brinquedo_<id + 1>")
+        self._profits = None
+        self._bounds = None     # limites superiores (calculados uma vez por bounds.instance_bounds)
+
+        if not (len(self.ids) == len(self.costs) == len(self.prices)):
+            raise ValueError("As colunas da instancia devem ter o mesmo tamanho")
+
+    @classmethod
+    def from_toys(cls, toys: List[Toy]) -> 'ToyStore':
+        """Cria o store a partir de uma lista de objetos Toy"""
+        return cls(
+            [toy.id for toy in toys],
+            [toy.production_cost for toy in toys],
+            [toy.sale_price for toy in toys],
+            [toy.name for toy in toys],
+        )
+
+    @classmethod
+    def from_ids(cls, toy_ids: List[int]) -> 'ToyStore':
+        """Cria o store a partir de ids do dicionário global de brinquedos"""
+        return cls.from_toys([get_toy_by_id(toy_id) for toy_id in toy_ids])
+
+    @classmethod
+    def coerce(cls, toys) -> 'ToyStore':
+        """Aceita um ToyStore, uma lista de Toy ou uma lista de ids"""
+        if isinstance(toys, ToyStore):
+            return toys
+        toys = list(toys)
+        if toys and isinstance(toys[0], Toy):
+            return cls.from_toys(toys)
+        return cls.from_ids(toys)
+
+    @property
+    def profits(self) -> np.ndarray:
+        """Lucro unitário (preço - custo), calculado uma vez"""
+        if self._profits is None:
+            self._profits = self.prices - self.costs
+        return self._profits
+
+    def name(self, i: int) -> str:
+        """Nome do i-ésimo brinquedo"""
+        if self.names is not None:
+            return self.names[i]
+        return f"Brinquedo_{int(self.ids[i]) + 1}"
+
+    def toy(self, i: int) -> Toy:
+        """Objeto Toy (não registrado no dicionário global) para a linha i"""
+        return Toy(
+            id=int(self.ids[i]),
+            name=self.name(i),
+            production_cost=float(self.costs[i]),
+            sale_price=float(self.prices[i])
+        )
+
+    def take(self, indices) -> 'ToyStore':
+        """Novo store apenas com as linhas dadas (cópia)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        names = [self.names[i] for i in indices] if self.names is not None else None
+        return ToyStore(self.ids[indices], self.costs[indices], self.prices[indices], names)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            names = self.names[key] if self.names is not None else None
+            return ToyStore(self.ids[key], self.costs[key], self.prices[key], names)
+        return self.toy(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.toy(i)
+
+    def __repr__(self):
+        return f"ToyStore(brinquedos={len(self)})"
@@ -0,0 +1,82 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List
+from ..models.solution import Solution
+from .data_generator import DataGenerator
+
+RESULT_FIELDS = ['job', 'instance', 'budget', 'method', 'status',
+                 'total_profit', 'total_cost', 'valid', 'seconds', 'error']
+
+def read_manifest(filename: str) -> List[dict]:
+    """
+    Lê o manifesto do solve-batch: CSV com cabeçalho, colunas obrigatórias
+    instance e budget e, opcionalmente, qualquer parâmetro do solve
+    (method, population, generations, seed, ...). Células vazias usam o padrão.
+    """
+    with open(filename, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+
+    for line, row in enumerate(rows, start=2):
+        if not row.get('instance') or not row.get('budget'):
+            raise ValueError(f"Linha {line} do manifesto sem instance ou budget")
+    return rows
+
+@lru_cache(maxsize=16)
+def _load_instance(filename: str):
+    """Instância carregada uma única vez por processo trabalhador"""
+    return DataGenerator.load_store(filename)
+
+def _run_job(job: int, options: dict) -> dict:
+    """Resolve uma tarefa do lote (executado no processo trabalhador)"""
+    from ..algorithms.factory import create_solver
+
+    result = {
+        'job': job,
+        'instance': options['instance'],
+        'budget': options['budget'],
+        'method': options['method'],
+    }
+    start = time.perf_counter()
+    try:
+        store = _load_instance(options['instance'])
+        solver = create_solver(dict(options, plot=False))
+        if options.get('warm_start'):
+            seeds = [Solution.from_csv(filename, store) for filename in options['warm_start']]
+            solution = solver.solve(store, options['budget'], seeds)
+        else:
+            solution = solver.solve(store, options['budget'])
+
+        result.update(
+            status='ok',
+            total_profit=f"{solution.total_profit():.2f}",
+            total_cost=f"{solution.total_cost():.2f}",
+            valid=solution.is_valid(options['budget']),
+        )
+    except Exception as error:
+        result.update(status='error', error=repr(error))
+    result['seconds'] = f"{time.perf_counter() - start:.3f}"
+    return result
+
+def run_batch(jobs: List[dict], output: str, workers: int = None) -> int:
+    """
+    Distribui as tarefas entre processos trabalhadores e grava uma linha de
+    resultado por tarefa assim que ela termina. Retorna o número de tarefas.
+    """
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_job, job, options) for job, options in enumerate(jobs)]
+            for future in as_completed(futures):
+                writer.writerow(future.result())
+                f.flush()
+
+    return len(jobs)
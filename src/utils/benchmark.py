@@ -0,0 +1,196 @@
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from typing import List
+import numpy as np
+from .data_generator import DataGenerator
+
+BENCHMARK_SIZES = (10, 100, 1_000, 10_000, 100_000)
+BENCHMARK_BUDGETS = (1_000.0, 10_000.0)
+BENCHMARK_VERSION = 3
+
+# Métrica -> (maior é melhor?, tolerância absoluta em vez de relativa?)
+COMPARED_METRICS = {
+    'generations_per_second': (True, False),
+    'evaluations_per_second': (True, False),
+    'peak_rss_mb': (False, False),
+    'bytes_per_individual': (False, False),
+    'time_to_target': (False, False),
+    'gap': (False, True),
+}
+
+def benchmark_cases(sizes=BENCHMARK_SIZES, budgets=BENCHMARK_BUDGETS, seed=42) -> List[dict]:
+    """Matriz de casos: cada tamanho com sua seed de instância, combinado com cada orçamento"""
+    return [
+        {'size': size, 'budget': float(budget), 'instance_seed': seed + index}
+        for index, size in enumerate(sizes)
+        for budget in budgets
+    ]
+
+def _peak_rss_mb() -> float:
+    """Pico de memória residente do processo (ru_maxrss é KB no Linux e bytes no macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def _individual_bytes(store, solution, engine: str, samples: int = 200) -> float:
+    """
+    Memória medida por indivíduo: no motor NumPy, uma linha da matriz da
+    população; no motor Python, o total alocado (tracemalloc) por samples
+    cópias avaliadas da solução, dividido por samples
+    """
+    if engine == 'numpy':
+        return float(len(store) * np.dtype(np.int64).itemsize)
+
+    from ..models.solution import Solution
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [Solution(store, solution.quantities[:]) for _ in range(samples)]
+    for copy in copies:
+        copy.total_cost()
+        copy.total_profit()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return allocated / samples
+
+def _run_case(case: dict, options: dict, target: float) -> dict:
+    """Gera a instância e resolve um caso (em um processo novo, para medir o pico de memória)"""
+    from ..algorithms.factory import create_solver
+    from ..algorithms.bounds import upper_bound
+    from ..models.toy_store import ToyStore
+
+    toy_ids = DataGenerator.generate_toys(
+        num_toys=case['size'], min_cost=1.0, max_cost=100.0,
+        min_profit_margin=0.1, max_profit_margin=2.0, seed=case['instance_seed']
+    )
+    store = ToyStore.from_ids(toy_ids)
+    budget = case['budget']
+
+    solver = create_solver(dict(options, budget=budget, plot=False, instrument=True))
+    start = time.perf_counter()
+    solution = solver.solve(store, budget)
+    seconds = time.perf_counter() - start
+
+    report = solver.report()
+    history = solver.history()
+    bound = upper_bound(store, budget)
+    valid = bool(solution.is_valid(budget))
+    profit = float(solution.total_profit())
+
+    generations = report['counters'].get('generations', 0)
+    allocations = report['counters'].get('solutions', 0)
+
+    # Tempo até o alvo: medido na primeira geração em que o maior lucro válido atingiu target * limite
+    # (o fitness penalizado de um indivíduo inválido não conta)
+    time_to_target = None
+    reached = np.flatnonzero(np.asarray(history['best_valid_profit_history']) >= target * bound)
+    if len(reached):
+        time_to_target = float(history['seconds_history'][reached[0]])
+
+    return dict(
+        case,
+        seconds=seconds,
+        generations=generations,
+        generations_per_second=generations / seconds if seconds else None,
+        evaluations_per_second=report['counters'].get('evaluations', 0) / seconds if seconds else None,
+        peak_rss_mb=_peak_rss_mb(),
+        bytes_per_individual=_individual_bytes(store, solution, options.get('engine')),
+        allocations_per_second=allocations / seconds if seconds else None,
+        time_to_target=time_to_target,
+        upper_bound=float(bound),
+        total_profit=profit,
+        valid=valid,
+        gap=(bound - profit) / bound if valid and bound else None,
+    )
+
+def run_benchmark(cases: List[dict], options: dict, target: float = 0.95, progress=None) -> dict:
+    """
+    Executa os casos em sequência, cada um em um processo novo (spawn),
+    para que tempos e pico de memória não dependam dos casos anteriores
+    """
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for case in cases:
+            result = pool.apply(_run_case, (case, options, target))
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'target': target,
+        'options': {key: value for key, value in options.items() if key not in ('instance', 'budget')},
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+def save_benchmark(benchmark: dict, filename: str):
+    """Salva o resultado do benchmark em JSON"""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(benchmark, f, indent=2)
+
+def load_benchmark(filename: str) -> dict:
+    """Carrega um resultado salvo por save_benchmark"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def compare_benchmarks(baseline: dict, current: dict, tolerance: float = 0.10,
+                       gap_tolerance: float = 0.01) -> List[dict]:
+    """
+    Compara os casos em comum (mesmo tamanho e orçamento) e retorna as
+    regressões: vazão menor ou memória/tempo até o alvo maiores que a
+    tolerância relativa, ou gap maior que gap_tolerance (absoluto)
+    """
+    baseline_results = {(result['size'], result['budget']): result for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        reference = baseline_results.get((result['size'], result['budget']))
+        if reference is None:
+            continue
+
+        for metric, (higher_is_better, absolute) in COMPARED_METRICS.items():
+            old, new = reference.get(metric), result.get(metric)
+            if old is None:
+                continue
+            if new is None:
+                worse = True        # o alvo deixou de ser atingido / solução inválida
+            elif absolute:
+                worse = new > old + gap_tolerance
+            elif higher_is_better:
+                worse = new < old * (1 - tolerance)
+            else:
+                worse = new > old * (1 + tolerance)
+
+            if worse:
+                regressions.append({
+                    'size': result['size'], 'budget': result['budget'],
+                    'metric': metric, 'baseline': old, 'current': new,
+                })
+    return regressions
+
+def format_result(result: dict) -> str:
+    """Linha de resumo de um caso"""
+    def fmt(value, spec):
+        return '-' if value is None else format(value, spec)
+    return (f"n={result['size']:>7} orcamento={result['budget']:>10.1f} "
+            f"ger/s={fmt(result['generations_per_second'], '9.1f')} "
+            f"aval/s={fmt(result['evaluations_per_second'], '11.1f')} "
+            f"rss={fmt(result['peak_rss_mb'], '8.1f')}MB "
+            f"ind={fmt(result.get('bytes_per_individual'), '10.0f')}B "
+            f"aloc/s={fmt(result.get('allocations_per_second'), '10.1f')} "
+            f"alvo={fmt(result['time_to_target'], '7.3f')}s "
+            f"gap={fmt(result['gap'], '7.4f')}")
@@ -0,0 +1,83 @@
+"""
+Formato binário de instância (.ukpb), pensado para memory-map:
+
+    cabeçalho (64 bytes, little-endian)
+        magic       8s   b'UKPBIN\\0\\0'
+        version     I
+        flags       I    bit 0: bloco de nomes presente
+        num_toys    Q
+        names_size  Q    tamanho do bloco de nomes em bytes
+        (preenchimento até 64 bytes)
+    ids         int64[num_toys]
+    costs       float64[num_toys]
+    prices      float64[num_toys]
+    names       utf-8 separado por '\\n' (opcional)
+
+As colunas são abertas com np.memmap (sem cópia): abrir é praticamente
+instantâneo e processos diferentes compartilham as mesmas páginas.
+"""
+
+import os
+import struct
+import numpy as np
+from ..models.toy_store import ToyStore
+
+MAGIC = b'UKPBIN\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+HEADER_SIZE = 64
+FLAG_NAMES = 1
+
+def is_binary_instance(filename: str) -> bool:
+    """Verifica pelo magic se o arquivo está no formato binário"""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def _has_default_names(store: ToyStore) -> bool:
+    """Nomes podem ser omitidos quando seguem o padrão Brinquedo_<id + 1>"""
+    if store.names is None:
+        return True
+    return all(name == f"Brinquedo_{int(toy_id) + 1}" for name, toy_id in zip(store.names, store.ids))
+
+def save_binary_instance(store: ToyStore, filename: str):
+    """Salva o store no formato binário (escrita atômica)"""
+    names_block = b''
+    flags = 0
+    if not _has_default_names(store):
+        names_block = '\n'.join(store.names).encode('utf-8')
+        flags |= FLAG_NAMES
+
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'wb') as f:
+        header = HEADER.pack(MAGIC, VERSION, flags, len(store), len(names_block))
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.write(np.ascontiguousarray(store.ids, dtype='<i8'))
+        f.write(np.ascontiguousarray(store.costs, dtype='<f8'))
+        f.write(np.ascontiguousarray(store.prices, dtype='<f8'))
+        f.write(names_block)
+    os.replace(tmp_filename, filename)
+
+def load_binary_instance(filename: str) -> ToyStore:
+    """Abre a instância binária com memory-map (colunas somente leitura, sem cópia)"""
+    with open(filename, 'rb') as f:
+        magic, version, flags, num_toys, names_size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{filename} nao esta no formato binario de instancia")
+    if version != VERSION:
+        raise ValueError(f"Versao {version} do formato binario nao suportada")
+
+    if num_toys == 0:
+        return ToyStore([], [], [], None)
+
+    column_size = 8 * num_toys
+    ids = np.memmap(filename, dtype='<i8', mode='r', offset=HEADER_SIZE, shape=(num_toys,))
+    costs = np.memmap(filename, dtype='<f8', mode='r', offset=HEADER_SIZE + column_size, shape=(num_toys,))
+    prices = np.memmap(filename, dtype='<f8', mode='r', offset=HEADER_SIZE + 2 * column_size, shape=(num_toys,))
+
+    names = None
+    if flags & FLAG_NAMES:
+        with open(filename, 'rb') as f:
+            f.seek(HEADER_SIZE + 3 * column_size)
+            names = f.read(names_size).decode('utf-8').split('\n')
+
+    return ToyStore(ids, costs, prices, names)
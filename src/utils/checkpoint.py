@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+CHECKPOINT_VERSION = 3
+
+# Marcadores usados na parte JSON do arquivo
+_ARRAY = '__array__'    # referência a um array guardado em binário no .npz
+_TUPLE = '__tuple__'    # tupla (o estado do random exige tuplas ao ser restaurado)
+
+def instance_digest(store) -> str:
+    """Impressão digital da instância (custos e preços), para não retomar em outra instância"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(store.costs, dtype=np.float64))
+    digest.update(np.ascontiguousarray(store.prices, dtype=np.float64))
+    return digest.hexdigest()
+
+def save_checkpoint(state: dict, filename: str):
+    """
+    Salva o estado de uma execução em um .npz: os arrays (população,
+    histórico, cache) em binário e o restante (geradores aleatórios,
+    parâmetros) em uma entrada JSON.
+
+    A escrita é atômica: o arquivo é gravado ao lado do destino e só então
+    renomeado sobre ele (os.replace), então uma interrupção no meio da
+    escrita deixa o checkpoint anterior intacto.
+    """
+    arrays = {}
+    meta = _split(dict(state, version=CHECKPOINT_VERSION), 'state', arrays)
+    arrays['meta'] = np.array(json.dumps(meta))
+
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = filename + '.tmp'
+    try:
+        with open(temporary, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, filename)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+def load_checkpoint(filename: str) -> dict:
+    """Carrega um checkpoint salvo por save_checkpoint"""
+    with np.load(filename, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    state = _join(json.loads(str(arrays.pop('meta'))), arrays)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Versao de checkpoint nao suportada: {state.get('version')}")
+    return state
+
+def _split(value, path: str, arrays: dict):
+    """Move os arrays (em qualquer nível) para arrays e devolve o restante serializável em JSON"""
+    if isinstance(value, np.ndarray):
+        arrays[path] = value
+        return {_ARRAY: path}
+    if isinstance(value, dict):
+        return {key: _split(item, f"{path}/{key}", arrays) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return {_TUPLE: [_split(item, f"{path}/{i}", arrays) for i, item in enumerate(value)]}
+    if isinstance(value, list):
+        return [_split(item, f"{path}/{i}", arrays) for i, item in enumerate(value)]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _join(value, arrays: dict):
+    """Inverso de _split"""
+    if isinstance(value, dict):
+        if _ARRAY in value:
+            return arrays[value[_ARRAY]]
+        if _TUPLE in value:
+            return tuple(_join(item, arrays) for item in value[_TUPLE])
+        return {key: _join(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_join(item, arrays) for item in value]
+    return value
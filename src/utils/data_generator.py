@@ -1,9 +1,17 @@
+import os
 import random
+import numpy as np
+from itertools import islice
 from typing import List
 from ..models.toy import global_toys, add_toy
+from ..models.toy_store import ToyStore
+from .binary_instance import is_binary_instance, load_binary_instance, save_binary_instance
 
 class DataGenerator:    # Classe utilitária (todos os métodos estáticos)
     """Gerador de instâncias do problema UKP"""
+
+    # Famílias de dificuldade do gerador vetorizado (generate_store)
+    FAMILIES = ('margin', 'uncorrelated', 'weakly_correlated', 'strongly_correlated', 'subset_sum')
     
     @staticmethod
     def generate_toys(num_toys: int,            # tipos de brinquedos
@@ -35,6 +43,80 @@ class DataGenerator:    # Classe utilitária (todos os métodos estáticos)
         
         return generated_ids
     
+    @staticmethod
+    def generate_store(num_toys: int,
+                       min_cost: float,
+                       max_cost: float,
+                       min_profit_margin: float,
+                       max_profit_margin: float,
+                       family: str = 'margin',
+                       seed=None) -> ToyStore:
+        """
+        Gera a instância direto em colunas NumPy (sem objetos Toy nem o
+        dicionário global), com um np.random.Generator próprio. Custos são
+        uniformes em [min_cost, max_cost]; o lucro depende da família, com
+        m = margem média e R = max_cost - min_cost:
+
+        - 'margin': margem uniforme em [min_margin, max_margin] (como generate_toys)
+        - 'uncorrelated': lucro uniforme em [min_cost * min_margin, max_cost * max_margin]
+        - 'weakly_correlated': lucro = custo * m + U(-R/10, R/10) * m (no mínimo custo * min_margin)
+        - 'strongly_correlated': lucro = custo * m + R * m / 10
+        - 'subset_sum': lucro = custo * m (ROI praticamente igual em todos)
+
+        Custos e preços são arredondados para centavos, então o CSV e o
+        formato binário descrevem exatamente a mesma instância.
+        """
+        if family not in DataGenerator.FAMILIES:
+            raise ValueError(f"Familia de instancia invalida: {family}")
+        if not 0 < min_cost <= max_cost:
+            raise ValueError("Os custos devem satisfazer 0 < min_cost <= max_cost")
+
+        rng = np.random.default_rng(seed)
+        costs = np.round(rng.uniform(min_cost, max_cost, num_toys), 2)
+        np.maximum(costs, 0.01, out=costs)
+
+        margin = (min_profit_margin + max_profit_margin) / 2
+        spread = (max_cost - min_cost) * margin / 10
+        if family == 'margin':
+            profits = costs * rng.uniform(min_profit_margin, max_profit_margin, num_toys)
+        elif family == 'uncorrelated':
+            profits = rng.uniform(min_cost * min_profit_margin, max_cost * max_profit_margin, num_toys)
+        elif family == 'weakly_correlated':
+            profits = costs * margin + rng.uniform(-spread, spread, num_toys)
+            np.maximum(profits, costs * min_profit_margin, out=profits)
+        elif family == 'strongly_correlated':
+            profits = costs * margin + spread
+        else:
+            profits = costs * margin
+
+        prices = np.round(costs + profits, 2)
+        return ToyStore(np.arange(num_toys, dtype=np.int64), costs, prices)
+
+    @staticmethod
+    def save_store(store: ToyStore, filename: str, chunk_size: int = 65536):
+        """
+        Salva o store em CSV, formatando e escrevendo chunk_size linhas por
+        vez (sem objetos Toy). Arquivos .ukpb são salvos no formato binário.
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if filename.endswith('.ukpb'):
+            save_binary_instance(store, filename)
+            return
+
+        row = '{},{},{:.2f},{:.2f}\n'.format
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.write("id,name,cost,price\n")
+            for start in range(0, len(store), chunk_size):
+                stop = min(start + chunk_size, len(store))
+                ids = store.ids[start:stop].tolist()
+                if store.names is not None:
+                    names = store.names[start:stop]
+                else:
+                    names = [f"Brinquedo_{toy_id + 1}" for toy_id in ids]
+                f.write(''.join(map(row, ids, names, store.costs[start:stop].tolist(), store.prices[start:stop].tolist())))
+
     @staticmethod
     def save_instance(toys_ids: List[int], filename: str):
         """Salva uma instância em arquivo"""
@@ -58,4 +140,50 @@ class DataGenerator:    # Classe utilitária (todos os métodos estáticos)
                     sale_price=float(price_str)
                 )
                 loaded_ids.append(toy.id)  # agora adiciona o id
-        return loaded_ids
\ No newline at end of file
+        return loaded_ids
+
+    @staticmethod
+    def load_store(filename: str, chunk_size: int = 65536, keep_names: bool = True) -> ToyStore:
+        """
+        Carrega uma instância em um ToyStore colunar, lendo o CSV em blocos
+        de chunk_size linhas (sem criar objetos Toy nem usar o dicionário global).
+        Arquivos no formato binário são abertos com memory-map.
+        """
+        if is_binary_instance(filename):
+            return load_binary_instance(filename)
+
+        ids_chunks, cost_chunks, price_chunks = [], [], []
+        names = [] if keep_names else None
+
+        with open(filename, 'r') as f:
+            next(f)  # Pula cabeçalho
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                rows = [line.rstrip('\r\n').split(',') for line in lines if line.strip()]
+                if not rows:
+                    continue
+                id_strs, chunk_names, cost_strs, price_strs = zip(*rows)
+
+                ids_chunks.append(np.array(id_strs, dtype=np.int64))
+                cost_chunks.append(np.array(cost_strs, dtype=np.float64))
+                price_chunks.append(np.array(price_strs, dtype=np.float64))
+                if keep_names:
+                    names.extend(chunk_names)
+
+        if not ids_chunks:
+            return ToyStore([], [], [], names)
+        return ToyStore(
+            np.concatenate(ids_chunks),
+            np.concatenate(cost_chunks),
+            np.concatenate(price_chunks),
+            names
+        )
+
+    @staticmethod
+    def convert_instance(input_filename: str, output_filename: str) -> ToyStore:
+        """Converte uma instância CSV para o formato binário"""
+        store = DataGenerator.load_store(input_filename)
+        save_binary_instance(store, output_filename)
+        return store
@@ -0,0 +1,76 @@
+import numpy as np
+
+class DiversityMetrics:
+    """
+    Métricas de diversidade da população (Hamming e diferença total médias
+    entre pares, normalizadas por gene).
+
+    Em vez de comparar todos os pares de indivíduos (O(P²·n)), cada coluna
+    é ordenada uma vez:
+    - pares iguais no gene = soma de C(c, 2) sobre as contagens c de cada valor
+    - soma de |a - b| entre pares = soma de x_k * (2k - P + 1) na coluna ordenada
+
+    Modos:
+    - 'full': usa a população inteira
+    - 'sampled': usa uma amostra aleatória de sample_size indivíduos
+    - 'off': não calcula nada (execuções de produção)
+    O cálculo só é feito nas gerações múltiplas de interval.
+    """
+
+    MODES = ('full', 'sampled', 'off')
+
+    def __init__(self, mode='full', interval=1, sample_size=None, seed=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de diversidade invalido: {mode}")
+        if interval < 1:
+            raise ValueError("O intervalo de diversidade deve ser >= 1")
+
+        self.mode = mode
+        self.interval = interval
+        self.sample_size = sample_size
+        # Gerador próprio para não alterar a sequência aleatória do AG
+        self.rng = np.random.default_rng(seed)
+
+    def should_compute(self, generation: int) -> bool:
+        """Indica se a métrica deve ser calculada nesta geração"""
+        return self.mode != 'off' and generation % self.interval == 0
+
+    def compute(self, population: np.ndarray, generation: int):
+        """
+        Retorna (hamming, diferença total) normalizados, ou None se a
+        geração não deve ser medida
+        """
+        if not self.should_compute(generation):
+            return None
+
+        if self.mode == 'sampled' and self.sample_size and self.sample_size < len(population):
+            rows = self.rng.choice(len(population), size=self.sample_size, replace=False)
+            population = population[rows]
+
+        return pairwise_diversity(population)
+
+
+def pairwise_diversity(population: np.ndarray) -> tuple:
+    """Hamming e diferença total médias entre todos os pares, por gene"""
+    size, n_toys = population.shape
+    num_pairs = size * (size - 1) // 2
+    if num_pairs == 0 or n_toys == 0:
+        return 0.0, 0.0
+
+    columns = np.sort(population, axis=0)
+    positions = np.arange(size)[:, None]
+
+    # Pares iguais: para cada posição, quantos elementos anteriores têm o mesmo valor
+    run_start = np.ones(columns.shape, dtype=bool)
+    run_start[1:] = columns[1:] != columns[:-1]
+    first_of_run = np.maximum.accumulate(np.where(run_start, positions, 0), axis=0)
+    equal_pairs = int((positions - first_of_run).sum())
+    differences = num_pairs * n_toys - equal_pairs
+
+    # Soma das diferenças absolutas a partir das colunas ordenadas
+    weights = 2 * positions - size + 1
+    total_diff = int((columns.astype(np.int64) * weights).sum())
+
+    total_normalized_distance = differences / (n_toys * num_pairs)
+    total_diff_normalized = total_diff / (n_toys * num_pairs)
+    return total_normalized_distance, total_diff_normalized
@@ -0,0 +1,203 @@
+import json
+import multiprocessing
+import numpy as np
+
+# Métricas registradas a cada geração pelo algoritmo genético
+HISTORY_FIELDS = (
+    'best_fitness_history', 'avg_fitness_history', 'generation_history',
+    'validity_rate_history', 'hamming_distance', 'total_difference',
+    'diversity_generation_history', 'efficiency', 'best_valid_profit_history', 'seconds_history',
+)
+
+class _Series:
+    """
+    Série de métricas em arrays pré-alocados: uma coluna de gerações (int64)
+    e uma matriz de valores (float64, uma coluna por métrica). Cresce por
+    duplicação apenas se a capacidade inicial for excedida.
+    """
+
+    AGGREGATES = {'mean': np.mean, 'min': np.min, 'max': np.max}
+
+    def __init__(self, num_fields: int, every: int, aggregate: str):
+        self.num_fields = num_fields
+        self.every = every
+        self.aggregate = aggregate
+        self.reset(0)
+
+    def reset(self, capacity: int):
+        """Descarta os dados e pré-aloca espaço para capacity pontos"""
+        capacity = max(capacity, 1)
+        self.generations = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty((capacity, self.num_fields), dtype=np.float64)
+        self.size = 0
+        self._window = []           # valores pendentes da janela atual
+        self._window_start = None   # geração do início da janela
+
+    def append(self, generation: int, values: tuple):
+        """Registra os valores da geração respeitando a amostragem/agregação"""
+        if self.aggregate is None:
+            if generation % self.every == 0:
+                self._push(generation, values)
+            return
+
+        if not self._window:
+            self._window_start = generation
+        self._window.append(values)
+        if len(self._window) >= self.every:
+            self.flush()
+
+    def flush(self):
+        """Fecha a janela pendente (agregação por janela)"""
+        if self._window:
+            aggregated = self.AGGREGATES[self.aggregate](np.array(self._window, dtype=np.float64), axis=0)
+            self._push(self._window_start, aggregated)
+            self._window = []
+
+    def _push(self, generation: int, values):
+        if self.size == len(self.generations):
+            self.generations = np.resize(self.generations, 2 * self.size)
+            self.values = np.resize(self.values, (2 * self.size, self.num_fields))
+        self.generations[self.size] = generation
+        self.values[self.size] = values
+        self.size += 1
+
+    def state(self) -> dict:
+        """Dados registrados e janela pendente (para checkpoint)"""
+        return {
+            'generations': self.generations[:self.size].copy(),
+            'values': self.values[:self.size].copy(),
+            'window': np.array(self._window, dtype=np.float64).reshape(-1, self.num_fields),
+            'window_start': self._window_start,
+        }
+
+    def restore(self, state: dict, capacity: int):
+        """Restaura o estado salvo por state()"""
+        size = len(state['generations'])
+        self.reset(max(capacity, size))
+        self.generations[:size] = state['generations']
+        self.values[:size] = state['values']
+        self.size = size
+        self._window = [tuple(row) for row in state['window'].tolist()]
+        self._window_start = state['window_start']
+
+    def columns(self) -> tuple:
+        """(gerações, [coluna de cada métrica]) como views dos dados registrados"""
+        return self.generations[:self.size], [self.values[:self.size, i] for i in range(self.num_fields)]
+
+
+class HistoryRecorder:
+    """
+    Histórico de uma execução com memória limitada e arrays tipados.
+
+    - every=N: registra uma geração a cada N
+    - aggregate='mean'|'min'|'max': em vez de amostrar, resume cada janela
+      de N gerações com a média/mínimo/máximo
+    O histórico é reiniciado em cada solve (reset).
+    """
+
+    GENERATION_FIELDS = ('best_fitness_history', 'avg_fitness_history', 'validity_rate_history', 'efficiency',
+                         'best_valid_profit_history', 'seconds_history')
+    DIVERSITY_FIELDS = ('hamming_distance', 'total_difference')
+
+    def __init__(self, every: int = 1, aggregate: str = None):
+        if every < 1:
+            raise ValueError("O intervalo do historico deve ser >= 1")
+        if aggregate is not None and aggregate not in _Series.AGGREGATES:
+            raise ValueError(f"Agregacao de historico invalida: {aggregate}")
+
+        self.every = every
+        self.aggregate = aggregate
+        self._generation = _Series(len(self.GENERATION_FIELDS), every, aggregate)
+        self._diversity = _Series(len(self.DIVERSITY_FIELDS), every, aggregate)
+
+    def reset(self, capacity: int = 0):
+        """Limpa o histórico e pré-aloca espaço para capacity gerações"""
+        points = capacity // self.every + 1
+        self._generation.reset(points)
+        self._diversity.reset(points)
+
+    def record(self, generation: int, best_fitness: float, avg_fitness: float,
+               validity_rate: float, efficiency: float, best_valid_profit: float = 0.0, seconds: float = 0.0):
+        """
+        Registra as métricas da geração (best_valid_profit: maior lucro entre os
+        válidos, 0 se nenhum; seconds: tempo desde o início da execução)
+        """
+        self._generation.append(generation, (best_fitness, avg_fitness, validity_rate, efficiency,
+                                             best_valid_profit, seconds))
+
+    def record_diversity(self, generation: int, hamming_distance: float, total_difference: float):
+        """Registra as métricas de diversidade (somente nas gerações em que foram medidas)"""
+        self._diversity.append(generation, (hamming_distance, total_difference))
+
+    def flush(self):
+        """Fecha as janelas pendentes (chamado ao final da execução)"""
+        self._generation.flush()
+        self._diversity.flush()
+
+    def state(self) -> dict:
+        """Estado completo do histórico, inclusive janelas ainda não agregadas (para checkpoint)"""
+        return {'generation': self._generation.state(), 'diversity': self._diversity.state()}
+
+    def restore(self, state: dict, capacity: int = 0):
+        """Restaura o estado salvo por state(), com espaço para capacity gerações"""
+        points = capacity // self.every + 1
+        self._generation.restore(state['generation'], points)
+        self._diversity.restore(state['diversity'], points)
+
+    def to_dict(self) -> dict:
+        """Histórico como dicionário de arrays (chaves de HISTORY_FIELDS)"""
+        history = {}
+        generations, columns = self._generation.columns()
+        history['generation_history'] = generations
+        history.update(zip(self.GENERATION_FIELDS, columns))
+
+        generations, columns = self._diversity.columns()
+        history['diversity_generation_history'] = generations
+        history.update(zip(self.DIVERSITY_FIELDS, columns))
+        return history
+
+
+def save_history(history: dict, filename: str):
+    """
+    Salva o histórico de uma execução (para gerar os gráficos depois).
+    Arquivos .npz usam o formato binário do NumPy; os demais, JSON.
+    """
+    if filename.endswith('.npz'):
+        np.savez(filename, **{key: np.asarray(value) for key, value in history.items() if value is not None})
+        return
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({key: _plain(value) for key, value in history.items()}, f)
+
+def load_history(filename: str) -> dict:
+    """Carrega um histórico salvo por save_history"""
+    if filename.endswith('.npz'):
+        with np.load(filename) as data:
+            history = {key: data[key] for key in data.files}
+        if 'max_profit' in history:
+            history['max_profit'] = float(history['max_profit'])
+        return history
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def plot_in_background(history: dict, output_dir: str = "data/results") -> multiprocessing.Process:
+    """
+    Gera os gráficos em outro processo, sem bloquear o solver.
+    O matplotlib só é importado no processo filho.
+    """
+    process = multiprocessing.Process(target=_plot_history, args=(history, output_dir))
+    process.start()
+    return process
+
+def _plot_history(history: dict, output_dir: str):
+    from .plotter import plot_history
+    plot_history(history, output_dir)
+
+def _plain(value):
+    """Converte arrays/escalares NumPy em tipos serializáveis em JSON"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
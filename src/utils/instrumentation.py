@@ -0,0 +1,183 @@
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import nullcontext
+from ..models.solution import Solution
+
+_NO_PHASE = nullcontext()
+
+class _Phase:
+    """Cronômetro de uma fase (usado com with)"""
+
+    __slots__ = ('instrumentation', 'name', 'start')
+
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        stats = self.instrumentation.phases[self.name]
+        stats[0] += time.perf_counter() - self.start
+        stats[1] += 1
+
+
+class Instrumentation:
+    """
+    Instrumentação de uma execução do AG:
+    - phase(nome): tempo de parede acumulado e número de chamadas por fase
+    - count(nome, n): contadores (avaliações, indivíduos criados, ...)
+    - profile='cprofile': perfil das funções mais custosas
+    - profile='tracemalloc': pico de memória e maiores pontos de alocação
+
+    Desligada (enabled=False), phase() devolve um contexto vazio
+    compartilhado e count() não faz nada: o custo no laço é desprezível.
+    """
+
+    PROFILES = ('cprofile', 'tracemalloc')
+
+    def __init__(self, enabled=False, profile=None, top=20):
+        if profile is not None and profile not in self.PROFILES:
+            raise ValueError(f"Modo de perfil invalido: {profile}")
+
+        self.enabled = enabled or profile is not None
+        self.profile = profile
+        self.top = top              # linhas mantidas no relatório de perfil
+        self.reset()
+
+    def reset(self):
+        """Descarta as medições"""
+        self.phases = defaultdict(lambda: [0.0, 0])
+        self.counters = defaultdict(int)
+        self.seconds = 0.0
+        self.profile_report = None
+        self._start = None
+        self._allocations = None
+        self._profiler = None
+
+    def phase(self, name: str):
+        """Contexto que mede o tempo da fase name"""
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def count(self, name: str, amount: int = 1):
+        """Soma amount ao contador name"""
+        if self.enabled:
+            self.counters[name] += amount
+
+    def start(self):
+        """Início da execução: zera as medições e liga o perfil, se houver"""
+        self.reset()
+        if not self.enabled:
+            return
+        self._start = time.perf_counter()
+        self._allocations = Solution.allocations
+
+        if self.profile == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.profile == 'tracemalloc':
+            tracemalloc.start()
+
+    def stop(self):
+        """Fim da execução: fecha o tempo total e o perfil"""
+        if not self.enabled or self._start is None:
+            return
+        self.seconds += time.perf_counter() - self._start
+        self.counters['solutions'] += Solution.allocations - self._allocations
+        self._start = None
+
+        if self.profile == 'cprofile':
+            self._profiler.disable()
+            self.profile_report = self._cprofile_report(self._profiler)
+        elif self.profile == 'tracemalloc':
+            self.profile_report = self._tracemalloc_report()
+            tracemalloc.stop()
+
+    def snapshot(self) -> dict:
+        """Fases e contadores em formato transportável (para somar entre processos)"""
+        return {
+            'phases': {name: list(stats) for name, stats in self.phases.items()},
+            'counters': dict(self.counters),
+        }
+
+    def merge(self, snapshot: dict):
+        """Soma as medições de outro processo (ilhas)"""
+        for name, (seconds, calls) in snapshot['phases'].items():
+            stats = self.phases[name]
+            stats[0] += seconds
+            stats[1] += calls
+        for name, value in snapshot['counters'].items():
+            self.counters[name] += value
+
+    def report(self) -> dict:
+        """Relatório estruturado da execução"""
+        counters = dict(self.counters)
+        report = {
+            'seconds': self.seconds,
+            'phases': {
+                name: {
+                    'seconds': seconds,
+                    'calls': calls,
+                    'share': seconds / self.seconds if self.seconds else None,
+                }
+                for name, (seconds, calls) in sorted(self.phases.items(), key=lambda item: -item[1][0])
+            },
+            'counters': counters,
+        }
+        if self.seconds and 'evaluations' in counters:
+            report['evaluations_per_second'] = counters['evaluations'] / self.seconds
+        if self.seconds and 'generations' in counters:
+            report['generations_per_second'] = counters['generations'] / self.seconds
+        if self.profile_report is not None:
+            report['profile'] = self.profile_report
+        return report
+
+    def _cprofile_report(self, profiler: cProfile.Profile) -> dict:
+        stats = pstats.Stats(profiler)
+        functions = []
+        for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():
+            functions.append({
+                'function': f"{os.path.basename(filename)}:{line}({name})",
+                'calls': calls,
+                'total_seconds': total,
+                'cumulative_seconds': cumulative,
+            })
+        functions.sort(key=lambda function: -function['total_seconds'])
+        return {'mode': 'cprofile', 'functions': functions[:self.top]}
+
+    def _tracemalloc_report(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics('lineno')
+        return {
+            'mode': 'tracemalloc',
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'allocations': [
+                {'location': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                for stat in statistics[:self.top]
+            ],
+        }
+
+    def __repr__(self):
+        phases = ", ".join(
+            f"{name}={seconds:.3f}s"
+            for name, (seconds, _) in sorted(self.phases.items(), key=lambda item: -item[1][0])
+        )
+        return f"Instrumentacao(total={self.seconds:.3f}s, {phases})"
+
+
+def save_report(report: dict, filename: str):
+    """Salva o relatório de instrumentação em JSON"""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
@@ -29,11 +29,14 @@ def plot_evolution(best_fitness_history, avg_fitness_history,
                    total_difference_history=None,
                    max_profit=None,
                    efficiency_history=None,
-                   output_dir="data/results"):
+                   output_dir="data/results",
+                   diversity_generation_history=None):
     """
     Gera múltiplos gráficos de evolução do algoritmo genético.
     
     max_profit: Limite superior teórico de lucro (não deve aparecer no gráfico 1)
+    diversity_generation_history: Gerações em que a diversidade foi medida
+        (quando medida só a cada N gerações ou desligada)
     """
     
     timestamp = time.strftime("%Y%m%d_%H%M%S")
@@ -87,7 +90,10 @@ def plot_evolution(best_fitness_history, avg_fitness_history,
         plt.figure(figsize=(10, 6))
         
         hamming_array = np.array(hamming_distance_history)
-        generations_array = np.array(generation_history[:len(hamming_distance_history)])
+        if diversity_generation_history is not None:
+            generations_array = np.array(diversity_generation_history)
+        else:
+            generations_array = np.array(generation_history[:len(hamming_distance_history)])
         
         plt.plot(generations_array, hamming_array, 'm-', linewidth=2, 
                  label='Diversidade Hamming', alpha=0.8)
@@ -110,7 +116,10 @@ def plot_evolution(best_fitness_history, avg_fitness_history,
         plt.figure(figsize=(10, 6))
         
         diff_array = np.array(total_difference_history)
-        generations_array = np.array(generation_history[:len(total_difference_history)])
+        if diversity_generation_history is not None:
+            generations_array = np.array(diversity_generation_history)
+        else:
+            generations_array = np.array(generation_history[:len(total_difference_history)])
         
         plt.plot(generations_array, diff_array, 'c-', linewidth=2, 
                  label='Diferença Total Média', alpha=0.8)
@@ -158,4 +167,19 @@ def plot_evolution(best_fitness_history, avg_fitness_history,
         plt.close()
         filepaths.append(efficiency_filepath)
     
-    return filepaths
\ No newline at end of file
+    return filepaths
+
+def plot_history(history: dict, output_dir="data/results"):
+    """Gera os gráficos a partir de um histórico salvo (dicionário de métricas)"""
+    return plot_evolution(
+        history['best_fitness_history'],
+        history['avg_fitness_history'],
+        history['validity_rate_history'],
+        history['generation_history'],
+        history.get('hamming_distance'),
+        history.get('total_difference'),
+        history.get('max_profit'),
+        history.get('efficiency'),
+        output_dir=output_dir,
+        diversity_generation_history=history.get('diversity_generation_history')
+    )
\ No newline at end of file
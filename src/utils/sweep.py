@@ -0,0 +1,92 @@
+import csv
+import os
+import time
+from typing import List
+import numpy as np
+
+SWEEP_FIELDS = ['budget', 'total_profit', 'total_cost', 'valid', 'upper_bound', 'gap', 'seconds']
+
+def budget_range(start: float, stop: float, step: float) -> List[float]:
+    """Orçamentos de start a stop (inclusive) com passo step"""
+    if step <= 0:
+        raise ValueError("O passo da faixa de orcamentos deve ser positivo")
+    return [round(float(budget), 6) for budget in np.arange(start, stop + step / 2, step)]
+
+def run_sweep(store, budgets: List[float], options: dict, seeds=None, progress=None) -> List[dict]:
+    """
+    Resolve a mesma instância para vários orçamentos (em ordem crescente) e
+    retorna uma linha por orçamento com lucro, custo e gap em relação ao
+    limite superior (bounds.upper_bound):
+
+    - dp: uma única tabela até o maior orçamento, reconstruída para cada um
+    - ga: cada orçamento parte dos melhores indivíduos do anterior (warm
+      start, warm_start_fraction da população); seeds semeia o primeiro
+    - bnb: cada orçamento é resolvido do zero
+    """
+    from ..algorithms.factory import create_solver
+    from ..algorithms.bounds import upper_bound
+
+    budgets = sorted(set(float(budget) for budget in budgets))
+    method = options.get('method', 'ga')
+    solver = create_solver(dict(options, plot=False, checkpoint=None))
+
+    if method == 'dp':
+        start = time.perf_counter()
+        solutions = solver.solve_budgets(store, budgets)
+        seconds = (time.perf_counter() - start) / len(budgets)     # tabela compartilhada: tempo médio
+        solved = [(solution, seconds) for solution in solutions]
+    else:
+        solved = []
+        warm_count = max(1, round(options.get('warm_start_fraction', 0.25) * options.get('population', 1)))
+        for budget in budgets:
+            start = time.perf_counter()
+            if method == 'ga' and seeds:
+                solution = solver.solve(store, budget, seeds)
+            else:
+                solution = solver.solve(store, budget)
+            solved.append((solution, time.perf_counter() - start))
+            if method == 'ga':
+                seeds = solver.final_population(warm_count)
+
+    rows = []
+    for budget, (solution, seconds) in zip(budgets, solved):
+        bound = upper_bound(store, budget)
+        valid = bool(solution.is_valid(budget))
+        profit = float(solution.total_profit())
+        row = {
+            'budget': budget,
+            'total_profit': profit,
+            'total_cost': float(solution.total_cost()),
+            'valid': valid,
+            'upper_bound': float(bound),
+            'gap': (bound - profit) / bound if valid and bound else None,
+            'seconds': seconds,
+        }
+        rows.append(row)
+        if progress is not None:
+            progress(row)
+    return rows
+
+def save_sweep(rows: List[dict], filename: str):
+    """Salva a curva lucro x orçamento em CSV"""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SWEEP_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(dict(
+                row,
+                total_profit=f"{row['total_profit']:.2f}",
+                total_cost=f"{row['total_cost']:.2f}",
+                upper_bound=f"{row['upper_bound']:.2f}",
+                gap='' if row['gap'] is None else f"{row['gap']:.6f}",
+                seconds=f"{row['seconds']:.3f}",
+            ))
+
+def format_row(row: dict) -> str:
+    """Linha de resumo de um orçamento"""
+    gap = '-' if row['gap'] is None else f"{row['gap']:7.4f}"
+    return (f"orcamento={row['budget']:>12.2f} lucro={row['total_profit']:>12.2f} "
+            f"custo={row['total_cost']:>12.2f} gap={gap} tempo={row['seconds']:.3f}s")
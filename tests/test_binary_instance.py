@@ -0,0 +1,35 @@
+import os
+import numpy as np
+from src.models.toy_store import ToyStore
+from src.utils.binary_instance import is_binary_instance, save_binary_instance
+from src.utils.data_generator import DataGenerator
+
+INSTANCE = os.path.join(os.path.dirname(__file__), '..', 'data', 'instances', 'instance_test.csv')
+
+def assert_same_store(loaded, store):
+    np.testing.assert_array_equal(loaded.ids, store.ids)
+    np.testing.assert_array_equal(loaded.costs, store.costs)
+    np.testing.assert_array_equal(loaded.prices, store.prices)
+    assert [loaded.name(i) for i in range(len(loaded))] == [store.name(i) for i in range(len(store))]
+
+def test_csv_instance_round_trip(tmp_path):
+    store = DataGenerator.load_store(INSTANCE)
+    filename = str(tmp_path / 'instance.ukpb')
+    save_binary_instance(store, filename)
+
+    assert is_binary_instance(filename)
+    assert_same_store(DataGenerator.load_store(filename), store)
+
+def test_custom_names_and_full_precision_round_trip(tmp_path):
+    rng = np.random.default_rng(3)
+    costs = rng.uniform(1.0, 100.0, 50)
+    store = ToyStore(np.arange(50) * 7, costs, costs * rng.uniform(1.1, 3.0, 50),
+                     [f"Peça {i} ç" for i in range(50)])
+    filename = str(tmp_path / 'named.ukpb')
+    save_binary_instance(store, filename)
+    assert_same_store(DataGenerator.load_store(filename), store)
+
+def test_empty_instance_round_trip(tmp_path):
+    filename = str(tmp_path / 'empty.ukpb')
+    save_binary_instance(ToyStore([], [], []), filename)
+    assert len(DataGenerator.load_store(filename)) == 0
@@ -0,0 +1,27 @@
+import itertools
+import numpy as np
+import pytest
+from src.algorithms.bounds import UKPBounds, instance_bounds, upper_bound
+from src.algorithms.dynamic_programming import DynamicProgrammingSolver
+from src.utils.data_generator import DataGenerator
+
+@pytest.mark.parametrize('family', DataGenerator.FAMILIES)
+def test_bounds_never_fall_below_the_optimum(family):
+    for seed, size in itertools.product(range(4), (3, 20, 150)):
+        store = DataGenerator.generate_store(size, 1.0, 60.0, 0.1, 2.0, family=family, seed=seed)
+        bounds = instance_bounds(store)
+        for budget in (0.5, 17.3, 250.0, 999.99):
+            optimum = DynamicProgrammingSolver().solve(store, budget).total_profit()
+            best = bounds.best(budget)
+            assert best >= optimum - 1e-6
+            assert best <= bounds.rounded(budget) + 1e-9 <= bounds.continuous(budget) + 2e-9
+
+def test_bounds_are_cached_on_the_store():
+    store = DataGenerator.generate_store(50, 1.0, 10.0, 0.1, 2.0, seed=1)
+    assert instance_bounds(store) is instance_bounds(store)
+    assert upper_bound(store, 100.0) == instance_bounds(store).best(100.0)
+
+def test_single_profitable_toy_bound_is_exact():
+    bounds = UKPBounds(np.array([3.0, 5.0]), np.array([2.0, -1.0]))
+    assert bounds.best(10.0) == pytest.approx(6.0)      # 3 unidades de custo 3
+    assert bounds.best(0.0) == 0.0
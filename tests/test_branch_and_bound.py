@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from src.algorithms.branch_and_bound import BranchAndBoundSolver
+from src.algorithms.dynamic_programming import DynamicProgrammingSolver
+from src.models.toy_store import ToyStore
+
+def make_store(items):
+    """ToyStore a partir de pares (custo, lucro)"""
+    costs = [cost for cost, _ in items]
+    prices = [round(cost + profit, 2) for cost, profit in items]
+    return ToyStore(range(len(items)), costs, prices)
+
+# Ótimos que gastam o orçamento exatamente (perdidos com o orçamento restante em ponto flutuante)
+EXACT_FIT = [
+    ([(31.03, 53.49), (98.53, 167.74), (22.77, 33.57)], 144.07, 234.88),
+    ([(4.58, 4.96), (3.08, 3.38)], 240.0, 262.98),
+]
+
+@pytest.mark.parametrize('items, budget, optimum', EXACT_FIT)
+def test_exact_fit_matches_dynamic_programming(items, budget, optimum):
+    store = make_store(items)
+    bnb = BranchAndBoundSolver().solve(store, budget)
+    dp = DynamicProgrammingSolver().solve(store, budget)
+
+    assert bnb.total_profit() == pytest.approx(optimum)
+    assert bnb.total_profit() == pytest.approx(dp.total_profit())
+    assert bnb.total_cost() <= budget + 1e-9
+
+def test_random_instances_match_dynamic_programming():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        size = int(rng.integers(1, 6))
+        costs = np.round(rng.uniform(1.0, 100.0, size), 2)
+        profits = np.round(costs * rng.uniform(0.1, 2.0, size), 2)
+        store = make_store(list(zip(costs.tolist(), profits.tolist())))
+        budget = round(float(rng.uniform(10.0, 300.0)), 2)
+
+        bnb = BranchAndBoundSolver().solve(store, budget)
+        dp = DynamicProgrammingSolver().solve(store, budget)
+        assert bnb.total_profit() == pytest.approx(dp.total_profit())
+
+def test_costs_off_the_scale_stay_within_budget():
+    # 1.004 arredondado para 1.00 caberia 100 vezes em 100 (custo real 100.4)
+    store = ToyStore([0, 1], [1.004, 7.0], [2.004, 8.0])
+    for solver in (BranchAndBoundSolver(), DynamicProgrammingSolver()):
+        assert solver.solve(store, 100.0).is_valid(100.0)
+
+    rng = np.random.default_rng(11)
+    for _ in range(40):
+        costs = rng.uniform(1.0, 100.0, 20)     # precisão completa, como generate_toys
+        store = ToyStore(range(20), costs, costs * (1 + rng.uniform(0.1, 2.0, 20)))
+        budget = float(rng.uniform(50.0, 500.0))
+        for solver in (BranchAndBoundSolver(), DynamicProgrammingSolver()):
+            assert solver.solve(store, budget).is_valid(budget)
+
+def test_budget_spent_exactly_is_valid_despite_float_sum():
+    # 190 x 1.28 + 5 x 1.36 = 250.00000000000003 em ponto flutuante
+    store = ToyStore([0, 1], [1.28, 1.36], [7.77, 7.93])
+    for solver in (BranchAndBoundSolver(), DynamicProgrammingSolver()):
+        solution = solver.solve(store, 250.0)
+        assert solution.total_cost() == pytest.approx(250.0)
+        assert solution.is_valid(250.0)
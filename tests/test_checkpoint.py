@@ -0,0 +1,60 @@
+import os
+import random
+import shutil
+import numpy as np
+import pytest
+import src.algorithms.genetic_algorithm as genetic_algorithm
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.numpy_genetic_algorithm import NumpyGeneticAlgorithm
+from src.utils.checkpoint import load_checkpoint, save_checkpoint
+from src.utils.data_generator import DataGenerator
+
+INSTANCE = os.path.join(os.path.dirname(__file__), '..', 'data', 'instances', 'instance_test.csv')
+BUDGET = 5000.0
+
+# Tempos medidos não se repetem entre execuções
+TIMED_FIELDS = ('max_profit', 'seconds_history')
+
+@pytest.mark.parametrize('engine, params', [
+    (GeneticAlgorithm, {}),
+    (GeneticAlgorithm, {'repair': True, 'local_search': True, 'delta_evaluation': False, 'fitness_cache_size': 1000}),
+    (GeneticAlgorithm, {'replacement': 'steady_state', 'reduce': True, 'history_every': 3, 'history_aggregate': 'max'}),
+    (NumpyGeneticAlgorithm, {'elites': 2, 'stagnation_window': 50}),
+])
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch, engine, params):
+    store = DataGenerator.load_store(INSTANCE)
+    params = dict(population_size=20, generations=30, seed=3, **params)
+
+    reference = engine(**params)
+    expected = reference.solve(store, BUDGET)
+    expected_history = reference.history()
+
+    # Guarda uma cópia do checkpoint de cada geração
+    saved = {}
+    def keep_copy(state, filename):
+        save_checkpoint(state, filename)
+        saved[state['generation']] = str(tmp_path / f"g{state['generation']}.npz")
+        shutil.copy(filename, saved[state['generation']])
+    monkeypatch.setattr(genetic_algorithm, 'save_checkpoint', keep_copy)
+    engine(checkpoint=str(tmp_path / 'run.npz'), checkpoint_interval=0, **params).solve(store, BUDGET)
+    monkeypatch.undo()
+
+    generation = sorted(saved)[len(saved) // 2]
+    random.seed(999)    # a retomada não depende dos geradores globais
+    resumed = engine(checkpoint=str(tmp_path / 'resumed.npz'), **params)
+    solution = resumed.resume(store, load_checkpoint(saved[generation]))
+    history = resumed.history()
+
+    assert 0 < generation < params['generations']
+    assert list(solution.quantities) == list(expected.quantities)
+    for key in expected_history:
+        if key not in TIMED_FIELDS:
+            np.testing.assert_array_equal(np.asarray(history[key]), np.asarray(expected_history[key]), err_msg=key)
+
+def test_resume_rejects_different_parameters(tmp_path):
+    store = DataGenerator.load_store(INSTANCE)
+    filename = str(tmp_path / 'run.npz')
+    GeneticAlgorithm(population_size=10, generations=5, seed=1, checkpoint=filename, checkpoint_interval=0).solve(store, BUDGET)
+
+    with pytest.raises(ValueError, match='Parametros diferentes'):
+        GeneticAlgorithm(population_size=12, generations=5, seed=1).resume(store, load_checkpoint(filename))
@@ -0,0 +1,38 @@
+import os
+import numpy as np
+import pytest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.models.solution import Solution
+from src.utils.data_generator import DataGenerator
+
+INSTANCE = os.path.join(os.path.dirname(__file__), '..', 'data', 'instances', 'instance_test.csv')
+
+class RecordingGA(GeneticAlgorithm):
+    """Guarda os totais que chegam à avaliação e os totais recalculados do zero"""
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.pairs = []
+
+    def _evaluate(self, population):
+        for solution in population:
+            if solution._total_cost is not None:
+                fresh = Solution(self.toys, solution.quantities)
+                self.pairs.append(((solution._total_cost, solution._total_profit),
+                                   (fresh.total_cost(), fresh.total_profit())))
+        return super()._evaluate(population)
+
+@pytest.mark.parametrize('crossover_type, mutation_type, repair', [
+    ('single_point', 'uniform', False),
+    ('two_point', 'gaussian', False),
+    ('single_point', 'adaptative', True),
+])
+def test_incremental_totals_match_full_recompute(crossover_type, mutation_type, repair):
+    store = DataGenerator.load_store(INSTANCE)
+    ga = RecordingGA(population_size=20, generations=15, seed=5, crossover_type=crossover_type,
+                     mutation_type=mutation_type, repair=repair, delta_evaluation=True)
+    ga.solve(store, 2000.0)
+
+    assert ga.pairs
+    incremental, fresh = np.array([pair[0] for pair in ga.pairs]), np.array([pair[1] for pair in ga.pairs])
+    np.testing.assert_allclose(incremental, fresh, rtol=1e-9, atol=1e-6)
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from src.utils.diversity import pairwise_diversity
+
+def pairwise_loop(population):
+    """Referência O(P²·n): Hamming e diferença total médias por par e por gene"""
+    size, n_toys = population.shape
+    hamming = difference = 0
+    for i in range(size):
+        for j in range(i + 1, size):
+            hamming += np.count_nonzero(population[i] != population[j])
+            difference += np.abs(population[i] - population[j]).sum()
+    pairs = size * (size - 1) // 2
+    return hamming / (n_toys * pairs), difference / (n_toys * pairs)
+
+@pytest.mark.parametrize('size, n_toys, high', [(2, 1, 2), (7, 5, 3), (30, 12, 10), (25, 40, 1)])
+def test_matches_pairwise_loop(size, n_toys, high):
+    population = np.random.default_rng(size).integers(0, high, (size, n_toys))
+    assert pairwise_diversity(population) == pytest.approx(pairwise_loop(population))
+
+def test_identical_population_has_no_diversity():
+    assert pairwise_diversity(np.full((5, 4), 3)) == (0.0, 0.0)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from src.algorithms.dynamic_programming import DynamicProgrammingSolver
+from src.algorithms.reduction import DominanceReduction
+from src.models.toy_store import ToyStore
+from src.utils.data_generator import DataGenerator
+
+FAMILIES = DataGenerator.FAMILIES
+
+@pytest.mark.parametrize('family', FAMILIES)
+@pytest.mark.parametrize('checks', [64, 0])
+def test_reduce_then_expand_keeps_the_optimum(family, checks):
+    store = DataGenerator.generate_store(200, 1.0, 50.0, 0.1, 2.0, family=family, seed=9)
+    reduction = DominanceReduction(store, checks)
+    assert len(reduction.kept) <= len(store)
+
+    for budget in (37.5, 250.0, 1234.56):
+        full = DynamicProgrammingSolver().solve(store, budget)
+        reduced = DynamicProgrammingSolver().solve(reduction.store, budget)
+        expanded = reduction.expand(reduced)
+
+        assert len(expanded.quantities) == len(store)
+        assert expanded.is_valid(budget)
+        assert expanded.total_profit() == pytest.approx(full.total_profit())
+        assert expanded.total_profit() == pytest.approx(reduced.total_profit())
+
+def test_unprofitable_and_dominated_toys_are_removed():
+    # 2: sem lucro; 1: dominado por 0 (mais caro, lucra menos); 3: dominado por 2 unidades de 0
+    store = ToyStore(range(5), [2.0, 3.0, 1.0, 4.0, 5.0], [5.0, 5.5, 0.5, 9.0, 20.0])
+    reduction = DominanceReduction(store, multiple_checks=0)
+    assert reduction.kept.tolist() == [0, 4]
+    assert (reduction.unprofitable, reduction.simple, reduction.multiple) == (1, 1, 1)
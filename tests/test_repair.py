@@ -0,0 +1,44 @@
+import os
+import numpy as np
+import pytest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.numpy_genetic_algorithm import NumpyGeneticAlgorithm
+from src.models.solution import Solution
+from src.models.toy_store import ToyStore
+from src.utils.data_generator import DataGenerator
+
+INSTANCE = os.path.join(os.path.dirname(__file__), '..', 'data', 'instances', 'instance_test.csv')
+
+def random_genomes(store, count, seed):
+    """Genomas aleatórios, a maioria bem acima do orçamento"""
+    return np.random.default_rng(seed).integers(0, 40, (count, len(store)))
+
+@pytest.mark.parametrize('budget', [1.0, 97.31, 1000.0, 5000.0])
+def test_python_repair_is_always_valid(budget):
+    store = DataGenerator.load_store(INSTANCE)
+    ga = GeneticAlgorithm(seed=1, repair=True)
+    ga._start(store, budget)
+    for genome in random_genomes(store, 50, int(budget)):
+        repaired = ga._repair(Solution(ga.toys, genome))
+        assert Solution(ga.toys, repaired.quantities).is_valid(budget)
+
+@pytest.mark.parametrize('budget', [1.0, 97.31, 1000.0, 5000.0])
+def test_numpy_repair_is_always_valid(budget):
+    store = DataGenerator.load_store(INSTANCE)
+    ga = NumpyGeneticAlgorithm(seed=1, repair=True)
+    ga._start(store, budget)
+    population = ga._repair(random_genomes(store, 50, int(budget)))
+    assert np.all(population @ store.costs <= budget)
+
+@pytest.mark.parametrize('engine', [GeneticAlgorithm, NumpyGeneticAlgorithm])
+@pytest.mark.parametrize('init_type', ['random', 'greedy', 'randomized_greedy'])
+def test_repaired_runs_return_valid_populations(engine, init_type):
+    rng = np.random.default_rng(4)
+    costs = rng.uniform(1.0, 100.0, 60)      # precisão completa: custos fora dos centavos
+    store = ToyStore(range(60), costs, costs * rng.uniform(1.1, 3.0, 60))
+    ga = engine(population_size=20, generations=10, seed=2, repair=True, init_type=init_type)
+    best = ga.solve(store, 777.77)
+
+    assert best.is_valid(777.77)
+    for genome in ga.final_population():
+        assert Solution(store, genome).is_valid(777.77)